@@ -0,0 +1,118 @@
+import logging
+import os
+import secrets
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+import jwt
+from fastapi import Depends, HTTPException
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from . import schemas
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Autenticação por token assinado (JWT)
+# ============================================================
+#
+# O login devolve um JWT cujas claims trazem id, nome, email e perfil do
+# usuário. As rotas autenticadas validam apenas a assinatura e a expiração:
+# nenhuma consulta a usuarios por requisição.
+#
+# Configuração (.env):
+#   JWT_KEYS             "kid1:segredo1,kid2:segredo2" — a primeira chave assina os
+#                        tokens novos; as demais só validam (rotação: adicione a
+#                        nova no início e remova a antiga depois que os tokens
+#                        emitidos com ela expirarem)
+#   JWT_SECRET           atalho para uma única chave (kid "default")
+#   JWT_ALGORITHM        padrão HS256
+#   JWT_EXPIRES_MINUTES  padrão 60
+#
+# Sem chave configurada é gerado um segredo aleatório por processo: os tokens
+# deixam de valer a cada reinício e não são aceitos por outros workers.
+
+JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
+JWT_EXPIRES_MINUTES = int(os.getenv("JWT_EXPIRES_MINUTES", "60"))
+
+PERFIL_ADMIN = "admin"
+PERFIL_USUARIO = "usuario"
+
+
+def load_keys():
+    """[(kid, segredo)], a primeira é a chave de assinatura"""
+    chaves = []
+    for item in os.getenv("JWT_KEYS", "").split(","):
+        kid, _, segredo = item.strip().partition(":")
+        if kid and segredo:
+            chaves.append((kid, segredo))
+    if not chaves and os.getenv("JWT_SECRET"):
+        chaves.append(("default", os.getenv("JWT_SECRET")))
+    if not chaves:
+        if not os.getenv("TEST_MODE"):
+            logger.warning("JWT_KEYS/JWT_SECRET não configurados: usando segredo aleatório deste processo")
+        chaves.append(("efemera", secrets.token_urlsafe(32)))
+    return chaves
+
+
+KEYS = load_keys()
+
+
+def create_access_token(user, expires_minutes: int = None) -> str:
+    kid, segredo = KEYS[0]
+    agora = datetime.now(timezone.utc)
+    claims = {
+        "sub": str(user.id),
+        "id": user.id,
+        "nome": user.nome,
+        "email": user.email,
+        "perfil": user.perfil,
+        "iat": agora,
+        "exp": agora + timedelta(minutes=expires_minutes or JWT_EXPIRES_MINUTES),
+    }
+    return jwt.encode(claims, segredo, algorithm=JWT_ALGORITHM, headers={"kid": kid})
+
+
+def decode_access_token(token: str) -> schemas.TokenUser:
+    """Valida assinatura e expiração; 401 em qualquer falha"""
+    try:
+        kid = jwt.get_unverified_header(token).get("kid")
+        chaves = dict(KEYS)
+        segredo = chaves.get(kid) if kid else KEYS[0][1]
+        if segredo is None:
+            raise HTTPException(status_code=401, detail="Token inválido")
+        claims = jwt.decode(
+            token, segredo, algorithms=[JWT_ALGORITHM],
+            options={"require": ["exp", "sub"]},
+        )
+        return schemas.TokenUser(**claims)
+    except jwt.ExpiredSignatureError:
+        raise HTTPException(status_code=401, detail="Token expirado", headers={"WWW-Authenticate": "Bearer"})
+    except (jwt.InvalidTokenError, ValueError):
+        raise HTTPException(status_code=401, detail="Token inválido", headers={"WWW-Authenticate": "Bearer"})
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(_bearer)) -> schemas.TokenUser:
+    """Dependência: usuário do token Bearer, sem consultar o banco"""
+    if credentials is None:
+        raise HTTPException(status_code=401, detail="Token não fornecido", headers={"WWW-Authenticate": "Bearer"})
+    return decode_access_token(credentials.credentials)
+
+
+async def get_optional_user(
+    credentials: HTTPAuthorizationCredentials = Depends(_bearer),
+) -> Optional[schemas.TokenUser]:
+    """Dependência: usuário do token Bearer, ou None se a requisição for anônima"""
+    if credentials is None:
+        return None
+    return decode_access_token(credentials.credentials)
+
+
+async def require_admin(user: schemas.TokenUser = Depends(get_current_user)) -> schemas.TokenUser:
+    """Dependência para rotas restritas a administradores"""
+    if user.perfil != PERFIL_ADMIN:
+        raise HTTPException(status_code=403, detail="Acesso restrito a administradores")
+    return user
@@ -0,0 +1,398 @@
+import codecs
+import os
+import re
+
+import bibtexparser
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, insert, or_, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+from .keywords import link_article_keywords
+from .models import gerar_slug_generico
+from .pdf_storage import pdf_url
+
+# ============================================================
+# Importação de BibTeX em fluxo
+# ============================================================
+#
+# O arquivo é lido em blocos e cada entrada (@tipo{...}) é separada assim
+# que suas chaves fecham, então a memória usada depende do tamanho de uma
+# entrada e do lote, nunca do arquivo inteiro. As entradas são gravadas em
+# lotes de tamanho fixo, cada lote em sua própria transação.
+
+CHUNK_SIZE = 64 * 1024
+IMPORT_BATCH_SIZE = int(os.getenv("BIBTEX_BATCH_SIZE", "200"))
+PREVIEW_LIMIT = 200
+
+# Blocos que não descrevem publicações
+IGNORED_ENTRY_TYPES = {"comment", "preamble", "string"}
+
+_ENTRY_OPEN = re.compile(r"[{(]")
+
+
+def iter_bibtex_entries(fileobj, chunk_size: int = CHUNK_SIZE):
+    """
+    Lê um arquivo BibTeX (binário) em blocos e produz o texto de cada entrada
+    completa. Texto fora de entradas (comentários soltos) é descartado.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    buffer = ""
+    start = None   # índice do '@' da entrada atual no buffer
+    scan = 0       # até onde o buffer já foi examinado
+    depth = 0
+    closer = None  # '}' ou ')', dependendo de como a entrada abriu
+
+    while True:
+        chunk = fileobj.read(chunk_size)
+        buffer += decoder.decode(chunk or b"", final=not chunk)
+
+        while True:
+            if start is None:
+                at = buffer.find("@", scan)
+                if at == -1:
+                    buffer, scan = "", 0
+                    break
+                start, scan, depth, closer = at, at + 1, 0, None
+
+            if closer is None:
+                match = _ENTRY_OPEN.search(buffer, scan)
+                if not match:
+                    scan = len(buffer)
+                    break
+                closer = "}" if match.group() == "{" else ")"
+                scan = match.end()
+                depth = 1
+
+            while scan < len(buffer) and depth:
+                char = buffer[scan]
+                if char == "{" or (closer == ")" and char == "("):
+                    depth += 1
+                elif char == "}" or (closer == ")" and char == ")"):
+                    depth -= 1
+                scan += 1
+
+            if depth:
+                break
+
+            yield buffer[start:scan]
+            buffer, scan, start = buffer[scan:], 0, None
+
+        if not chunk:
+            return
+
+
+def split_author_name(nome_completo: str):
+    """Separa 'Nome Sobrenome' ou 'Sobrenome, Nome' em (nome, sobrenome)"""
+    nome_completo = " ".join(nome_completo.replace("{", "").replace("}", "").split())
+    if "," in nome_completo:
+        sobrenome, _, nome = nome_completo.partition(",")
+        return nome.strip(), sobrenome.strip()
+    partes = nome_completo.rsplit(" ", 1)
+    if len(partes) == 1:
+        return partes[0], ""
+    return partes[0], partes[1]
+
+
+def _clean(value):
+    if value is None:
+        return None
+    value = " ".join(value.replace("{", "").replace("}", "").split())
+    return value or None
+
+
+def parse_entry(texto: str):
+    """
+    Converte o texto de uma entrada BibTeX no dicionário usado pela importação.
+    Retorna None para blocos que não são publicações (@comment, @string...).
+    Levanta ValueError se a entrada não puder ser interpretada.
+    """
+    library = bibtexparser.parse_string(texto)
+    if not library.entries:
+        tipo = texto[1:texto.find("{")].strip().lower() if "{" in texto else ""
+        if tipo in IGNORED_ENTRY_TYPES or not library.failed_blocks:
+            return None
+        raise ValueError("Entrada BibTeX malformada")
+
+    entry = library.entries[0]
+    campos = {key.lower(): field.value for key, field in entry.fields_dict.items()}
+
+    ano = _clean(campos.get("year"))
+    autores = [
+        split_author_name(nome)
+        for nome in re.split(r"\s+and\s+", campos.get("author") or "")
+        if nome.strip()
+    ]
+    return {
+        "id": entry.key,
+        "titulo": _clean(campos.get("title")),
+        "booktitle": _clean(campos.get("booktitle") or campos.get("journal")),
+        "ano": int(ano) if ano and ano.isdigit() else None,
+        "resumo": _clean(campos.get("abstract")),
+        "palavras_chave": _clean(campos.get("keywords")),
+        "autores": autores,
+    }
+
+
+def preview_entry(dados: dict):
+    """Formato de pré-visualização esperado por ImportBibtexPage.js"""
+    return {
+        "id": dados["id"],
+        "titulo": dados["titulo"],
+        "booktitle": dados["booktitle"],
+        "data_publicacao": dados["ano"],
+        "resumo": dados["resumo"],
+        "palavras_chave": dados["palavras_chave"],
+        "authors": [{"nome": nome, "sobrenome": sobrenome} for nome, sobrenome in dados["autores"]],
+    }
+
+
+def preview_bibtex(fileobj, limit: int = PREVIEW_LIMIT):
+    """Interpreta o arquivo sem gravar nada; devolve no máximo `limit` artigos"""
+    articles, erros, total = [], [], 0
+    for texto in iter_bibtex_entries(fileobj):
+        try:
+            dados = parse_entry(texto)
+        except ValueError as e:
+            erros.append({"id": texto[:40], "erro": str(e)})
+            continue
+        if dados is None:
+            continue
+        total += 1
+        if len(articles) < limit:
+            articles.append(preview_entry(dados))
+    return {"articles": articles, "total": total, "erros": erros}
+
+
+class BibtexImporter:
+    """
+    Grava as entradas em lotes. Eventos, edições e autores já resolvidos ficam
+    em dicionários em memória, então cada um é consultado no banco no máximo
+    uma vez por importação.
+    """
+
+    def __init__(self, db: AsyncSession, batch_size: int = IMPORT_BATCH_SIZE, pdfs: dict = None):
+        self.db = db
+        self.batch_size = batch_size
+        self.pdfs = pdfs or {}  # chave BibTeX -> sha256 do PDF já armazenado
+        self.relatorio = {
+            "processados": 0,
+            "cadastrados": 0,
+            "edicoes_criadas": [],
+            "pulados": [],
+            "erros": [],
+        }
+        self._eventos = {}  # booktitle -> evento_id
+        self._edicoes = {}  # (evento_id, ano) -> edicao_id
+        self._autores = {}  # slug -> autor_id
+        self._titulos = set()  # (titulo, edicao_id) já gravados nesta importação
+        self.artigos_criados = []  # ids dos artigos gravados (para notificar seguidores)
+        self.pdfs_associados = set()  # chaves cujo PDF foi ligado a um artigo novo
+
+    async def run(self, fileobj):
+        # Leitura e parsing são CPU/IO síncronos: rodam em uma thread, um lote
+        # por vez, para não travar o event loop com arquivos de vários MB
+        entradas = iter_bibtex_entries(fileobj)
+        while True:
+            lote, fim = await run_in_threadpool(self._ler_lote, entradas)
+            if lote:
+                await self._gravar_lote(lote)
+            if fim:
+                return self.relatorio
+
+    def _ler_lote(self, entradas):
+        """Interpreta entradas até completar um lote; devolve (lote, fim_do_arquivo)"""
+        lote = []
+        for texto in entradas:
+            try:
+                dados = parse_entry(texto)
+            except ValueError as e:
+                self.relatorio["processados"] += 1
+                self.relatorio["erros"].append({"id": texto[:40], "erro": str(e)})
+                continue
+            if dados is None:
+                continue
+
+            self.relatorio["processados"] += 1
+            motivo = self._motivo_para_pular(dados)
+            if motivo:
+                self.relatorio["pulados"].append({"id": dados["id"], "motivo": motivo})
+                continue
+
+            lote.append(dados)
+            if len(lote) >= self.batch_size:
+                return lote, False
+        return lote, True
+
+    @staticmethod
+    def _motivo_para_pular(dados):
+        if not dados["titulo"]:
+            return "Sem título"
+        if not dados["autores"]:
+            return "Sem autores"
+        if not dados["booktitle"]:
+            return "Sem booktitle"
+        if not dados["ano"]:
+            return "Sem ano"
+        return None
+
+    async def _gravar_lote(self, lote):
+        try:
+            await self._resolver_eventos(lote)
+            await self._resolver_edicoes(lote)
+            await self._resolver_autores(lote)
+            novos = await self._filtrar_duplicados(lote)
+            await self._inserir_artigos(novos)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            # Nada do lote foi gravado: descarta o que foi criado/resolvido nele
+            self._eventos.clear()
+            self._edicoes.clear()
+            self._autores.clear()
+            self._titulos.difference_update((d["titulo"], d.get("edicao_id")) for d in lote)
+            for dados in lote:
+                self.relatorio["erros"].append({"id": dados["id"], "erro": str(e)})
+            return
+        self.relatorio["cadastrados"] += len(novos)
+        self.artigos_criados.extend(d["artigo_id"] for d in novos)
+        self.pdfs_associados.update(d["id"] for d in novos if d["id"] in self.pdfs)
+
+    async def _resolver_eventos(self, lote):
+        faltando = {d["booktitle"] for d in lote} - self._eventos.keys()
+        if not faltando:
+            return
+        # Grafias diferentes podem gerar o mesmo slug ("Simpósio X" e "Simposio X"):
+        # todas resolvem para o mesmo evento, e só um é criado por slug
+        por_slug = {}
+        for nome in sorted(faltando):
+            por_slug.setdefault(gerar_slug_generico(nome), []).append(nome)
+        existentes = (await self.db.scalars(
+            select(models.Event).where(
+                or_(models.Event.nome.in_(faltando), models.Event.slug.in_(por_slug))
+            )
+        )).all()
+        por_nome = {evento.nome: evento.id for evento in existentes}
+        por_slug_existente = {evento.slug: evento.id for evento in existentes}
+
+        novos = {}
+        for slug, nomes in por_slug.items():
+            evento_id = next((por_nome[nome] for nome in nomes if nome in por_nome), por_slug_existente.get(slug))
+            if evento_id is None:
+                novos[slug] = nomes
+                continue
+            for nome in nomes:
+                self._eventos[nome] = por_nome.get(nome, evento_id)
+
+        if novos:
+            inseridos = (await self.db.execute(
+                insert(models.Event).returning(models.Event.slug, models.Event.id),
+                [{"nome": nomes[0], "slug": slug} for slug, nomes in novos.items()],
+            )).all()
+            for slug, evento_id in inseridos:
+                for nome in novos[slug]:
+                    self._eventos[nome] = evento_id
+
+    async def _resolver_edicoes(self, lote):
+        chaves = {(self._eventos[d["booktitle"]], d["ano"]) for d in lote}
+        faltando = chaves - self._edicoes.keys()
+        if not faltando:
+            return
+        existentes = (await self.db.execute(
+            select(models.Edition.evento_id, models.Edition.ano, models.Edition.id).where(
+                tuple_(models.Edition.evento_id, models.Edition.ano).in_(faltando)
+            )
+        )).all()
+        for evento_id, ano, edicao_id in existentes:
+            self._edicoes[(evento_id, ano)] = edicao_id
+
+        novas = sorted(faltando - self._edicoes.keys())
+        if not novas:
+            return
+        slugs = dict((await self.db.execute(
+            select(models.Event.id, models.Event.slug).where(models.Event.id.in_({e for e, _ in novas}))
+        )).all())
+        inseridas = (await self.db.execute(
+            insert(models.Edition).returning(models.Edition.evento_id, models.Edition.ano, models.Edition.id),
+            [
+                {"evento_id": evento_id, "ano": ano, "slug": gerar_slug_generico(slugs[evento_id], ano)}
+                for evento_id, ano in novas
+            ],
+        )).all()
+        for evento_id, ano, edicao_id in inseridas:
+            self._edicoes[(evento_id, ano)] = edicao_id
+
+        nomes = {self._eventos[d["booktitle"]]: d["booktitle"] for d in lote}
+        self.relatorio["edicoes_criadas"].extend(f"{nomes[evento_id]} ({ano})" for evento_id, ano in novas)
+
+    async def _resolver_autores(self, lote):
+        nomes = {}
+        for dados in lote:
+            for nome, sobrenome in dados["autores"]:
+                slug = gerar_slug_generico(nome, sobrenome)
+                if slug and slug not in self._autores:
+                    nomes.setdefault(slug, (nome, sobrenome))
+        if not nomes:
+            return
+        existentes = (await self.db.execute(
+            select(models.Author.slug, models.Author.id).where(models.Author.slug.in_(nomes))
+        )).all()
+        for slug, autor_id in existentes:
+            self._autores[slug] = autor_id
+
+        novos = [slug for slug in nomes if slug not in self._autores]
+        if novos:
+            inseridos = (await self.db.execute(
+                insert(models.Author).returning(models.Author.slug, models.Author.id),
+                [{"nome": nomes[s][0], "sobrenome": nomes[s][1], "slug": s} for s in novos],
+            )).all()
+            for slug, autor_id in inseridos:
+                self._autores[slug] = autor_id
+
+    async def _filtrar_duplicados(self, lote):
+        chaves = {(d["titulo"], self._edicoes[(self._eventos[d["booktitle"]], d["ano"])]) for d in lote}
+        existentes = set((await self.db.execute(
+            select(models.Article.titulo, models.Article.edicao_id).where(
+                tuple_(models.Article.titulo, models.Article.edicao_id).in_(chaves)
+            )
+        )).all())
+
+        novos = []
+        for dados in lote:
+            edicao_id = self._edicoes[(self._eventos[dados["booktitle"]], dados["ano"])]
+            chave = (dados["titulo"], edicao_id)
+            if chave in existentes or chave in self._titulos:
+                self.relatorio["pulados"].append({"id": dados["id"], "motivo": "Artigo já cadastrado"})
+                continue
+            self._titulos.add(chave)
+            dados["edicao_id"] = edicao_id
+            novos.append(dados)
+        return novos
+
+    async def _inserir_artigos(self, novos):
+        if not novos:
+            return
+        ids = (await self.db.scalars(
+            insert(models.Article).returning(models.Article.id, sort_by_parameter_order=True),
+            [
+                {
+                    "titulo": d["titulo"],
+                    "resumo": d["resumo"],
+                    "palavras_chave": d["palavras_chave"],
+                    "edicao_id": d["edicao_id"],
+                    "pdf_path": pdf_url(self.pdfs[d["id"]]) if d["id"] in self.pdfs else None,
+                }
+                for d in novos
+            ],
+        )).all()
+
+        vinculos = []
+        for dados, artigo_id in zip(novos, ids):
+            dados["artigo_id"] = artigo_id
+            slugs = dict.fromkeys(gerar_slug_generico(n, s) for n, s in dados["autores"])
+            for slug in slugs:
+                if slug in self._autores:
+                    vinculos.append({"artigo_id": artigo_id, "autor_id": self._autores[slug]})
+        if vinculos:
+            await self.db.execute(insert(models.artigo_autor), vinculos)
+        await link_article_keywords(self.db, [(d["artigo_id"], d["palavras_chave"]) for d in novos])
@@ -0,0 +1,93 @@
+import os
+import time
+from collections import OrderedDict
+
+# ============================================================
+# Cache em memória para buscas por ID ou slug
+# ============================================================
+#
+# As rotas de detalhe de eventos e autores são chamadas por cada card do
+# frontend e podem custar duas consultas (por id e depois por slug). O cache
+# guarda a resposta já serializada (schema Pydantic, nunca o objeto ORM, que
+# pertence a uma sessão) por chave de busca, com validade (TTL) e descarte do
+# item menos usado (LRU) quando cheio.
+#
+# O cache é por processo, mas a chave inclui a versão da tabela em
+# versoes_tabelas, o mesmo contador do ETag (ver conditional.py). Uma escrita
+# em qualquer processo muda a versão, e as entradas anteriores a ela deixam
+# de ser encontradas: nenhum worker devolve um corpo antigo sob o ETag novo,
+# e uma leitura lenta que grave seu resultado depois da escrita só ocupa a
+# chave da versão antiga. As rotas de escrita ainda chamam invalidate(), só
+# para liberar a memória do processo local.
+
+LOOKUP_CACHE_SIZE = int(os.getenv("LOOKUP_CACHE_SIZE", "1024"))
+LOOKUP_CACHE_TTL = float(os.getenv("LOOKUP_CACHE_TTL", "60"))
+
+
+class TTLCache:
+    def __init__(self, maxsize: int = LOOKUP_CACHE_SIZE, ttl: float = LOOKUP_CACHE_TTL, clock=time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._itens = OrderedDict()  # chave -> (expira_em, valor)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, chave):
+        """Valor em cache ou None (item ausente ou expirado)"""
+        item = self._itens.get(chave)
+        if item is None or item[0] <= self._clock():
+            if item is not None:
+                del self._itens[chave]
+            self.misses += 1
+            return None
+        self._itens.move_to_end(chave)
+        self.hits += 1
+        return item[1]
+
+    def set(self, chave, valor):
+        if self.maxsize <= 0:
+            return
+        self._itens[chave] = (self._clock() + self.ttl, valor)
+        self._itens.move_to_end(chave)
+        while len(self._itens) > self.maxsize:
+            self._itens.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self):
+        """Descarta todas as entradas (mantém os contadores)"""
+        self._itens.clear()
+
+    def reset(self):
+        self.invalidate()
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "tamanho": len(self._itens),
+            "capacidade": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+# Um cache por entidade, para que a escrita em uma não descarte a outra
+event_cache = TTLCache()
+author_cache = TTLCache()
+
+LOOKUP_CACHES = {"eventos": event_cache, "autores": author_cache}
+
+
+def cache_stats():
+    return {nome: cache.stats() for nome, cache in LOOKUP_CACHES.items()}
+
+
+def reset_caches():
+    """Esvazia os caches e zera os contadores (usado nos testes)"""
+    for cache in LOOKUP_CACHES.values():
+        cache.reset()
@@ -0,0 +1,88 @@
+import hashlib
+
+from fastapi import Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .dependencies import get_db
+from . import models
+
+# ============================================================
+# GET condicional (ETag)
+# ============================================================
+#
+# Cada rota declara de quais tabelas sua resposta depende. O ETag é derivado
+# dos contadores dessas tabelas em versoes_tabelas (uma consulta por chave
+# primária) e da URL. Se o cliente enviar o mesmo ETag em If-None-Match, a
+# dependência responde 304 antes de a rota rodar: nenhuma consulta principal
+# e nenhuma serialização.
+#
+# Não há Last-Modified/If-Modified-Since: a resolução de um segundo do
+# cabeçalho faria uma escrita no mesmo segundo da leitura passar despercebida
+# (304 com conteúdo antigo). O contador do ETag não tem esse problema.
+#
+# As versões lidas ficam em request.state.versoes_tabelas: table_version()
+# as reaproveita para montar chaves de cache coerentes com o ETag, sem
+# consultar versoes_tabelas de novo.
+
+
+async def table_versions(db: AsyncSession, tabelas):
+    """{tabela: versao}; tabelas nunca escritas ficam com versão 0"""
+    rows = (await db.execute(
+        select(models.TableVersion.tabela, models.TableVersion.versao)
+        .where(models.TableVersion.tabela.in_(tabelas))
+    )).all()
+    versoes = {tabela: 0 for tabela in tabelas}
+    versoes.update(dict(rows))
+    return versoes
+
+
+def build_etag(request: Request, versoes):
+    partes = [f"{tabela}:{versoes[tabela]}" for tabela in sorted(versoes)]
+    partes.append(request.url.path)
+    partes.append(str(request.query_params))
+    return '"' + hashlib.sha1("|".join(partes).encode("utf-8")).hexdigest()[:20] + '"'
+
+
+def _etag_confere(if_none_match: str, etag: str):
+    if if_none_match.strip() == "*":
+        return True
+    candidatos = [tag.strip() for tag in if_none_match.split(",")]
+    # Comparação fraca (RFC 9110): W/"x" e "x" são equivalentes para If-None-Match
+    return any(tag.removeprefix("W/") == etag for tag in candidatos)
+
+
+def conditional_get(*tabelas):
+    """
+    Dependência para rotas GET do catálogo.
+    Uso: app.get(..., dependencies=[Depends(conditional_get("eventos"))])
+    """
+    async def dependency(request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+        versoes = await table_versions(db, tabelas)
+        request.state.versoes_tabelas = versoes
+        etag = build_etag(request, versoes)
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None and _etag_confere(if_none_match, etag):
+            # O handler de HTTPException do Starlette responde 304 sem corpo
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+
+    return dependency
+
+
+def table_version(tabela):
+    """
+    Dependência: versão atual de uma tabela.
+    Reaproveita a leitura de conditional_get na mesma requisição; sem ela,
+    consulta versoes_tabelas.
+    """
+    async def dependency(request: Request, db: AsyncSession = Depends(get_db)):
+        versoes = getattr(request.state, "versoes_tabelas", {})
+        if tabela not in versoes:
+            versoes = await table_versions(db, (tabela,))
+        return versoes[tabela]
+
+    return dependency
@@ -1,35 +1,84 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import sessionmaker, declarative_base
-from sqlalchemy.pool import StaticPool
+import atexit
 import os
+import shutil
+import tempfile
 from dotenv import load_dotenv, find_dotenv
 
+from .pool import InstrumentedAsyncQueuePool, InstrumentedNullPool, InstrumentedQueuePool
+
 load_dotenv(find_dotenv())
 
+# Pool de conexões (Postgres). Cada worker do uvicorn tem o próprio pool:
+# workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) precisa caber em max_connections.
+#   DB_POOL_SIZE      conexões mantidas abertas (padrão 5)
+#   DB_MAX_OVERFLOW   conexões extras em picos, fechadas ao devolver (padrão 10)
+#   DB_POOL_TIMEOUT   segundos esperando uma conexão livre antes do erro (padrão 30)
+#   DB_POOL_RECYCLE   segundos até reabrir uma conexão (padrão 1800; -1 desliga)
+#   DB_POOL_PRE_PING  testa a conexão no checkout, descartando as mortas após
+#                     um failover (padrão true)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes", "sim")
+
+
+def pool_settings():
+    """Argumentos de pool para create_engine/create_async_engine"""
+    return {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
 # Use SQLite para testes se a variável de ambiente TEST_MODE estiver definida
 if os.getenv("TEST_MODE"):
-    DATABASE_URL = "sqlite:///:memory:"
-    # Para SQLite em memória, precisamos habilitar o suporte a chaves estrangeiras
-    # e garantir que a conexão seja mantida para o mesmo banco em memória
+    # O banco de testes fica em um arquivo temporário para que a engine síncrona
+    # (usada pelos testes para preparar dados) e a engine assíncrona (usada pelas
+    # rotas via aiosqlite) enxerguem o mesmo banco. Sem TEST_DB_PATH, cada
+    # processo usa o próprio diretório temporário (execuções paralelas não
+    # compartilham o arquivo); a variável é exportada para os subprocessos
+    TEST_DB_PATH = os.getenv("TEST_DB_PATH")
+    if not TEST_DB_PATH:
+        _test_db_dir = tempfile.mkdtemp(prefix="digital_library_test_")
+        atexit.register(shutil.rmtree, _test_db_dir, ignore_errors=True)
+        TEST_DB_PATH = os.environ["TEST_DB_PATH"] = os.path.join(_test_db_dir, "test.db")
+    DATABASE_URL = f"sqlite:///{TEST_DB_PATH}"
+    ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_DB_PATH}"
     engine = create_engine(
         DATABASE_URL,
         connect_args={
             "check_same_thread": False,
         },
-        poolclass=StaticPool,  # Mantém a mesma conexão para o banco em memória
         echo=True  # Habilita logs de SQL para debug
     )
-    
+    # NullPool: o TestClient abre um event loop por requisição, então as conexões
+    # assíncronas não podem ser reaproveitadas entre requisições
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, poolclass=InstrumentedNullPool, echo=True)
+
     from sqlalchemy import event
     from sqlalchemy.engine import Engine
     import sqlite3
-    
+
+    # Para SQLite precisamos habilitar o suporte a chaves estrangeiras em cada conexão
     @event.listens_for(Engine, "connect")
     def set_sqlite_pragma(dbapi_connection, connection_record):
         if isinstance(dbapi_connection, sqlite3.Connection):
             cursor = dbapi_connection.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
             cursor.close()
+
+    # Conexões aiosqlite chegam adaptadas (não são sqlite3.Connection)
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def set_aiosqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
 else:
     DB_USER = os.getenv("DB_USER")
     DB_PASS = os.getenv("DB_PASS")
@@ -37,13 +86,61 @@ else:
     DB_PORT = os.getenv("DB_PORT") or "5432"
     DB_NAME = os.getenv("DB_NAME")
     DATABASE_URL = f"postgresql://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+    ASYNC_DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
 
 if not os.getenv("TEST_MODE"):
     engine = create_engine(
         DATABASE_URL,
-        connect_args={} if not DATABASE_URL.startswith("sqlite") else {"check_same_thread": False}
+        connect_args={} if not DATABASE_URL.startswith("sqlite") else {"check_same_thread": False},
+        poolclass=InstrumentedQueuePool,
+        **pool_settings()
+    )
+    async_engine = create_async_engine(
+        ASYNC_DATABASE_URL,
+        poolclass=InstrumentedAsyncQueuePool,
+        **pool_settings()
     )
 
+# Réplica de leitura (opcional): as rotas GET leem dela, ver replica.py.
+# Postgres: DB_REPLICA_HOST (e DB_REPLICA_PORT), com usuário, senha e banco do primário.
+# TEST_MODE: TEST_REPLICA_DB_PATH, outro arquivo SQLite fazendo o papel da réplica.
+if os.getenv("TEST_MODE"):
+    TEST_REPLICA_DB_PATH = os.getenv("TEST_REPLICA_DB_PATH")
+    REPLICA_ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{TEST_REPLICA_DB_PATH}" if TEST_REPLICA_DB_PATH else None
+else:
+    DB_REPLICA_HOST = os.getenv("DB_REPLICA_HOST")
+    DB_REPLICA_PORT = os.getenv("DB_REPLICA_PORT") or DB_PORT
+    REPLICA_ASYNC_DATABASE_URL = (
+        f"postgresql+asyncpg://{DB_USER}:{DB_PASS}@{DB_REPLICA_HOST}:{DB_REPLICA_PORT}/{DB_NAME}"
+        if DB_REPLICA_HOST else None
+    )
+
+
+def create_replica_engine(url):
+    if url.startswith("sqlite"):
+        return create_async_engine(url, poolclass=InstrumentedNullPool)
+    return create_async_engine(url, poolclass=InstrumentedAsyncQueuePool, **pool_settings())
+
+
+# Sessão síncrona: scripts, migrações e preparação de dados nos testes
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Sessão assíncrona: usada pelas rotas (não bloqueia o event loop)
+# expire_on_commit=False evita lazy loads implícitos após o commit, que não
+# são permitidos em AsyncSession
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+replica_async_engine = create_replica_engine(REPLICA_ASYNC_DATABASE_URL) if REPLICA_ASYNC_DATABASE_URL else None
+ReplicaSessionLocal = async_sessionmaker(
+    bind=replica_async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+) if replica_async_engine is not None else None
+
 Base = declarative_base()
@@ -1,8 +1,28 @@
-from .database import SessionLocal
+from fastapi import Request, Response
 
-def get_db():
-    db = SessionLocal()
-    try:
+from .database import AsyncSessionLocal, ReplicaSessionLocal
+from .replica import (
+    DB_STICKY_SECONDS, STICKY_COOKIE, is_read, is_sticky, replica_health, sticky_cookie_value,
+)
+
+
+async def get_db(request: Request = None, response: Response = None):
+    """
+    Sessão do banco para a rota: réplica para leituras (GET/HEAD), primário
+    para escritas e para clientes que escreveram há pouco (ver replica.py).
+    Fora de uma requisição (scripts, testes), sempre o primário.
+    """
+    leitura = request is not None and is_read(request)
+    if ReplicaSessionLocal is not None and leitura and not is_sticky(request):
+        async with ReplicaSessionLocal() as db:
+            if await replica_health.usable(db):
+                yield db
+                return
+
+    if request is not None and not leitura:
+        response.set_cookie(
+            STICKY_COOKIE, sticky_cookie_value(),
+            max_age=int(DB_STICKY_SECONDS) + 1, httponly=True, samesite="lax",
+        )
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
@@ -0,0 +1,129 @@
+import re
+
+from sqlalchemy import select, insert
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+from .models import gerar_slug_generico
+
+# ============================================================
+# Palavras-chave normalizadas
+# ============================================================
+#
+# Article.palavras_chave continua guardando o texto livre enviado pelo
+# cliente; as tabelas palavras_chave e artigo_palavra_chave guardam a versão
+# normalizada (uma linha por termo, identificada pelo slug) para que o filtro
+# por palavra-chave seja uma busca por índice.
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def parse_palavras_chave(texto):
+    """
+    Separa o texto livre (vírgula ou ponto e vírgula) em {slug: nome},
+    mantendo a primeira grafia encontrada para cada slug.
+    Exemplo:
+        parse_palavras_chave("IA, Machine Learning; ia") -> {'ia': 'IA', 'machine-learning': 'Machine Learning'}
+    """
+    termos = {}
+    for parte in re.split(r"[,;]", texto or ""):
+        nome = " ".join(parte.split())
+        slug = gerar_slug_generico(nome)
+        if slug:
+            termos.setdefault(slug, nome)
+    return termos
+
+
+def _insert_ignorando_duplicados(dialect_name, table):
+    """INSERT que ignora conflitos de chave (duas importações criando o mesmo termo)"""
+    if dialect_name == "postgresql":
+        return postgresql.insert(table).on_conflict_do_nothing()
+    if dialect_name == "sqlite":
+        return sqlite.insert(table).on_conflict_do_nothing()
+    return insert(table)
+
+
+def _termos_por_artigo(artigos):
+    """[(artigo_id, texto)] -> ([(artigo_id, {slug: nome})], {slug: nome} de todos os artigos)"""
+    por_artigo = [(artigo_id, parse_palavras_chave(texto)) for artigo_id, texto in artigos]
+    termos = {}
+    for _, parsed in por_artigo:
+        for slug, nome in parsed.items():
+            termos.setdefault(slug, nome)
+    return por_artigo, termos
+
+
+def _vinculos(por_artigo, ids_por_slug):
+    return [
+        {"artigo_id": artigo_id, "palavra_chave_id": ids_por_slug[slug]}
+        for artigo_id, parsed in por_artigo
+        for slug in parsed
+    ]
+
+
+async def link_article_keywords(db: AsyncSession, artigos):
+    """
+    Cria as palavras-chave que faltam e vincula cada (artigo_id, texto) a elas.
+    Usa um número constante de consultas, independente de quantos artigos e termos.
+    Não faz commit: roda dentro da transação de quem chamou.
+    """
+    por_artigo, termos = _termos_por_artigo(artigos)
+    if not termos:
+        return
+
+    dialect_name = db.get_bind().dialect.name
+    await db.execute(
+        _insert_ignorando_duplicados(dialect_name, models.Keyword.__table__),
+        [{"nome": nome, "slug": slug} for slug, nome in termos.items()]
+    )
+    ids_por_slug = dict((await db.execute(
+        select(models.Keyword.slug, models.Keyword.id).where(models.Keyword.slug.in_(termos))
+    )).all())
+    await db.execute(
+        _insert_ignorando_duplicados(dialect_name, models.artigo_palavra_chave),
+        _vinculos(por_artigo, ids_por_slug)
+    )
+
+
+def backfill_palavras_chave(connection, batch_size: int = BACKFILL_BATCH_SIZE):
+    """
+    Preenche as tabelas normalizadas a partir de artigos.palavras_chave já existentes.
+    Percorre os artigos por id em lotes (keyset) e pode ser executado de novo sem
+    duplicar nada. Recebe uma Connection síncrona (usada pelas migrações).
+    """
+    dialect_name = connection.dialect.name
+    ultimo_id = 0
+    while True:
+        lote = connection.execute(
+            select(models.Article.id, models.Article.palavras_chave)
+            .where(models.Article.id > ultimo_id, models.Article.palavras_chave.isnot(None))
+            .order_by(models.Article.id)
+            .limit(batch_size)
+        ).all()
+        if not lote:
+            return
+        ultimo_id = lote[-1][0]
+
+        por_artigo, termos = _termos_por_artigo(lote)
+        if not termos:
+            continue
+        connection.execute(
+            _insert_ignorando_duplicados(dialect_name, models.Keyword.__table__),
+            [{"nome": nome, "slug": slug} for slug, nome in termos.items()]
+        )
+        ids_por_slug = dict(connection.execute(
+            select(models.Keyword.slug, models.Keyword.id).where(models.Keyword.slug.in_(termos))
+        ).all())
+        connection.execute(
+            _insert_ignorando_duplicados(dialect_name, models.artigo_palavra_chave),
+            _vinculos(por_artigo, ids_por_slug)
+        )
+
+
+if __name__ == "__main__":
+    # python -m backend.app.keywords  -> backfill no banco configurado no .env
+    from .database import engine
+
+    with engine.begin() as connection:
+        backfill_palavras_chave(connection)
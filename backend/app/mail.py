@@ -0,0 +1,267 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+from email import message_from_bytes, policy
+
+import aiosmtplib
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Transporte de emails
+# ============================================================
+#
+# O envio passa por um "transporte" trocável:
+#   SimulatedTransport -> apenas registra no log (padrão sem EMAIL_FROM)
+#   SMTPPool           -> pool limitado de conexões SMTP persistentes e já
+#                         autenticadas (aiosmtplib, sem bloquear o event loop)
+#
+# Configuração (.env):
+#   MAIL_TRANSPORT   smtp | simulated (padrão: smtp se EMAIL_FROM estiver definido)
+#   SMTP_SERVER, SMTP_PORT, EMAIL_FROM, EMAIL_PASSWORD
+#   SMTP_STARTTLS    1/0 (padrão 1)
+#   SMTP_POOL_SIZE   conexões simultâneas (padrão 4)
+#   SMTP_TIMEOUT     segundos (padrão 30)
+#
+# Para desenvolvimento, `python -m backend.app.mail` sobe um servidor SMTP
+# local que apenas imprime as mensagens recebidas (SMTP_SERVER=localhost,
+# SMTP_PORT=1025, SMTP_STARTTLS=0).
+
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "4"))
+SMTP_TIMEOUT = float(os.getenv("SMTP_TIMEOUT", "30"))
+
+
+class SimulatedTransport:
+    """Não envia nada: registra o destinatário e o assunto"""
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, msg):
+        logger.info("Email simulado para %s: %s", msg["To"], msg["Subject"])
+        self.sent.append(msg)
+
+    async def send_many(self, messages):
+        for msg in messages:
+            await self.send(msg)
+        return [None] * len(messages)
+
+    async def close(self):
+        pass
+
+
+class SMTPPool:
+    """
+    Pool de até `size` conexões SMTP abertas sob demanda e reaproveitadas entre
+    envios: o handshake (conexão, STARTTLS, login) acontece uma vez por conexão,
+    não uma vez por email. Uma conexão que falha é descartada e, se o servidor
+    a tiver fechado por inatividade, o envio é repetido uma vez em outra.
+    """
+
+    def __init__(self, hostname, port, username=None, password=None,
+                 start_tls=True, size: int = SMTP_POOL_SIZE, timeout: float = SMTP_TIMEOUT):
+        self.hostname = hostname
+        self.port = port
+        self.username = username
+        self.password = password
+        self.start_tls = start_tls
+        self.size = size
+        self.timeout = timeout
+        self.connections_opened = 0
+        self._loop = None
+
+    def _reset(self):
+        # Conexões e primitivas asyncio pertencem a um event loop
+        self._loop = asyncio.get_running_loop()
+        self._idle = []
+        self._slots = asyncio.Semaphore(self.size)
+
+    async def _connect(self):
+        smtp = aiosmtplib.SMTP(
+            hostname=self.hostname,
+            port=self.port,
+            username=self.username,
+            password=self.password,
+            start_tls=self.start_tls,
+            timeout=self.timeout,
+        )
+        await smtp.connect()
+        self.connections_opened += 1
+        return smtp
+
+    @asynccontextmanager
+    async def connection(self):
+        if self._loop is not asyncio.get_running_loop():
+            self._reset()
+        async with self._slots:
+            smtp = self._idle.pop() if self._idle else await self._connect()
+            try:
+                yield smtp
+            except aiosmtplib.SMTPResponseException:
+                # O servidor recusou a mensagem, mas a conexão continua válida
+                self._idle.append(smtp)
+                raise
+            except BaseException:
+                smtp.close()
+                raise
+            self._idle.append(smtp)
+
+    async def send(self, msg):
+        try:
+            async with self.connection() as smtp:
+                await smtp.send_message(msg)
+        except aiosmtplib.SMTPServerDisconnected:
+            # Conexão ociosa encerrada pelo servidor: tenta de novo com outra
+            async with self.connection() as smtp:
+                await smtp.send_message(msg)
+
+    async def send_many(self, messages):
+        """
+        Envia as mensagens em paralelo pelas conexões do pool.
+        Devolve, para cada mensagem, None (sucesso) ou a exceção.
+        """
+        return await asyncio.gather(*(self.send(msg) for msg in messages), return_exceptions=True)
+
+    async def close(self):
+        if self._loop is not asyncio.get_running_loop():
+            return
+        idle, self._idle = self._idle, []
+        for smtp in idle:
+            try:
+                await smtp.quit()
+            except aiosmtplib.SMTPException:
+                smtp.close()
+
+
+def transport_from_env():
+    escolha = os.getenv("MAIL_TRANSPORT") or ("smtp" if os.getenv("EMAIL_FROM") else "simulated")
+    if escolha == "simulated":
+        return SimulatedTransport()
+    return SMTPPool(
+        hostname=os.getenv("SMTP_SERVER", "smtp.gmail.com"),
+        port=int(os.getenv("SMTP_PORT", "587")),
+        username=os.getenv("EMAIL_FROM"),
+        password=os.getenv("EMAIL_PASSWORD"),
+        start_tls=os.getenv("SMTP_STARTTLS", "1") == "1",
+    )
+
+
+_transport = None
+
+
+def get_transport():
+    global _transport
+    if _transport is None:
+        _transport = transport_from_env()
+    return _transport
+
+
+def set_transport(transport):
+    """Troca o transporte (testes, benchmarks); None volta a ler do ambiente"""
+    global _transport
+    _transport = transport
+
+
+async def close_transport():
+    """Fecha as conexões do transporte atual (desligamento da aplicação)"""
+    global _transport
+    transport, _transport = _transport, None
+    if transport is not None:
+        await transport.close()
+
+
+# ----------------------
+# Servidor SMTP local para depuração
+# ----------------------
+class DebuggingSMTPServer:
+    """
+    Servidor SMTP mínimo que aceita qualquer remetente, destinatário e login
+    (AUTH PLAIN) e guarda as mensagens em `messages`. `latency` atrasa cada
+    resposta, para simular a ida e volta de um servidor remoto.
+    """
+
+    def __init__(self, host="127.0.0.1", port=1025, latency: float = 0.0, echo=False):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.echo = echo
+        self.messages = []
+        self.connections = 0
+        self._server = None
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        # port=0 escolhe uma porta livre
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, *exc):
+        await self.stop()
+
+    async def _reply(self, writer, linhas):
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        writer.write(linhas.encode("ascii"))
+        await writer.drain()
+
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        await self._reply(writer, "220 localhost SMTP de depuracao\r\n")
+        try:
+            while line := await reader.readline():
+                comando = line.decode("utf-8", "replace").strip()
+                verbo = comando[:4].upper()
+                if verbo == "EHLO":
+                    await self._reply(writer, "250-localhost\r\n250-8BITMIME\r\n250 AUTH PLAIN\r\n")
+                elif verbo == "AUTH":
+                    if len(comando.split()) < 3:
+                        await self._reply(writer, "334 \r\n")
+                        await reader.readline()
+                    await self._reply(writer, "235 Autenticado\r\n")
+                elif verbo == "DATA":
+                    await self._reply(writer, "354 Fim com <CRLF>.<CRLF>\r\n")
+                    await self._receber(reader)
+                    await self._reply(writer, "250 OK\r\n")
+                elif verbo == "QUIT":
+                    await self._reply(writer, "221 Tchau\r\n")
+                    break
+                elif verbo in ("HELO", "MAIL", "RCPT", "RSET", "NOOP"):
+                    await self._reply(writer, "250 OK\r\n")
+                else:
+                    await self._reply(writer, "502 Comando nao implementado\r\n")
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _receber(self, reader):
+        linhas = []
+        while (line := await reader.readline()) not in (b".\r\n", b".\n", b""):
+            # Remove o ponto extra das linhas que começam com "." (RFC 5321, 4.5.2)
+            linhas.append(line[1:] if line.startswith(b"..") else line)
+        msg = message_from_bytes(b"".join(linhas), policy=policy.default)
+        self.messages.append(msg)
+        if self.echo:
+            print(f"---------- {msg['To']}: {msg['Subject']}")
+            print(msg.get_content() if not msg.is_multipart() else msg)
+
+
+if __name__ == "__main__":
+    # python -m backend.app.mail [porta] -> servidor SMTP local que imprime as mensagens
+    import sys
+
+    async def main():
+        porta = int(sys.argv[1]) if len(sys.argv) > 1 else 1025
+        server = await DebuggingSMTPServer(port=porta, echo=True).start()
+        print(f"Servidor SMTP de depuração em {server.host}:{server.port}")
+        await server._server.serve_forever()
+
+    asyncio.run(main())
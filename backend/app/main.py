@@ -1,11 +1,22 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from .dependencies import get_db
 from .routes import configure_routes
-import os
+from .metrics import MetricsMiddleware, instrument_engine
+from .query_budget import QueryBudgetMiddleware, watch_commits
+from . import database, mail
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Encerra as conexões SMTP do pool (reload e desligamento do servidor)
+    await mail.close_transport()
 
-app = FastAPI()
+
+app = FastAPI(lifespan=lifespan)
 
 origins = ["http://localhost:3000"]
 
@@ -17,14 +28,19 @@ app.add_middleware(
     allow_headers=["*"]
 )
 
+# Latência, tamanho das respostas e consultas por rota (GET /metrics).
+# O último adicionado fica por fora: as métricas abrem a contagem de consultas
+# que o orçamento (query_budget.py) confere
+app.add_middleware(QueryBudgetMiddleware)
+app.add_middleware(MetricsMiddleware)
+for _engine in (database.async_engine, database.replica_async_engine):
+    if _engine is not None:
+        instrument_engine(_engine)
+        watch_commits(_engine)
+
 # Configurar as rotas
 configure_routes(app)
 
 @app.get("/")
 def read_root():
     return {"message": "Hello World"}
-
-# Servir arquivos estáticos (PDFs)
-uploads_dir = os.path.join(os.path.dirname(__file__), "../uploads")
-os.makedirs(uploads_dir, exist_ok=True)
-app.mount("/uploads", StaticFiles(directory=uploads_dir), name="uploads")
@@ -0,0 +1,301 @@
+import bisect
+import collections
+import contextvars
+import threading
+import time
+
+from sqlalchemy import event
+
+# ============================================================
+# Métricas (formato de exposição de texto do Prometheus)
+# ============================================================
+#
+# MetricsMiddleware mede cada requisição HTTP: latência e tamanho da resposta
+# por rota (o template, ex. /eventos/{slug}, não a URL), requisições em
+# andamento e, pelos eventos before/after_cursor_execute das engines, quantas
+# consultas cada requisição fez e quanto tempo passou no banco. A medição
+# termina quando o último byte da resposta sai: BackgroundTasks (emails,
+# extração de texto) não entram na latência da rota.
+#
+# GET /metrics devolve tudo no formato text/plain 0.0.4. Os contadores são por
+# processo: com vários workers do uvicorn, cada um expõe os próprios (raspe
+# cada worker ou rode um worker por contêiner).
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100)
+
+UNMATCHED_ROUTE = "sem_rota"
+
+
+def _escape(valor) -> str:
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(nomes, valores, extra=()):
+    pares = list(zip(nomes, valores)) + list(extra)
+    if not pares:
+        return ""
+    return "{" + ",".join(f'{nome}="{_escape(valor)}"' for nome, valor in pares) + "}"
+
+
+def _numero(valor) -> str:
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+class _Metric:
+    tipo = None
+
+    def __init__(self, nome, descricao, labels=()):
+        self.nome = nome
+        self.descricao = descricao
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+        self._series = {}
+
+    def _chave(self, labels):
+        return tuple(str(labels[nome]) for nome in self.label_names)
+
+    def reset(self):
+        with self._lock:
+            self._series.clear()
+
+    def render(self):
+        linhas = [f"# HELP {self.nome} {self.descricao}", f"# TYPE {self.nome} {self.tipo}"]
+        with self._lock:
+            series = sorted((chave, self._copia(valor)) for chave, valor in self._series.items())
+        for chave, valor in series:
+            linhas.extend(self._amostras(chave, valor))
+        return linhas
+
+    @staticmethod
+    def _copia(valor):
+        return valor
+
+    def _amostras(self, chave, valor):
+        return [f"{self.nome}{_labels(self.label_names, chave)} {_numero(valor)}"]
+
+
+class Counter(_Metric):
+    tipo = "counter"
+
+    def inc(self, valor=1, **labels):
+        chave = self._chave(labels)
+        with self._lock:
+            self._series[chave] = self._series.get(chave, 0) + valor
+
+    def value(self, **labels):
+        return self._series.get(self._chave(labels), 0)
+
+
+class Gauge(Counter):
+    tipo = "gauge"
+
+    def dec(self, valor=1, **labels):
+        self.inc(-valor, **labels)
+
+
+class Histogram(_Metric):
+    tipo = "histogram"
+
+    def __init__(self, nome, descricao, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(nome, descricao, labels)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, valor, **labels):
+        chave = self._chave(labels)
+        with self._lock:
+            serie = self._series.get(chave)
+            if serie is None:
+                # [contagem por bucket (não acumulada)..., +Inf], soma, total
+                serie = self._series[chave] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            serie[0][bisect.bisect_left(self.buckets, valor)] += 1
+            serie[1] += valor
+            serie[2] += 1
+
+    def count(self, **labels):
+        serie = self._series.get(self._chave(labels))
+        return serie[2] if serie else 0
+
+    def sum(self, **labels):
+        serie = self._series.get(self._chave(labels))
+        return serie[1] if serie else 0.0
+
+    @staticmethod
+    def _copia(valor):
+        return [list(valor[0]), valor[1], valor[2]]
+
+    def _amostras(self, chave, valor):
+        contagens, soma, total = valor
+        linhas, acumulado = [], 0
+        for limite, quantidade in zip(self.buckets, contagens):
+            acumulado += quantidade
+            le = _labels(self.label_names, chave, [("le", _numero(float(limite)))])
+            linhas.append(f"{self.nome}_bucket{le} {acumulado}")
+        linhas.append(f"{self.nome}_bucket{_labels(self.label_names, chave, [('le', '+Inf')])} {total}")
+        linhas.append(f"{self.nome}_sum{_labels(self.label_names, chave)} {_numero(float(soma))}")
+        linhas.append(f"{self.nome}_count{_labels(self.label_names, chave)} {total}")
+        return linhas
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        linhas = []
+        for metric in self.metrics:
+            linhas.extend(metric.render())
+        return "\n".join(linhas) + "\n"
+
+    def reset(self):
+        for metric in self.metrics:
+            metric.reset()
+
+
+REGISTRY = Registry()
+
+HTTP_REQUESTS = REGISTRY.register(Counter(
+    "http_requests_total", "Requisições HTTP atendidas", ["method", "route", "status"]))
+HTTP_LATENCY = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "Latência das requisições HTTP até o último byte da resposta",
+    ["method", "route"], LATENCY_BUCKETS))
+HTTP_RESPONSE_SIZE = REGISTRY.register(Histogram(
+    "http_response_size_bytes", "Tamanho do corpo das respostas HTTP", ["method", "route"], SIZE_BUCKETS))
+HTTP_IN_PROGRESS = REGISTRY.register(Gauge(
+    "http_requests_in_progress", "Requisições HTTP em andamento", ["method"]))
+DB_QUERIES_PER_REQUEST = REGISTRY.register(Histogram(
+    "http_request_db_queries", "Consultas SQL por requisição", ["method", "route"], QUERY_COUNT_BUCKETS))
+DB_TIME_PER_REQUEST = REGISTRY.register(Histogram(
+    "http_request_db_duration_seconds", "Tempo no banco por requisição", ["method", "route"], LATENCY_BUCKETS))
+DB_QUERIES = REGISTRY.register(Counter(
+    "db_queries_total", "Consultas SQL executadas (inclui tarefas em segundo plano)"))
+DB_TIME = REGISTRY.register(Counter(
+    "db_query_duration_seconds_total", "Tempo total gasto em consultas SQL"))
+EMAILS = REGISTRY.register(Counter(
+    "emails_total", "Emails de notificação por status (sent, failed, simulated)", ["status"]))
+
+
+# ----------------------
+# Consultas por requisição
+# ----------------------
+class RequestDbStats:
+    """Consultas feitas durante uma requisição (visível via contextvar)"""
+
+    def __init__(self):
+        self.queries = 0
+        self.tempo = 0.0
+        self.statements = collections.Counter()  # SQL -> execuções (ver query_budget.py)
+        self.budget = None  # declarado pela rota; None = orçamento padrão
+
+    def record(self, statement: str, duracao: float):
+        self.queries += 1
+        self.tempo += duracao
+        self.statements[statement] += 1
+
+
+_request_db_stats = contextvars.ContextVar("request_db_stats", default=None)
+
+
+def current_db_stats():
+    return _request_db_stats.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("metrics_inicio", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    inicios = conn.info.get("metrics_inicio")
+    if not inicios:
+        return
+    duracao = time.perf_counter() - inicios.pop()
+    DB_QUERIES.inc()
+    DB_TIME.inc(duracao)
+    stats = _request_db_stats.get()
+    if stats is not None:
+        stats.record(statement, duracao)
+
+
+def _handle_error(exception_context):
+    # Consulta que falhou não chega ao after_cursor_execute
+    conexao = exception_context.connection
+    if conexao is not None and conexao.info.get("metrics_inicio"):
+        conexao.info["metrics_inicio"].pop()
+
+
+def instrument_engine(engine):
+    """Liga a contagem de consultas a uma engine (síncrona ou assíncrona); idempotente"""
+    engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+# ----------------------
+# Middleware ASGI
+# ----------------------
+def route_template(scope) -> str:
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """Middleware ASGI puro (sem BaseHTTPMiddleware: não copia o corpo da resposta)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        inicio = time.perf_counter()
+        stats = RequestDbStats()
+        token = _request_db_stats.set(stats)
+        estado = {"status": 500, "tamanho": 0, "terminou": False}
+        HTTP_IN_PROGRESS.inc(method=method)
+
+        def terminar():
+            if estado["terminou"]:
+                return
+            estado["terminou"] = True
+            HTTP_IN_PROGRESS.dec(method=method)
+            route = route_template(scope)
+            HTTP_REQUESTS.inc(method=method, route=route, status=estado["status"])
+            HTTP_LATENCY.observe(time.perf_counter() - inicio, method=method, route=route)
+            HTTP_RESPONSE_SIZE.observe(estado["tamanho"], method=method, route=route)
+            DB_QUERIES_PER_REQUEST.observe(stats.queries, method=method, route=route)
+            DB_TIME_PER_REQUEST.observe(stats.tempo, method=method, route=route)
+
+        async def send_medindo(message):
+            tipo = message["type"]
+            if tipo == "http.response.start":
+                estado["status"] = message["status"]
+                cabecalhos = dict(message.get("headers") or [])
+                estado["content_length"] = int(cabecalhos.get(b"content-length", 0) or 0)
+            elif tipo == "http.response.body":
+                estado["tamanho"] += len(message.get("body", b""))
+            elif tipo == "http.response.pathsend":
+                estado["tamanho"] += estado.get("content_length", 0)
+            await send(message)
+            if tipo == "http.response.pathsend" or (tipo == "http.response.body" and not message.get("more_body")):
+                terminar()
+
+        try:
+            await self.app(scope, receive, send_medindo)
+        finally:
+            terminar()
+            _request_db_stats.reset(token)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
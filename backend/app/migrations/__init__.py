@@ -0,0 +1,148 @@
+import importlib
+import pkgutil
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, DateTime, MetaData, String, Table, inspect, select, text
+
+from ..database import Base
+from .. import models
+
+# ============================================================
+# Migrações versionadas
+# ============================================================
+#
+# Cada módulo em migrations/versions/ define:
+#   VERSION       -> identificador ordenável ("0001", "0002", ...)
+#   DESCRIPTION   -> texto curto exibido em `status`
+#   upgrade(conn) -> aplica a migração usando uma Connection síncrona
+#   TRANSACTIONAL -> (opcional, padrão True) False para migrações que não
+#                    podem rodar dentro de uma transação, como
+#                    CREATE INDEX CONCURRENTLY no Postgres
+#
+# As versões aplicadas ficam registradas na tabela schema_migrations.
+#
+# Uso:
+#   python -m backend.app.migrations upgrade
+#   python -m backend.app.migrations status
+#   python -m backend.app.migrations check
+
+# Metadata própria: a tabela de controle não faz parte dos modelos
+# (e não é afetada por Base.metadata.create_all/drop_all)
+_migrations_metadata = MetaData()
+schema_migrations = Table(
+    "schema_migrations",
+    _migrations_metadata,
+    Column("version", String, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+def load_migrations():
+    """Módulos de migrations/versions ordenados por VERSION"""
+    from . import versions
+
+    modulos = [
+        importlib.import_module(f"{versions.__name__}.{info.name}")
+        for info in pkgutil.iter_modules(versions.__path__)
+    ]
+    return sorted(modulos, key=lambda m: m.VERSION)
+
+
+def applied_versions(engine):
+    with engine.begin() as connection:
+        schema_migrations.create(connection, checkfirst=True)
+        return set(connection.execute(select(schema_migrations.c.version)).scalars())
+
+
+def _registrar(connection, migration):
+    connection.execute(schema_migrations.insert().values(
+        version=migration.VERSION,
+        description=migration.DESCRIPTION,
+        applied_at=datetime.now(timezone.utc).replace(tzinfo=None),
+    ))
+
+
+def upgrade(engine):
+    """Aplica, em ordem, as migrações ainda não registradas; devolve as versões aplicadas"""
+    aplicadas = applied_versions(engine)
+    novas = []
+    for migration in load_migrations():
+        if migration.VERSION in aplicadas:
+            continue
+        if getattr(migration, "TRANSACTIONAL", True):
+            with engine.begin() as connection:
+                migration.upgrade(connection)
+                _registrar(connection, migration)
+        else:
+            # Cada instrução é confirmada isoladamente; as migrações desse tipo
+            # precisam ser idempotentes (IF NOT EXISTS) para poderem ser repetidas
+            with engine.connect() as connection:
+                connection = connection.execution_options(isolation_level="AUTOCOMMIT")
+                migration.upgrade(connection)
+                _registrar(connection, migration)
+        novas.append(migration.VERSION)
+    return novas
+
+
+def status(engine):
+    """Lista (versão, descrição, aplicada?) de todas as migrações conhecidas"""
+    aplicadas = applied_versions(engine)
+    return [(m.VERSION, m.DESCRIPTION, m.VERSION in aplicadas) for m in load_migrations()]
+
+
+# ----------------------
+# Índices
+# ----------------------
+def create_index(connection, index):
+    """
+    Cria um índice (a cópia congelada declarada na migração), se ainda não existir.
+    No Postgres usa CREATE INDEX CONCURRENTLY (sem bloquear escritas na tabela),
+    o que exige uma conexão em AUTOCOMMIT. Um build concorrente interrompido deixa
+    o índice marcado como inválido; nesse caso ele é removido e recriado.
+    """
+    quote = connection.dialect.identifier_preparer.quote
+    nome = quote(index.name)
+    tabela = quote(index.table.name)
+    colunas = ", ".join(quote(c.name) for c in index.columns)
+    unique = "UNIQUE " if index.unique else ""
+
+    if connection.dialect.name == "postgresql":
+        invalido = connection.execute(text(
+            "SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :nome AND NOT i.indisvalid"
+        ), {"nome": index.name}).first()
+        if invalido:
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {nome}"))
+        connection.execute(text(f"CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS {nome} ON {tabela} ({colunas})"))
+    else:
+        connection.execute(text(f"CREATE {unique}INDEX IF NOT EXISTS {nome} ON {tabela} ({colunas})"))
+
+
+def check_indexes(engine):
+    """
+    Compara os índices declarados nos modelos com os existentes no banco.
+    Devolve {"faltando": [...], "sobrando": [...]} com entradas "tabela.indice".
+    Índices que sustentam PK/UNIQUE e os criados por DDL (busca textual) são ignorados.
+    """
+    inspector = inspect(engine)
+    tabelas_existentes = set(inspector.get_table_names())
+    faltando, sobrando = [], []
+
+    for table in Base.metadata.sorted_tables:
+        declarados = {index.name for index in table.indexes}
+        if table.name not in tabelas_existentes:
+            faltando.extend(f"{table.name}.{nome}" for nome in sorted(declarados))
+            continue
+        existentes = {
+            index["name"]
+            for index in inspector.get_indexes(table.name)
+            if not index.get("duplicates_constraint")
+        }
+        faltando.extend(f"{table.name}.{nome}" for nome in sorted(declarados - existentes))
+        sobrando.extend(
+            f"{table.name}.{nome}"
+            for nome in sorted(existentes - declarados - models.DDL_MANAGED_INDEXES)
+        )
+
+    return {"faltando": faltando, "sobrando": sobrando}
@@ -0,0 +1,35 @@
+import sys
+
+from ..database import engine
+from . import upgrade, status, check_indexes
+
+
+def main(argv):
+    comando = argv[0] if argv else "upgrade"
+
+    if comando == "upgrade":
+        aplicadas = upgrade(engine)
+        print(f"Migrações aplicadas: {', '.join(aplicadas)}" if aplicadas else "Banco já está atualizado")
+        return 0
+
+    if comando == "status":
+        for version, description, aplicada in status(engine):
+            print(f"[{'x' if aplicada else ' '}] {version} {description}")
+        return 0
+
+    if comando == "check":
+        resultado = check_indexes(engine)
+        for nome in resultado["faltando"]:
+            print(f"FALTANDO  {nome}")
+        for nome in resultado["sobrando"]:
+            print(f"SOBRANDO  {nome}")
+        if not resultado["faltando"] and not resultado["sobrando"]:
+            print("Índices do banco conferem com os modelos")
+        return 1 if resultado["faltando"] else 0
+
+    print("Uso: python -m backend.app.migrations [upgrade|status|check]")
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,93 @@
+"""Esquema inicial: as tabelas como existiam antes das migrações versionadas"""
+from sqlalchemy import Column, Date, ForeignKey, Integer, MetaData, String, Table, Text
+
+VERSION = "0001"
+DESCRIPTION = "Esquema inicial"
+
+# Cópia congelada do esquema desta versão. Não usa os modelos atuais: eles
+# continuam mudando (e disparam as DDLs de busca e de versão ao criar as
+# tabelas), e cada migração seguinte precisa encontrar o banco exatamente
+# como estava neste ponto
+metadata = MetaData()
+
+Table(
+    "usuarios", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("nome", String, nullable=False),
+    Column("email", String, unique=True, nullable=False),
+    Column("senha_hash", String, nullable=False),
+    Column("perfil", String),
+    Column("receive_notifications", Integer),
+)
+
+Table(
+    "eventos", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("nome", String, nullable=False),
+    Column("slug", String, unique=True, nullable=False),
+    Column("admin_id", Integer, ForeignKey("usuarios.id"), nullable=True),
+)
+
+Table(
+    "edicoes", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("ano", Integer, nullable=False),
+    Column("evento_id", Integer, ForeignKey("eventos.id"), nullable=False),
+    Column("slug", String(200), unique=True, index=True),
+    Column("descricao", Text, nullable=True),
+    Column("data_inicio", Date, nullable=True),
+    Column("data_fim", Date, nullable=True),
+    Column("local", String(500), nullable=True),
+    Column("site_url", String(500), nullable=True),
+)
+
+Table(
+    "autores", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("nome", String, nullable=False),
+    Column("sobrenome", String, nullable=False),
+    Column("slug", String, unique=True, nullable=True),
+)
+
+Table(
+    "artigos", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("titulo", String, nullable=False),
+    Column("resumo", String),
+    Column("area", String),
+    Column("palavras_chave", String),
+    Column("pdf_path", String),
+    Column("data_publicacao", Date),
+    Column("edicao_id", Integer, ForeignKey("edicoes.id"), nullable=False),
+)
+
+Table(
+    "artigo_autor", metadata,
+    Column("artigo_id", Integer, ForeignKey("artigos.id"), primary_key=True),
+    Column("autor_id", Integer, ForeignKey("autores.id"), primary_key=True),
+)
+
+Table(
+    "notificacoes", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("usuarios.id"), nullable=False),
+    Column("author_id", Integer, ForeignKey("autores.id"), nullable=False),
+    Column("is_active", Integer),
+    Column("created_at", Date),
+)
+
+Table(
+    "email_logs", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("usuarios.id"), nullable=False),
+    Column("article_id", Integer, ForeignKey("artigos.id"), nullable=False),
+    Column("author_id", Integer, ForeignKey("autores.id"), nullable=False),
+    Column("sent_at", Date),
+    Column("email_subject", String),
+    Column("status", String),
+)
+
+
+def upgrade(connection):
+    # Bancos anteriores às migrações já têm essas tabelas e ficam como estão
+    metadata.create_all(connection, checkfirst=True)
@@ -0,0 +1,109 @@
+"""Estruturas de busca textual para bancos criados antes de /artigos/busca"""
+from sqlalchemy import text
+
+VERSION = "0002"
+DESCRIPTION = "Busca textual em artigos (tsvector + GIN / FTS5)"
+TRANSACTIONAL = False
+
+# Linhas de artigos preenchidas por transação no backfill do Postgres
+BACKFILL_BATCH_SIZE = 5000
+
+# ----------------------
+# Postgres
+# ----------------------
+# Uma coluna GENERATED ... STORED adicionada a uma tabela existente reescreve
+# artigos inteira sob ACCESS EXCLUSIVE (leituras e escritas param até o fim).
+# Em vez disso, em passos que não bloqueiam o tráfego:
+#   1. coluna anulável sem default (só altera o catálogo; lock_timeout evita
+#      ficar na fila atrás de transações longas segurando o lock)
+#   2. trigger que preenche a coluna em INSERT/UPDATE a partir daí
+#   3. backfill das linhas antigas em lotes curtos, um commit por lote
+#   4. índice GIN com CREATE INDEX CONCURRENTLY
+PG_SEARCH_DOCUMENT = """
+    setweight(to_tsvector('portuguese', coalesce({row}titulo, '')), 'A') ||
+    setweight(to_tsvector('english', coalesce({row}titulo, '')), 'A') ||
+    setweight(to_tsvector('portuguese', coalesce({row}palavras_chave, '')), 'B') ||
+    setweight(to_tsvector('english', coalesce({row}palavras_chave, '')), 'B') ||
+    setweight(to_tsvector('portuguese', coalesce({row}resumo, '')), 'C') ||
+    setweight(to_tsvector('english', coalesce({row}resumo, '')), 'C')
+"""
+
+PG_STEPS = [
+    "SET lock_timeout = '5s'",
+    "ALTER TABLE artigos ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    "RESET lock_timeout",
+    f"""
+    CREATE OR REPLACE FUNCTION artigos_atualizar_search_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector := {PG_SEARCH_DOCUMENT.format(row="NEW.")};
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS artigos_search_vector ON artigos",
+    """
+    CREATE TRIGGER artigos_search_vector
+    BEFORE INSERT OR UPDATE OF titulo, resumo, palavras_chave ON artigos
+    FOR EACH ROW EXECUTE FUNCTION artigos_atualizar_search_vector()
+    """,
+]
+
+PG_BACKFILL = f"""
+    UPDATE artigos SET search_vector = {PG_SEARCH_DOCUMENT.format(row="")}
+    WHERE id IN (
+        SELECT id FROM artigos WHERE search_vector IS NULL
+        ORDER BY id LIMIT :limite
+    )
+"""
+
+# ----------------------
+# SQLite
+# ----------------------
+SQLITE_STEPS = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS artigos_fts USING fts5(
+        titulo, resumo, palavras_chave,
+        content='artigos', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_fts_ai AFTER INSERT ON artigos BEGIN
+        INSERT INTO artigos_fts(rowid, titulo, resumo, palavras_chave)
+        VALUES (new.id, new.titulo, new.resumo, new.palavras_chave);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_fts_ad AFTER DELETE ON artigos BEGIN
+        INSERT INTO artigos_fts(artigos_fts, rowid, titulo, resumo, palavras_chave)
+        VALUES ('delete', old.id, old.titulo, old.resumo, old.palavras_chave);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_fts_au AFTER UPDATE ON artigos BEGIN
+        INSERT INTO artigos_fts(artigos_fts, rowid, titulo, resumo, palavras_chave)
+        VALUES ('delete', old.id, old.titulo, old.resumo, old.palavras_chave);
+        INSERT INTO artigos_fts(rowid, titulo, resumo, palavras_chave)
+        VALUES (new.id, new.titulo, new.resumo, new.palavras_chave);
+    END
+    """,
+]
+
+
+def upgrade(connection):
+    # Conexão em AUTOCOMMIT: cada instrução (e cada lote do backfill) é
+    # confirmada isoladamente
+    if connection.dialect.name == "postgresql":
+        for ddl in PG_STEPS:
+            connection.execute(text(ddl))
+        while connection.execute(text(PG_BACKFILL), {"limite": BACKFILL_BATCH_SIZE}).rowcount:
+            pass
+        connection.execute(text(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_artigos_search_vector "
+            "ON artigos USING GIN (search_vector)"
+        ))
+    elif connection.dialect.name == "sqlite":
+        for ddl in SQLITE_STEPS:
+            connection.execute(text(ddl))
+        # Reindexa as linhas que já existiam antes da tabela FTS
+        connection.execute(text("INSERT INTO artigos_fts(artigos_fts) VALUES ('rebuild')"))
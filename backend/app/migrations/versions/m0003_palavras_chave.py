@@ -0,0 +1,81 @@
+"""Tabelas de palavras-chave normalizadas e backfill a partir de artigos.palavras_chave"""
+from sqlalchemy import Column, ForeignKey, Index, Integer, MetaData, String, Table, column, select, table, text
+
+from ...keywords import parse_palavras_chave
+
+VERSION = "0003"
+DESCRIPTION = "Palavras-chave normalizadas (palavras_chave, artigo_palavra_chave)"
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Cópia congelada das tabelas nesta versão (ver m0001)
+metadata = MetaData()
+
+Table("artigos", metadata, Column("id", Integer, primary_key=True))
+
+palavras_chave = Table(
+    "palavras_chave", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("nome", String, nullable=False),
+    Column("slug", String, unique=True, nullable=False),
+)
+
+artigo_palavra_chave = Table(
+    "artigo_palavra_chave", metadata,
+    Column("artigo_id", Integer, ForeignKey("artigos.id"), primary_key=True),
+    Column("palavra_chave_id", Integer, ForeignKey("palavras_chave.id"), primary_key=True),
+    Index("ix_artigo_palavra_chave_palavra_chave_id", "palavra_chave_id", "artigo_id"),
+)
+
+# Backfill: colunas lidas de artigos e palavras_chave nesta versão, sem os
+# modelos atuais. ON CONFLICT DO NOTHING (Postgres e SQLite) torna a
+# migração repetível sem duplicar termos nem vínculos
+artigos_lidos = table("artigos", column("id"), column("palavras_chave"))
+termos_lidos = table("palavras_chave", column("id"), column("slug"))
+
+INSERIR_TERMO = text(
+    "INSERT INTO palavras_chave (nome, slug) VALUES (:nome, :slug) ON CONFLICT DO NOTHING"
+)
+INSERIR_VINCULO = text(
+    "INSERT INTO artigo_palavra_chave (artigo_id, palavra_chave_id) "
+    "VALUES (:artigo_id, :palavra_chave_id) ON CONFLICT DO NOTHING"
+)
+
+
+def backfill(connection, batch_size: int = BACKFILL_BATCH_SIZE):
+    """Vincula os artigos existentes às palavras-chave do seu texto livre, em lotes por id"""
+    ultimo_id = 0
+    while True:
+        lote = connection.execute(
+            select(artigos_lidos.c.id, artigos_lidos.c.palavras_chave)
+            .where(artigos_lidos.c.id > ultimo_id, artigos_lidos.c.palavras_chave.isnot(None))
+            .order_by(artigos_lidos.c.id)
+            .limit(batch_size)
+        ).all()
+        if not lote:
+            return
+        ultimo_id = lote[-1][0]
+
+        por_artigo = [(artigo_id, parse_palavras_chave(texto)) for artigo_id, texto in lote]
+        termos = {}
+        for _, parsed in por_artigo:
+            for slug, nome in parsed.items():
+                termos.setdefault(slug, nome)
+        if not termos:
+            continue
+
+        connection.execute(INSERIR_TERMO, [{"nome": nome, "slug": slug} for slug, nome in termos.items()])
+        ids_por_slug = dict(connection.execute(
+            select(termos_lidos.c.slug, termos_lidos.c.id).where(termos_lidos.c.slug.in_(termos))
+        ).all())
+        connection.execute(INSERIR_VINCULO, [
+            {"artigo_id": artigo_id, "palavra_chave_id": ids_por_slug[slug]}
+            for artigo_id, parsed in por_artigo
+            for slug in parsed
+        ])
+
+
+def upgrade(connection):
+    palavras_chave.create(connection, checkfirst=True)
+    artigo_palavra_chave.create(connection, checkfirst=True)
+    backfill(connection)
@@ -0,0 +1,31 @@
+"""Índices das consultas por evento, autor e seguidores"""
+from sqlalchemy import Column, Index, Integer, MetaData, Table
+
+from .. import create_index
+
+VERSION = "0004"
+DESCRIPTION = "Índices de artigos.edicao_id, edicoes(evento_id, ano), artigo_autor.autor_id, notificacoes e email_logs"
+TRANSACTIONAL = False  # CREATE INDEX CONCURRENTLY não roda dentro de transação
+
+# Cópia congelada dos índices desta versão (ver m0001); as tabelas trazem só
+# as colunas indexadas
+metadata = MetaData()
+
+artigos = Table("artigos", metadata, Column("edicao_id", Integer))
+edicoes = Table("edicoes", metadata, Column("evento_id", Integer), Column("ano", Integer))
+artigo_autor = Table("artigo_autor", metadata, Column("artigo_id", Integer), Column("autor_id", Integer))
+notificacoes = Table("notificacoes", metadata, Column("user_id", Integer), Column("author_id", Integer))
+email_logs = Table("email_logs", metadata, Column("user_id", Integer))
+
+INDEXES = [
+    Index("ix_artigos_edicao_id", artigos.c.edicao_id),
+    Index("ix_edicoes_evento_id_ano", edicoes.c.evento_id, edicoes.c.ano),
+    Index("ix_artigo_autor_autor_id", artigo_autor.c.autor_id, artigo_autor.c.artigo_id),
+    Index("ix_notificacoes_user_id_author_id", notificacoes.c.user_id, notificacoes.c.author_id),
+    Index("ix_email_logs_user_id", email_logs.c.user_id),
+]
+
+
+def upgrade(connection):
+    for index in INDEXES:
+        create_index(connection, index)
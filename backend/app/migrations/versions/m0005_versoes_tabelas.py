@@ -0,0 +1,66 @@
+"""Contadores de versão por tabela, usados nos ETags das rotas GET"""
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, text
+
+VERSION = "0005"
+DESCRIPTION = "Versões das tabelas do catálogo (ETag / Last-Modified)"
+
+# Cópia congelada da tabela e dos triggers nesta versão (ver m0001)
+metadata = MetaData()
+
+versoes_tabelas = Table(
+    "versoes_tabelas", metadata,
+    Column("tabela", String, primary_key=True),
+    Column("versao", Integer, nullable=False),
+    Column("atualizado_em", DateTime, nullable=False),
+)
+
+TABELAS = [
+    "eventos", "edicoes", "autores", "artigos", "artigo_autor",
+    "palavras_chave", "artigo_palavra_chave", "usuarios",
+]
+
+PG_FUNCTION_DDL = """
+    CREATE OR REPLACE FUNCTION incrementar_versao_tabela() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO versoes_tabelas (tabela, versao, atualizado_em)
+        VALUES (TG_TABLE_NAME, 1, timezone('utc', now()))
+        ON CONFLICT (tabela) DO UPDATE
+        SET versao = versoes_tabelas.versao + 1, atualizado_em = EXCLUDED.atualizado_em;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+
+def version_trigger_ddl(dialect_name, tabelas):
+    """Triggers de versão desta migração (também reaproveitados pela m0007)"""
+    if dialect_name == "postgresql":
+        statements = [PG_FUNCTION_DDL]
+        for tabela in tabelas:
+            statements.append(f"DROP TRIGGER IF EXISTS versao_{tabela} ON {tabela}")
+            statements.append(
+                f"CREATE TRIGGER versao_{tabela} "
+                f"AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {tabela} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION incrementar_versao_tabela()"
+            )
+        return statements
+
+    statements = []
+    for tabela in tabelas:
+        for operacao in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(f"""
+                CREATE TRIGGER IF NOT EXISTS versao_{tabela}_{operacao.lower()}
+                AFTER {operacao} ON {tabela} BEGIN
+                    INSERT INTO versoes_tabelas (tabela, versao, atualizado_em)
+                    VALUES ('{tabela}', 1, CURRENT_TIMESTAMP)
+                    ON CONFLICT(tabela) DO UPDATE
+                    SET versao = versao + 1, atualizado_em = CURRENT_TIMESTAMP;
+                END
+            """)
+    return statements
+
+
+def upgrade(connection):
+    versoes_tabelas.create(connection, checkfirst=True)
+    for statement in version_trigger_ddl(connection.dialect.name, TABELAS):
+        connection.execute(text(statement))
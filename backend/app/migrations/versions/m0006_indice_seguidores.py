@@ -0,0 +1,19 @@
+"""Índice para buscar os seguidores de um autor (envio de notificações)"""
+from sqlalchemy import Column, Index, Integer, MetaData, Table
+
+from .. import create_index
+
+VERSION = "0006"
+DESCRIPTION = "Índice notificacoes(author_id, user_id)"
+TRANSACTIONAL = False  # CREATE INDEX CONCURRENTLY não roda dentro de transação
+
+# Cópia congelada do índice desta versão (ver m0001)
+metadata = MetaData()
+
+notificacoes = Table("notificacoes", metadata, Column("user_id", Integer), Column("author_id", Integer))
+
+INDEX = Index("ix_notificacoes_author_id_user_id", notificacoes.c.author_id, notificacoes.c.user_id)
+
+
+def upgrade(connection):
+    create_index(connection, INDEX)
@@ -0,0 +1,68 @@
+"""Texto completo extraído dos PDFs, com índice de busca próprio"""
+from sqlalchemy import Column, DateTime, ForeignKey, Integer, MetaData, String, Table, Text, text
+
+from .m0005_versoes_tabelas import version_trigger_ddl
+
+VERSION = "0007"
+DESCRIPTION = "Tabela artigos_texto (texto dos PDFs) e sua busca textual"
+
+# Cópia congelada da tabela e das DDLs de busca nesta versão (ver m0001)
+metadata = MetaData()
+
+Table("artigos", metadata, Column("id", Integer, primary_key=True))
+
+artigos_texto = Table(
+    "artigos_texto", metadata,
+    Column("artigo_id", Integer, ForeignKey("artigos.id", ondelete="CASCADE"), primary_key=True),
+    Column("pdf_sha256", String, nullable=False),
+    Column("texto", Text),
+    Column("status", String, nullable=False),
+    Column("erro", String),
+    Column("extraido_em", DateTime, nullable=False),
+)
+
+# A tabela nasce vazia nesta migração, então a coluna gerada não reescreve nada
+PG_SEARCH_DDL = [
+    """
+    ALTER TABLE artigos_texto ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('portuguese', coalesce(texto, '')) ||
+        to_tsvector('english', coalesce(texto, ''))
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_artigos_texto_search_vector ON artigos_texto USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS artigos_texto_fts USING fts5(
+        texto,
+        content='artigos_texto', content_rowid='artigo_id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_texto_fts_ai AFTER INSERT ON artigos_texto BEGIN
+        INSERT INTO artigos_texto_fts(rowid, texto) VALUES (new.artigo_id, new.texto);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_texto_fts_ad AFTER DELETE ON artigos_texto BEGIN
+        INSERT INTO artigos_texto_fts(artigos_texto_fts, rowid, texto) VALUES ('delete', old.artigo_id, old.texto);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_texto_fts_au AFTER UPDATE ON artigos_texto BEGIN
+        INSERT INTO artigos_texto_fts(artigos_texto_fts, rowid, texto) VALUES ('delete', old.artigo_id, old.texto);
+        INSERT INTO artigos_texto_fts(rowid, texto) VALUES (new.artigo_id, new.texto);
+    END
+    """,
+]
+
+
+def upgrade(connection):
+    artigos_texto.create(connection, checkfirst=True)
+    dialect_name = connection.dialect.name
+    search_ddl = PG_SEARCH_DDL if dialect_name == "postgresql" else SQLITE_SEARCH_DDL
+    for statement in search_ddl + version_trigger_ddl(dialect_name, ["artigos_texto"]):
+        connection.execute(text(statement))
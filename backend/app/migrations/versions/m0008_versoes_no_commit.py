@@ -0,0 +1,48 @@
+"""Triggers de versão do Postgres passam a atualizar versoes_tabelas só no COMMIT"""
+from sqlalchemy import text
+
+VERSION = "0008"
+DESCRIPTION = "Versões das tabelas incrementadas no COMMIT (Postgres)"
+
+# Cópia congelada das DDLs desta versão (ver m0001 e models.version_trigger_ddl)
+TABELAS = [
+    "eventos", "edicoes", "autores", "artigos", "artigo_autor",
+    "palavras_chave", "artigo_palavra_chave", "usuarios", "artigos_texto",
+]
+
+PG_FUNCTION_DDL = """
+    CREATE OR REPLACE FUNCTION incrementar_versao_tabela() RETURNS trigger AS $$
+    BEGIN
+        IF current_setting('versoes_tabelas.' || TG_TABLE_NAME, true) = '1' THEN
+            RETURN NULL;
+        END IF;
+        PERFORM set_config('versoes_tabelas.' || TG_TABLE_NAME, '1', true);
+        INSERT INTO versoes_tabelas (tabela, versao, atualizado_em)
+        VALUES (TG_TABLE_NAME, 1, timezone('utc', now()))
+        ON CONFLICT (tabela) DO UPDATE
+        SET versao = versoes_tabelas.versao + 1, atualizado_em = EXCLUDED.atualizado_em;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+
+def upgrade(connection):
+    # No SQLite os escritores já são serializados pelo banco; nada muda
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(text(PG_FUNCTION_DDL))
+    for tabela in TABELAS:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS versao_{tabela} ON {tabela}"))
+        connection.execute(text(f"DROP TRIGGER IF EXISTS versao_{tabela}_truncate ON {tabela}"))
+        connection.execute(text(
+            f"CREATE CONSTRAINT TRIGGER versao_{tabela} "
+            f"AFTER INSERT OR UPDATE OR DELETE ON {tabela} "
+            f"DEFERRABLE INITIALLY DEFERRED "
+            f"FOR EACH ROW EXECUTE FUNCTION incrementar_versao_tabela()"
+        ))
+        connection.execute(text(
+            f"CREATE TRIGGER versao_{tabela}_truncate "
+            f"AFTER TRUNCATE ON {tabela} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION incrementar_versao_tabela()"
+        ))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Date, ForeignKey, Table, Text, Index, func
+from sqlalchemy import Column, Integer, String, DateTime, Date, ForeignKey, Table, Text, Index, DDL, event, func
 from sqlalchemy.orm import relationship
 from .database import Base
 import re, unicodedata
@@ -34,11 +34,25 @@ def gerar_slug_generico(*partes):
 # ============================================================
 
 # Tabela de associação entre artigos e autores
+# A PK (artigo_id, autor_id) atende "autores do artigo"; o índice
+# (autor_id, artigo_id) atende "artigos do autor"
 artigo_autor = Table(
     'artigo_autor',
     Base.metadata,
     Column('artigo_id', Integer, ForeignKey('artigos.id'), primary_key=True),
-    Column('autor_id', Integer, ForeignKey('autores.id'), primary_key=True)
+    Column('autor_id', Integer, ForeignKey('autores.id'), primary_key=True),
+    Index('ix_artigo_autor_autor_id', 'autor_id', 'artigo_id')
+)
+
+# Tabela de associação entre artigos e palavras-chave
+# O índice (palavra_chave_id, artigo_id) atende o filtro por palavra-chave;
+# a PK (artigo_id, palavra_chave_id) atende o caminho inverso
+artigo_palavra_chave = Table(
+    'artigo_palavra_chave',
+    Base.metadata,
+    Column('artigo_id', Integer, ForeignKey('artigos.id'), primary_key=True),
+    Column('palavra_chave_id', Integer, ForeignKey('palavras_chave.id'), primary_key=True),
+    Index('ix_artigo_palavra_chave_palavra_chave_id', 'palavra_chave_id', 'artigo_id')
 )
 
 
@@ -79,6 +93,11 @@ class Edition(Base):
     local = Column(String(500), nullable=True)
     site_url = Column(String(500), nullable=True)
     
+    # Edições de um evento, e a edição de um evento em um ano
+    __table_args__ = (
+        Index('ix_edicoes_evento_id_ano', 'evento_id', 'ano'),
+    )
+    
     # Relacionamentos
     event = relationship("Event", back_populates="editions")
     articles = relationship("Article", back_populates="edition")
@@ -118,11 +137,49 @@ class Article(Base):
     palavras_chave = Column(String)
     pdf_path = Column(String)
     data_publicacao = Column(Date)
-    edicao_id = Column(Integer, ForeignKey("edicoes.id"), nullable=False)
+    edicao_id = Column(Integer, ForeignKey("edicoes.id"), nullable=False, index=True)
     
     # Relacionamentos
     edition = relationship("Edition", back_populates="articles")
     authors = relationship("Author", secondary=artigo_autor, back_populates="articles")
+    keywords = relationship("Keyword", secondary=artigo_palavra_chave, back_populates="articles")
+
+
+# -------------------------------
+# Modelo: Texto extraído do PDF do artigo
+# -------------------------------
+class ArticleText(Base):
+    """
+    Texto completo do PDF, preenchido em segundo plano por pdf_text.py.
+    Fica fora de Article (e de ArticleRead) para não pesar nas listagens.
+    """
+    __tablename__ = "artigos_texto"
+
+    artigo_id = Column(Integer, ForeignKey("artigos.id", ondelete="CASCADE"), primary_key=True)
+    pdf_sha256 = Column(String, nullable=False)  # PDF de onde o texto saiu; outro PDF -> nova extração
+    texto = Column(Text)
+    status = Column(String, nullable=False)  # ok | vazio | erro
+    erro = Column(String)
+    extraido_em = Column(DateTime, nullable=False)
+
+
+# -------------------------------
+# Modelo: Palavra-chave
+# -------------------------------
+class Keyword(Base):
+    __tablename__ = "palavras_chave"
+
+    id = Column(Integer, primary_key=True, index=True)
+    nome = Column(String, nullable=False)
+    slug = Column(String, unique=True, nullable=False)
+
+    # Relacionamentos
+    articles = relationship("Article", secondary=artigo_palavra_chave, back_populates="keywords")
+
+    def __init__(self, nome, **kwargs):
+        super().__init__(nome=nome, **kwargs)
+        if not kwargs.get('slug'):  # Só gera slug se não foi fornecido
+            self.slug = gerar_slug_generico(nome)
 
 
 # -------------------------------
@@ -155,6 +212,12 @@ class Notification(Base):
     is_active = Column(Integer, default=1)
     created_at = Column(Date, default=func.current_date())
     
+    __table_args__ = (
+        Index('ix_notificacoes_user_id_author_id', 'user_id', 'author_id'),
+        # Seguidores de um autor (envio de notificações)
+        Index('ix_notificacoes_author_id_user_id', 'author_id', 'user_id'),
+    )
+    
     # Relacionamentos
     user = relationship("User", back_populates="notifications")
     author = relationship("Author", back_populates="notifications")
@@ -167,9 +230,227 @@ class EmailLog(Base):
     __tablename__ = "email_logs"
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("usuarios.id"), nullable=False, index=True)
     article_id = Column(Integer, ForeignKey("artigos.id"), nullable=False)
     author_id = Column(Integer, ForeignKey("autores.id"), nullable=False)
     sent_at = Column(Date, default=func.current_date())
     email_subject = Column(String)
-    status = Column(String, default="sent")
\ No newline at end of file
+    status = Column(String, default="sent")
+
+
+# ============================================================
+# Busca textual (título, resumo e palavras-chave)
+# ============================================================
+#
+# Postgres: coluna tsvector (português + inglês) mantida por trigger, com índice GIN.
+# SQLite (TEST_MODE): tabela virtual FTS5 sincronizada por triggers.
+# Ficam fora do modelo Article porque não são portáveis entre os bancos;
+# a consulta correspondente está em search.py.
+
+# Coluna comum mantida por trigger (e não GENERATED ... STORED) para ficar
+# igual à criada pela migração 0002, que não pode reescrever artigos sob lock
+PG_SEARCH_DDL = [
+    "ALTER TABLE artigos ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE OR REPLACE FUNCTION artigos_atualizar_search_vector() RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('portuguese', coalesce(NEW.titulo, '')), 'A') ||
+            setweight(to_tsvector('english', coalesce(NEW.titulo, '')), 'A') ||
+            setweight(to_tsvector('portuguese', coalesce(NEW.palavras_chave, '')), 'B') ||
+            setweight(to_tsvector('english', coalesce(NEW.palavras_chave, '')), 'B') ||
+            setweight(to_tsvector('portuguese', coalesce(NEW.resumo, '')), 'C') ||
+            setweight(to_tsvector('english', coalesce(NEW.resumo, '')), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    "DROP TRIGGER IF EXISTS artigos_search_vector ON artigos",
+    """
+    CREATE TRIGGER artigos_search_vector
+    BEFORE INSERT OR UPDATE OF titulo, resumo, palavras_chave ON artigos
+    FOR EACH ROW EXECUTE FUNCTION artigos_atualizar_search_vector()
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_artigos_search_vector ON artigos USING GIN (search_vector)",
+]
+
+SQLITE_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS artigos_fts USING fts5(
+        titulo, resumo, palavras_chave,
+        content='artigos', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_fts_ai AFTER INSERT ON artigos BEGIN
+        INSERT INTO artigos_fts(rowid, titulo, resumo, palavras_chave)
+        VALUES (new.id, new.titulo, new.resumo, new.palavras_chave);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_fts_ad AFTER DELETE ON artigos BEGIN
+        INSERT INTO artigos_fts(artigos_fts, rowid, titulo, resumo, palavras_chave)
+        VALUES ('delete', old.id, old.titulo, old.resumo, old.palavras_chave);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_fts_au AFTER UPDATE ON artigos BEGIN
+        INSERT INTO artigos_fts(artigos_fts, rowid, titulo, resumo, palavras_chave)
+        VALUES ('delete', old.id, old.titulo, old.resumo, old.palavras_chave);
+        INSERT INTO artigos_fts(rowid, titulo, resumo, palavras_chave)
+        VALUES (new.id, new.titulo, new.resumo, new.palavras_chave);
+    END
+    """,
+]
+
+# Texto completo dos PDFs (artigos_texto): índice próprio, consultado depois
+# do índice de título/resumo/palavras-chave
+PG_TEXT_SEARCH_DDL = [
+    """
+    ALTER TABLE artigos_texto ADD COLUMN IF NOT EXISTS search_vector tsvector
+    GENERATED ALWAYS AS (
+        to_tsvector('portuguese', coalesce(texto, '')) ||
+        to_tsvector('english', coalesce(texto, ''))
+    ) STORED
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_artigos_texto_search_vector ON artigos_texto USING GIN (search_vector)",
+]
+
+SQLITE_TEXT_SEARCH_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS artigos_texto_fts USING fts5(
+        texto,
+        content='artigos_texto', content_rowid='artigo_id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_texto_fts_ai AFTER INSERT ON artigos_texto BEGIN
+        INSERT INTO artigos_texto_fts(rowid, texto) VALUES (new.artigo_id, new.texto);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_texto_fts_ad AFTER DELETE ON artigos_texto BEGIN
+        INSERT INTO artigos_texto_fts(artigos_texto_fts, rowid, texto) VALUES ('delete', old.artigo_id, old.texto);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS artigos_texto_fts_au AFTER UPDATE ON artigos_texto BEGIN
+        INSERT INTO artigos_texto_fts(artigos_texto_fts, rowid, texto) VALUES ('delete', old.artigo_id, old.texto);
+        INSERT INTO artigos_texto_fts(rowid, texto) VALUES (new.artigo_id, new.texto);
+    END
+    """,
+]
+
+# Índices criados pelas DDLs acima (não declarados no modelo); a verificação
+# de índices das migrações não deve acusá-los como sobrando
+DDL_MANAGED_INDEXES = {"ix_artigos_search_vector", "ix_artigos_texto_search_vector"}
+
+for _ddl in PG_SEARCH_DDL:
+    event.listen(Article.__table__, "after_create", DDL(_ddl).execute_if(dialect="postgresql"))
+for _ddl in SQLITE_SEARCH_DDL:
+    event.listen(Article.__table__, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+event.listen(
+    Article.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS artigos_fts").execute_if(dialect="sqlite")
+)
+for _ddl in PG_TEXT_SEARCH_DDL:
+    event.listen(ArticleText.__table__, "after_create", DDL(_ddl).execute_if(dialect="postgresql"))
+for _ddl in SQLITE_TEXT_SEARCH_DDL:
+    event.listen(ArticleText.__table__, "after_create", DDL(_ddl).execute_if(dialect="sqlite"))
+event.listen(
+    ArticleText.__table__, "before_drop",
+    DDL("DROP TABLE IF EXISTS artigos_texto_fts").execute_if(dialect="sqlite")
+)
+
+
+# ============================================================
+# Versões das tabelas (ETag)
+# ============================================================
+#
+# Cada escrita em uma tabela do catálogo incrementa o contador da tabela em
+# versoes_tabelas (via trigger, então vale também para importações e scripts
+# que não passam pelas rotas). As rotas GET derivam o ETag desses contadores
+# e respondem 304 sem executar a consulta principal (ver conditional.py).
+
+class TableVersion(Base):
+    __tablename__ = "versoes_tabelas"
+
+    tabela = Column(String, primary_key=True)
+    versao = Column(Integer, nullable=False, default=0)
+    atualizado_em = Column(DateTime, nullable=False)
+
+
+VERSIONED_TABLES = [
+    "eventos", "edicoes", "autores", "artigos", "artigo_autor",
+    "palavras_chave", "artigo_palavra_chave", "usuarios", "artigos_texto",
+]
+
+# Postgres: o upsert na linha da tabela em versoes_tabelas trava essa linha até
+# o fim da transação. Feito no meio dela, serializaria todos os escritores da
+# tabela (uma importação longa seguraria as demais escritas). Por isso o trigger
+# é de constraint, DEFERRABLE INITIALLY DEFERRED: só dispara no COMMIT, e o lock
+# dura apenas a confirmação. Triggers de constraint são sempre por linha; a
+# variável local da transação faz o upsert acontecer uma vez por tabela.
+# Como roda dentro da transação, a nova versão fica visível junto com os dados.
+PG_VERSION_FUNCTION_DDL = """
+    CREATE OR REPLACE FUNCTION incrementar_versao_tabela() RETURNS trigger AS $$
+    BEGIN
+        IF current_setting('versoes_tabelas.' || TG_TABLE_NAME, true) = '1' THEN
+            RETURN NULL;
+        END IF;
+        PERFORM set_config('versoes_tabelas.' || TG_TABLE_NAME, '1', true);
+        INSERT INTO versoes_tabelas (tabela, versao, atualizado_em)
+        VALUES (TG_TABLE_NAME, 1, timezone('utc', now()))
+        ON CONFLICT (tabela) DO UPDATE
+        SET versao = versoes_tabelas.versao + 1, atualizado_em = EXCLUDED.atualizado_em;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+"""
+
+
+def version_trigger_ddl(dialect_name):
+    """Instruções que instalam os triggers de versão em todas as VERSIONED_TABLES"""
+    if dialect_name == "postgresql":
+        statements = [PG_VERSION_FUNCTION_DDL]
+        for tabela in VERSIONED_TABLES:
+            statements.append(f"DROP TRIGGER IF EXISTS versao_{tabela} ON {tabela}")
+            statements.append(f"DROP TRIGGER IF EXISTS versao_{tabela}_truncate ON {tabela}")
+            statements.append(
+                f"CREATE CONSTRAINT TRIGGER versao_{tabela} "
+                f"AFTER INSERT OR UPDATE OR DELETE ON {tabela} "
+                f"DEFERRABLE INITIALLY DEFERRED "
+                f"FOR EACH ROW EXECUTE FUNCTION incrementar_versao_tabela()"
+            )
+            # TRUNCATE não aceita trigger de constraint; ele já trava a tabela
+            # inteira até o fim da transação, então o upsert imediato não piora nada
+            statements.append(
+                f"CREATE TRIGGER versao_{tabela}_truncate "
+                f"AFTER TRUNCATE ON {tabela} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION incrementar_versao_tabela()"
+            )
+        return statements
+
+    # SQLite já serializa os escritores (um por banco), então o upsert imediato
+    # não cria contenção nova. Não tem trigger por instrução: um por linha e por operação
+    statements = []
+    for tabela in VERSIONED_TABLES:
+        for operacao in ("INSERT", "UPDATE", "DELETE"):
+            statements.append(f"""
+                CREATE TRIGGER IF NOT EXISTS versao_{tabela}_{operacao.lower()}
+                AFTER {operacao} ON {tabela} BEGIN
+                    INSERT INTO versoes_tabelas (tabela, versao, atualizado_em)
+                    VALUES ('{tabela}', 1, CURRENT_TIMESTAMP)
+                    ON CONFLICT(tabela) DO UPDATE
+                    SET versao = versao + 1, atualizado_em = CURRENT_TIMESTAMP;
+                END
+            """)
+    return statements
+
+
+# Instalados depois que todas as tabelas existem
+for _dialect in ("postgresql", "sqlite"):
+    for _ddl in version_trigger_ddl(_dialect):
+        event.listen(Base.metadata, "after_create", DDL(_ddl).execute_if(dialect=_dialect))
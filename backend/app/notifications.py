@@ -0,0 +1,140 @@
+import logging
+import os
+from email.message import EmailMessage
+from typing import Optional
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+from .database import AsyncSessionLocal
+from .mail import SimulatedTransport, get_transport
+from .metrics import EMAILS
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Notificações de novos artigos para seguidores de autores
+# ============================================================
+#
+# As rotas que publicam artigos apenas agendam fan_out_article_notifications
+# como BackgroundTask: a resposta é enviada antes do envio dos emails, então a
+# latência do POST não depende do número de seguidores.
+#
+# O job busca os destinatários de todos os artigos em uma única consulta
+# (artigo_autor -> notificacoes -> usuarios), respeitando
+# User.receive_notifications e Notification.is_active, envia em lotes e
+# registra cada tentativa em email_logs. O envio usa o transporte de mail.py
+# (pool de conexões SMTP, ou simulação quando EMAIL_FROM não está configurado).
+
+NOTIFICATION_BATCH_SIZE = int(os.getenv("NOTIFICATION_BATCH_SIZE", "50"))
+
+STATUS_SENT = "sent"
+STATUS_FAILED = "failed"
+STATUS_SIMULATED = "simulated"
+
+
+async def find_recipients(db: AsyncSession, article_ids):
+    """
+    Um destinatário por (usuário, artigo). Se o usuário segue mais de um autor
+    do artigo, o email cita o primeiro deles (menor id).
+    """
+    stmt = (
+        select(
+            models.Article.id.label("article_id"),
+            models.Article.titulo,
+            models.Event.nome.label("evento"),
+            models.Author.id.label("author_id"),
+            models.Author.nome.label("autor_nome"),
+            models.Author.sobrenome.label("autor_sobrenome"),
+            models.User.id.label("user_id"),
+            models.User.nome.label("user_nome"),
+            models.User.email,
+        )
+        .select_from(models.artigo_autor)
+        .join(models.Notification, models.Notification.author_id == models.artigo_autor.c.autor_id)
+        .join(models.User, models.User.id == models.Notification.user_id)
+        .join(models.Author, models.Author.id == models.artigo_autor.c.autor_id)
+        .join(models.Article, models.Article.id == models.artigo_autor.c.artigo_id)
+        .join(models.Edition, models.Edition.id == models.Article.edicao_id)
+        .join(models.Event, models.Event.id == models.Edition.evento_id)
+        .where(
+            models.artigo_autor.c.artigo_id.in_(article_ids),
+            models.Notification.is_active == 1,
+            models.User.receive_notifications == 1,
+        )
+        .order_by(models.Article.id, models.User.id, models.Author.id)
+    )
+    destinatarios = {}
+    for row in (await db.execute(stmt)).mappings():
+        destinatarios.setdefault((row["user_id"], row["article_id"]), row)
+    return list(destinatarios.values())
+
+
+def build_message(destinatario, remetente=None):
+    autor = f"{destinatario['autor_nome']} {destinatario['autor_sobrenome']}"
+    msg = EmailMessage()
+    msg["From"] = remetente or os.getenv("EMAIL_FROM") or "biblioteca@localhost"
+    msg["To"] = destinatario["email"]
+    msg["Subject"] = f"Novo artigo de {autor} - {destinatario['titulo']}"
+    msg.set_content(
+        f"Olá {destinatario['user_nome']},\n\n"
+        f"Um novo artigo de {autor}, que você segue, foi publicado em nossa biblioteca digital:\n\n"
+        f"Título: {destinatario['titulo']}\n"
+        f"Evento: {destinatario['evento']}\n\n"
+        "Você pode visualizar o artigo acessando nossa plataforma.\n\n"
+        "Atenciosamente,\n"
+        "Equipe da Biblioteca Digital\n"
+    )
+    return msg
+
+
+async def send_batch(messages):
+    """
+    Envia um lote de mensagens pelo transporte configurado (mail.py), em
+    paralelo pelas conexões do pool. Devolve um status por mensagem, na mesma ordem.
+    """
+    transport = get_transport()
+    if isinstance(transport, SimulatedTransport):
+        await transport.send_many(messages)
+        return [STATUS_SIMULATED] * len(messages)
+
+    status = []
+    for msg, erro in zip(messages, await transport.send_many(messages)):
+        if erro is None:
+            status.append(STATUS_SENT)
+        else:
+            logger.error("Erro ao enviar email para %s: %s", msg["To"], erro)
+            status.append(STATUS_FAILED)
+    return status
+
+
+async def fan_out_article_notifications(article_ids, batch_size: Optional[int] = None):
+    """Notifica os seguidores dos autores dos artigos; devolve {status: quantidade}"""
+    batch_size = batch_size or NOTIFICATION_BATCH_SIZE
+    resumo = {}
+    if not article_ids:
+        return resumo
+
+    async with AsyncSessionLocal() as db:
+        destinatarios = await find_recipients(db, list(article_ids))
+        for inicio in range(0, len(destinatarios), batch_size):
+            lote = destinatarios[inicio:inicio + batch_size]
+            messages = [build_message(d) for d in lote]
+            status = await send_batch(messages)
+
+            await db.execute(insert(models.EmailLog), [
+                {
+                    "user_id": d["user_id"],
+                    "article_id": d["article_id"],
+                    "author_id": d["author_id"],
+                    "email_subject": msg["Subject"],
+                    "status": s,
+                }
+                for d, msg, s in zip(lote, messages, status)
+            ])
+            await db.commit()
+            for s in status:
+                resumo[s] = resumo.get(s, 0) + 1
+                EMAILS.inc(status=s)
+    return resumo
@@ -0,0 +1,69 @@
+import base64
+import binascii
+import json
+from typing import Optional
+
+from fastapi import HTTPException, Query
+
+# ============================================================
+# Paginação por cursor (keyset)
+# ============================================================
+#
+# Em vez de OFFSET, cada página guarda a chave da última linha enviada
+# e a próxima consulta começa com "WHERE id > :ultimo_id ORDER BY id".
+# Assim o banco usa o índice da chave primária e o custo de cada página
+# não cresce com a profundidade da navegação.
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+def encode_cursor(last_id: int) -> str:
+    """Gera um cursor opaco (base64 url-safe) a partir do último id enviado"""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Recupera o último id a partir do cursor; cursores inválidos geram 400"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        last_id = data["id"]
+    except (ValueError, KeyError, TypeError, binascii.Error, UnicodeError):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    if not isinstance(last_id, int):
+        raise HTTPException(status_code=400, detail="Cursor inválido")
+    return last_id
+
+
+class PageParams:
+    """Parâmetros de paginação (?limit=&after=) usados como dependência nas rotas de lista"""
+
+    def __init__(
+        self,
+        limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+        after: Optional[str] = Query(None),
+    ):
+        self.limit = limit
+        self.after = after
+
+
+async def paginate(db, stmt, key_column, params: PageParams):
+    """
+    Aplica a paginação por cursor a um SELECT ordenado por `key_column`
+    e devolve o envelope {"items": [...], "next": cursor | None}.
+    Busca limit + 1 linhas para saber se existe próxima página sem COUNT.
+    """
+    if params.after is not None:
+        stmt = stmt.where(key_column > decode_cursor(params.after))
+
+    result = await db.scalars(stmt.order_by(key_column).limit(params.limit + 1))
+    rows = result.all()
+
+    next_cursor = None
+    if len(rows) > params.limit:
+        rows = rows[:params.limit]
+        next_cursor = encode_cursor(getattr(rows[-1], key_column.key))
+
+    return {"items": rows, "next": next_cursor}
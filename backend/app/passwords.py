@@ -0,0 +1,140 @@
+import asyncio
+import base64
+import hashlib
+import hmac
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# ============================================================
+# Hash de senhas (scrypt)
+# ============================================================
+#
+# Formato armazenado em usuarios.senha_hash:
+#   scrypt$<n>$<r>$<p>$<salt base64>$<hash base64>
+# Senhas antigas (SHA-256 sem salt, 64 caracteres hex) continuam aceitas e são
+# regravadas no novo formato no primeiro login bem-sucedido.
+#
+# O scrypt é caro de propósito; nas rotas ele roda em um pool limitado de
+# threads (o hashlib libera o GIL durante o cálculo) ou de processos, para não
+# travar o event loop.
+#
+# Configuração (.env):
+#   PASSWORD_SCRYPT_N / _R / _P   custo (padrão 2**14, 8, 1)
+#   PASSWORD_HASH_WORKERS         tamanho do pool (padrão min(4, CPUs))
+#   PASSWORD_HASH_EXECUTOR        thread | process | inline (inline: no próprio loop, só para comparação)
+
+PASSWORD_SCRYPT_N = int(os.getenv("PASSWORD_SCRYPT_N", str(2 ** 14)))
+PASSWORD_SCRYPT_R = int(os.getenv("PASSWORD_SCRYPT_R", "8"))
+PASSWORD_SCRYPT_P = int(os.getenv("PASSWORD_SCRYPT_P", "1"))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread")
+
+SALT_BYTES = 16
+HASH_BYTES = 32
+
+_LEGACY_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+def _scrypt(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode("utf-8"), salt=salt, n=n, r=r, p=p, dklen=HASH_BYTES,
+        # O limite padrão do OpenSSL (32 MiB) não comporta n >= 2**15
+        maxmem=128 * r * (n + p + 2) + 1024 * 1024,
+    )
+
+
+def hash_password(password: str, n: int = None, r: int = None, p: int = None) -> str:
+    """Hasha a senha com scrypt e salt aleatório (síncrono: bloqueia quem chamar)"""
+    n = n or PASSWORD_SCRYPT_N
+    r = r or PASSWORD_SCRYPT_R
+    p = p or PASSWORD_SCRYPT_P
+    salt = os.urandom(SALT_BYTES)
+    return f"scrypt${n}${r}${p}${_b64(salt)}${_b64(_scrypt(password, salt, n, r, p))}"
+
+
+def is_legacy_hash(stored: str) -> bool:
+    return bool(stored) and bool(_LEGACY_SHA256.match(stored))
+
+
+def verify_password(password: str, stored: str) -> bool:
+    """Confere a senha com o hash armazenado (scrypt ou SHA-256 legado)"""
+    if not stored:
+        return False
+    if is_legacy_hash(stored):
+        legacy = hashlib.sha256(password.encode()).hexdigest()
+        return hmac.compare_digest(legacy, stored)
+    try:
+        algoritmo, n, r, p, salt, esperado = stored.split("$")
+        if algoritmo != "scrypt":
+            return False
+        calculado = _scrypt(password, base64.b64decode(salt), int(n), int(r), int(p))
+        esperado = base64.b64decode(esperado)
+    except ValueError:  # inclui binascii.Error (base64 corrompido)
+        return False
+    return hmac.compare_digest(calculado, esperado)
+
+
+def needs_rehash(stored: str) -> bool:
+    """True para hashes legados ou gerados com custo diferente do configurado"""
+    if is_legacy_hash(stored):
+        return True
+    try:
+        algoritmo, n, r, p, _, _ = stored.split("$")
+    except ValueError:
+        return True
+    return (algoritmo, int(n), int(r), int(p)) != ("scrypt", PASSWORD_SCRYPT_N, PASSWORD_SCRYPT_R, PASSWORD_SCRYPT_P)
+
+
+# ----------------------
+# Execução fora do event loop
+# ----------------------
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None and PASSWORD_HASH_EXECUTOR != "inline":
+        if PASSWORD_HASH_EXECUTOR == "process":
+            # spawn: um fork copiaria o estado do processo da API (conexões, threads, locks)
+            _executor = ProcessPoolExecutor(
+                max_workers=PASSWORD_HASH_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            _executor = ThreadPoolExecutor(max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="senha")
+    return _executor
+
+
+async def _run(func, *args):
+    executor = get_executor()
+    if executor is None:
+        return func(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+async def hash_password_async(password: str) -> str:
+    return await _run(hash_password, password)
+
+
+async def verify_password_async(password: str, stored: str) -> bool:
+    return await _run(verify_password, password, stored)
+
+
+_dummy_hash = None
+
+
+async def dummy_password_hash() -> str:
+    """
+    Hash de uma senha aleatória, com o custo atual. O login confere a senha
+    contra ele quando o email não existe, para que a resposta leve o mesmo
+    tempo e não revele quais emails estão cadastrados.
+    """
+    global _dummy_hash
+    if _dummy_hash is None:
+        _dummy_hash = await hash_password_async(_b64(os.urandom(SALT_BYTES)))
+    return _dummy_hash
@@ -0,0 +1,215 @@
+import hashlib
+import os
+import re
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+# ============================================================
+# Armazenamento de PDFs endereçado por conteúdo
+# ============================================================
+#
+# Cada PDF é gravado uma única vez, identificado pelo SHA-256 do conteúdo:
+#   <PDF_STORAGE_DIR>/ab/cd/abcd...ef.pdf
+# Dois diretórios de dois caracteres evitam pastas com milhares de arquivos.
+# Enviar o mesmo arquivo de novo não ocupa espaço: devolve o mesmo hash.
+#
+# Como o conteúdo de um hash nunca muda, as respostas de GET /pdfs/{sha256}
+# levam ETag forte (o próprio hash) e Cache-Control immutable.
+#
+# Configuração (.env):
+#   PDF_STORAGE_DIR            diretório raiz (padrão backend/uploads/pdfs)
+#   PDF_MAX_BYTES              tamanho máximo de upload (padrão 100 MiB)
+#   PDF_ACCEL_REDIRECT_PREFIX  se definido (ex.: /_pdfs/), a aplicação só responde
+#                              com X-Accel-Redirect e o nginx entrega o arquivo
+#                              (sendfile, Range) a partir de um location internal
+#   PDF_ZIP_WORKERS            threads que gravam os PDFs de um ZIP de anais
+#                              (padrão min(4, CPUs))
+
+PDF_STORAGE_DIR = os.getenv(
+    "PDF_STORAGE_DIR",
+    os.path.join(os.path.dirname(__file__), "..", "uploads", "pdfs"),
+)
+PDF_MAX_BYTES = int(os.getenv("PDF_MAX_BYTES", str(100 * 1024 * 1024)))
+PDF_ACCEL_REDIRECT_PREFIX = os.getenv("PDF_ACCEL_REDIRECT_PREFIX")
+PDF_ZIP_WORKERS = int(os.getenv("PDF_ZIP_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+CHUNK_SIZE = 1024 * 1024
+PDF_MAGIC = b"%PDF-"
+
+_SHA256 = re.compile(r"^[0-9a-f]{64}$")
+
+
+class InvalidPdf(ValueError):
+    pass
+
+
+class PdfTooLarge(ValueError):
+    pass
+
+
+def is_sha256(valor: str) -> bool:
+    return bool(_SHA256.match(valor or ""))
+
+
+def pdf_url(sha256: str) -> str:
+    return f"/pdfs/{sha256}"
+
+
+class PdfStorage:
+    def __init__(self, root: str = PDF_STORAGE_DIR, max_bytes: int = PDF_MAX_BYTES):
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+
+    def relative_path(self, sha256: str) -> str:
+        return os.path.join(sha256[:2], sha256[2:4], f"{sha256}.pdf")
+
+    def path_for(self, sha256: str) -> str:
+        return os.path.join(self.root, self.relative_path(sha256))
+
+    def exists(self, sha256: str) -> bool:
+        return is_sha256(sha256) and os.path.isfile(self.path_for(sha256))
+
+    def save(self, fileobj):
+        """
+        Grava o conteúdo de `fileobj` (lido em blocos, sem carregar tudo em
+        memória) e devolve (sha256, tamanho, novo). `novo` é False quando o
+        mesmo PDF já estava armazenado. Bloqueante: nas rotas, chamar em thread.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        digest = hashlib.sha256()
+        tamanho = 0
+        # Arquivo temporário no mesmo sistema de arquivos: o os.replace final é atômico
+        fd, temporario = tempfile.mkstemp(prefix=".upload-", suffix=".pdf", dir=self.root)
+        try:
+            with os.fdopen(fd, "wb") as destino:
+                while chunk := fileobj.read(CHUNK_SIZE):
+                    if tamanho == 0 and not chunk.startswith(PDF_MAGIC):
+                        raise InvalidPdf("Arquivo não é um PDF")
+                    tamanho += len(chunk)
+                    if tamanho > self.max_bytes:
+                        raise PdfTooLarge(f"PDF maior que {self.max_bytes} bytes")
+                    digest.update(chunk)
+                    destino.write(chunk)
+            if tamanho == 0:
+                raise InvalidPdf("Arquivo vazio")
+
+            sha256 = digest.hexdigest()
+            final = self.path_for(sha256)
+            if os.path.exists(final):
+                return sha256, tamanho, False
+            os.makedirs(os.path.dirname(final), exist_ok=True)
+            os.chmod(temporario, 0o644)
+            os.replace(temporario, final)
+            return sha256, tamanho, True
+        finally:
+            if os.path.exists(temporario):
+                os.remove(temporario)
+
+    def save_path(self, caminho: str):
+        with open(caminho, "rb") as f:
+            return self.save(f)
+
+
+storage = PdfStorage()
+
+
+# ----------------------
+# ZIP de anais
+# ----------------------
+def _zip_key(info: zipfile.ZipInfo):
+    """Chave BibTeX de um membro do ZIP ("anais/sbes-paper1.pdf" -> "sbes-paper1")"""
+    if info.is_dir():
+        return None
+    nome = info.filename.replace("\\", "/").rsplit("/", 1)[-1]
+    if info.filename.startswith("__MACOSX/") or nome.startswith("."):
+        return None
+    base, extensao = os.path.splitext(nome)
+    return base if extensao.lower() == ".pdf" and base else None
+
+
+def store_pdf_zip(fileobj, pdf_storage: PdfStorage = None, workers: int = None):
+    """
+    Grava no armazenamento por hash os PDFs de um ZIP e devolve
+    ({chave BibTeX: sha256}, erros). A chave é o nome do arquivo sem extensão.
+
+    `fileobj` precisa permitir seek (o índice do ZIP fica no fim do arquivo); o
+    UploadFile do FastAPI já vai para disco acima de 1 MiB. Cada membro é
+    descompactado em blocos direto para o arquivo temporário, então a memória
+    usada é de alguns blocos por thread, independente do tamanho do ZIP.
+    Bloqueante: nas rotas, chamar em thread.
+    """
+    pdf_storage = pdf_storage or storage
+    try:
+        arquivo = zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile:
+        raise InvalidPdf("Arquivo ZIP inválido")
+
+    pdfs, erros, membros = {}, [], []
+    with arquivo:
+        for info in arquivo.infolist():
+            chave = _zip_key(info)
+            if chave is None:
+                continue
+            if chave in pdfs:
+                erros.append({"id": chave, "erro": f"PDF repetido no ZIP: {info.filename}"})
+                continue
+            pdfs[chave] = None
+            membros.append((chave, info))
+
+        def gravar(membro):
+            chave, info = membro
+            try:
+                # Cada thread abre o próprio leitor; o ZipFile serializa os seeks no arquivo
+                with arquivo.open(info) as conteudo:
+                    return chave, pdf_storage.save(conteudo)[0], None
+            except (ValueError, zipfile.BadZipFile, NotImplementedError) as e:
+                return chave, None, str(e)
+
+        with ThreadPoolExecutor(max_workers=workers or PDF_ZIP_WORKERS, thread_name_prefix="pdf-zip") as executor:
+            for chave, sha256, erro in executor.map(gravar, membros):
+                if erro:
+                    del pdfs[chave]
+                    erros.append({"id": chave, "erro": erro})
+                else:
+                    pdfs[chave] = sha256
+    return pdfs, erros
+
+
+def import_legacy_pdfs(connection, uploads_dir: str, pdf_storage: PdfStorage = None):
+    """
+    Move para o armazenamento por hash os PDFs referenciados em artigos.pdf_path
+    com caminhos antigos (ex.: "uploads/arquivo.pdf") e reescreve pdf_path para
+    /pdfs/{sha256}. Arquivos ausentes são ignorados. Devolve quantos artigos mudaram.
+    """
+    from sqlalchemy import select, update
+    from . import models
+
+    pdf_storage = pdf_storage or storage
+    artigos = connection.execute(
+        select(models.Article.id, models.Article.pdf_path)
+        .where(models.Article.pdf_path.isnot(None), models.Article.pdf_path.notlike("/pdfs/%"))
+    ).all()
+    atualizados = 0
+    for artigo_id, pdf_path in artigos:
+        caminho = os.path.join(uploads_dir, os.path.basename(pdf_path))
+        if not os.path.isfile(caminho):
+            continue
+        try:
+            sha256, _, _ = pdf_storage.save_path(caminho)
+        except ValueError:
+            continue
+        connection.execute(
+            update(models.Article).where(models.Article.id == artigo_id).values(pdf_path=pdf_url(sha256))
+        )
+        atualizados += 1
+    return atualizados
+
+
+if __name__ == "__main__":
+    # python -m backend.app.pdf_storage  -> importa os PDFs antigos de backend/uploads
+    from .database import engine
+
+    uploads = os.path.join(os.path.dirname(__file__), "..", "uploads")
+    with engine.begin() as connection:
+        print(f"{import_legacy_pdfs(connection, uploads)} artigos atualizados")
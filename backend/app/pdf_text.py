@@ -0,0 +1,315 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+import re
+import zlib
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from sqlalchemy import bindparam, func, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from . import models, pdf_storage
+from .database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Extração do texto dos PDFs (segundo plano)
+# ============================================================
+#
+# Para cada artigo com PDF no armazenamento por hash (pdf_path = /pdfs/<sha256>)
+# e sem linha correspondente em artigos_texto, extrai o texto do PDF em um pool
+# de processos (a extração é CPU pura e seguraria o GIL), grava o texto
+# completo em artigos_texto (indexado para a busca) e preenche Article.resumo
+# quando ele está vazio.
+#
+# Idempotente e retomável: cada lote é gravado em sua própria transação e a
+# linha de artigos_texto guarda o sha256 do PDF processado. Rodar de novo só
+# pega o que falta (ou artigos cujo PDF mudou); PDFs que falharam ficam com
+# status "erro" e não são tentados outra vez até o PDF mudar.
+#
+# Execuções simultâneas (uma tarefa por cadastro/importação, mais o comando
+# abaixo) não repetem trabalho: no Postgres cada lote é reservado com
+# SELECT ... FOR UPDATE SKIP LOCKED, e as outras execuções pulam esses artigos.
+# As tarefas disparadas pelas rotas param depois de PDF_TEXT_BACKGROUND_LIMIT
+# artigos; o restante fica para a próxima tarefa ou para o comando.
+#
+# Usa pypdf quando instalado; sem ele, um extrator simples (streams sem
+# filtro ou FlateDecode, operadores Tj/TJ) cobre os PDFs gerados por LaTeX e
+# editores comuns com fontes não CID.
+#
+# Uso:
+#   python -m backend.app.pdf_text          (processa tudo o que estiver pendente)
+#
+# Configuração (.env):
+#   PDF_TEXT_WORKERS     processos de extração (padrão min(4, CPUs))
+#   PDF_TEXT_EXECUTOR    process | thread | inline (inline: no próprio loop, para testes)
+#   PDF_TEXT_BATCH_SIZE  artigos por transação (padrão 20)
+#   PDF_TEXT_BACKGROUND_LIMIT  artigos por tarefa disparada pelas rotas (padrão 100)
+#   PDF_TEXT_MAX_CHARS   limite de texto guardado por artigo (padrão 1.000.000)
+
+PDF_TEXT_WORKERS = int(os.getenv("PDF_TEXT_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_TEXT_EXECUTOR = os.getenv("PDF_TEXT_EXECUTOR", "process")
+PDF_TEXT_BATCH_SIZE = int(os.getenv("PDF_TEXT_BATCH_SIZE", "20"))
+PDF_TEXT_BACKGROUND_LIMIT = int(os.getenv("PDF_TEXT_BACKGROUND_LIMIT", "100"))
+PDF_TEXT_MAX_CHARS = int(os.getenv("PDF_TEXT_MAX_CHARS", "1000000"))
+RESUMO_MAX_CHARS = 1500
+
+STATUS_OK = "ok"
+STATUS_VAZIO = "vazio"
+STATUS_ERRO = "erro"
+
+PDF_URL_PREFIX = "/pdfs/"
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # dependência opcional
+    PdfReader = None
+
+
+# ----------------------
+# Extração (roda nos processos do pool)
+# ----------------------
+_STREAM = re.compile(rb"stream\r?\n(.*?)\r?\nendstream", re.S)
+_TEXT_OPERATOR = re.compile(
+    rb"(\((?:\\.|[^\\)])*\))\s*(?:Tj|'|\")"   # (texto) Tj
+    rb"|\[((?:\\.|[^\]\\])*)\]\s*TJ"            # [(te) -20 (xto)] TJ
+    rb"|\b(T\*|Td|TD|ET)\b",
+    re.S,
+)
+_TJ_PART = re.compile(rb"\((?:\\.|[^\\)])*\)|-?\d+(?:\.\d+)?")
+_ESCAPES = {b"n": b"\n", b"r": b"\r", b"t": b"\t", b"b": b"\b", b"f": b"\f"}
+
+
+def _unescape(literal: bytes) -> str:
+    """Conteúdo de uma string literal de PDF, sem os parênteses externos"""
+    def trocar(match):
+        seq = match.group(1)
+        if seq[:1].isdigit():
+            return bytes([int(seq, 8) & 0xFF])
+        if seq in (b"\n", b"\r\n", b"\r"):
+            return b""  # continuação de linha
+        return _ESCAPES.get(seq, seq)
+
+    corpo = re.sub(rb"\\([0-7]{1,3}|\r\n|.)", trocar, literal[1:-1], flags=re.S)
+    return corpo.decode("latin-1")
+
+
+def _text_from_content(conteudo: bytes) -> str:
+    partes = []
+    for match in _TEXT_OPERATOR.finditer(conteudo):
+        literal, array, operador = match.groups()
+        if literal:
+            partes.append(_unescape(literal))
+        elif array is not None:
+            for parte in _TJ_PART.findall(array):
+                if parte.startswith(b"("):
+                    partes.append(_unescape(parte))
+                elif float(parte) < -200:  # deslocamento grande = espaço entre palavras
+                    partes.append(" ")
+        elif operador == b"ET":
+            partes.append("\n")
+        else:
+            partes.append(" ")
+    return "".join(partes)
+
+
+def _extract_simple(caminho: str) -> str:
+    with open(caminho, "rb") as f:
+        dados = f.read()
+    textos = []
+    for match in _STREAM.finditer(dados):
+        # Dicionário do objeto: do último "obj" antes do stream até a palavra stream
+        cabecalho = dados[dados.rfind(b"obj", 0, match.start()):match.start()]
+        if b"/Image" in cabecalho or b"/Length1" in cabecalho or b"/Subtype" in cabecalho:
+            continue  # imagens e fontes embutidas
+        conteudo = match.group(1)
+        if b"/FlateDecode" in cabecalho:
+            try:
+                conteudo = zlib.decompress(conteudo)
+            except zlib.error:
+                continue
+        elif b"/Filter" in cabecalho:
+            continue  # outros filtros não carregam texto legível
+        textos.append(_text_from_content(conteudo))
+    return "\n".join(textos)
+
+
+def _extract_pypdf(caminho: str) -> str:
+    paginas, total = [], 0
+    for pagina in PdfReader(caminho).pages:
+        texto = pagina.extract_text() or ""
+        paginas.append(texto)
+        total += len(texto)
+        if total >= PDF_TEXT_MAX_CHARS:
+            break
+    return "\n".join(paginas)
+
+
+def normalize_text(texto: str) -> str:
+    # \x00 não é aceito em colunas de texto do Postgres
+    linhas = (" ".join(linha.replace("\x00", "").split()) for linha in texto.splitlines())
+    return "\n".join(linha for linha in linhas if linha)[:PDF_TEXT_MAX_CHARS]
+
+
+def extract_pdf_text(caminho: str):
+    """(texto, erro) de um PDF armazenado; executado nos processos do pool"""
+    try:
+        bruto = _extract_pypdf(caminho) if PdfReader is not None else _extract_simple(caminho)
+    except Exception as e:  # PDF corrompido não pode derrubar o lote
+        return None, f"{type(e).__name__}: {e}"
+    return normalize_text(bruto), None
+
+
+_INICIO_RESUMO = re.compile(r"\b(abstract|resumo)\b[\s.:\-–—]*", re.I)
+_FIM_RESUMO = re.compile(
+    r"\b(keywords|key words|index terms|palavras[- ]chave|(?:1\.?\s*)?introdu(?:ction|ção|cao))\b", re.I
+)
+
+
+def build_resumo(texto: str):
+    """
+    Resumo a partir do texto do PDF: o trecho entre "Abstract"/"Resumo" e
+    "Keywords"/"Introdução"; sem esses marcadores, o começo do texto.
+    """
+    if not texto:
+        return None
+    inicio = _INICIO_RESUMO.search(texto)
+    posicao = inicio.end() if inicio else 0
+    fim = _FIM_RESUMO.search(texto, posicao)
+    trecho = " ".join(texto[posicao:fim.start() if fim else None].split())
+    if len(trecho) > RESUMO_MAX_CHARS:
+        trecho = trecho[:RESUMO_MAX_CHARS].rsplit(" ", 1)[0] + "…"
+    return trecho or None
+
+
+# ----------------------
+# Pool de extração
+# ----------------------
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None and PDF_TEXT_EXECUTOR != "inline":
+        if PDF_TEXT_EXECUTOR == "thread":
+            _executor = ThreadPoolExecutor(max_workers=PDF_TEXT_WORKERS, thread_name_prefix="pdf-texto")
+        else:
+            # spawn: um fork copiaria o estado do processo da API (conexões
+            # abertas do pool, threads, locks em uso) para os workers
+            _executor = ProcessPoolExecutor(
+                max_workers=PDF_TEXT_WORKERS, mp_context=multiprocessing.get_context("spawn")
+            )
+    return _executor
+
+
+async def _extract_many(caminhos):
+    executor = get_executor()
+    if executor is None:
+        return [extract_pdf_text(caminho) for caminho in caminhos]
+    loop = asyncio.get_running_loop()
+    return await asyncio.gather(*(loop.run_in_executor(executor, extract_pdf_text, c) for c in caminhos))
+
+
+# ----------------------
+# Etapa em segundo plano
+# ----------------------
+def _pdf_sha256():
+    return func.substr(models.Article.pdf_path, len(PDF_URL_PREFIX) + 1)
+
+
+def select_pending(limit: int):
+    """
+    Artigos com PDF armazenado cujo texto ainda não foi extraído (ou cujo PDF mudou),
+    reservados até o commit do lote (FOR UPDATE SKIP LOCKED; ignorado no SQLite)
+    """
+    sha256 = _pdf_sha256()
+    sem_resumo = or_(models.Article.resumo.is_(None), models.Article.resumo == "")
+    return (
+        select(models.Article.id, sha256.label("sha256"), sem_resumo.label("sem_resumo"))
+        .outerjoin(models.ArticleText, models.ArticleText.artigo_id == models.Article.id)
+        .where(
+            models.Article.pdf_path.like(PDF_URL_PREFIX + "%"),
+            or_(models.ArticleText.artigo_id.is_(None), models.ArticleText.pdf_sha256 != sha256),
+        )
+        .order_by(models.Article.id)
+        .limit(limit)
+        # Só as linhas de artigos: o lado opcional de um outer join não pode ser travado
+        .with_for_update(skip_locked=True, of=models.Article)
+    )
+
+
+def _upsert_texts(dialect_name):
+    dialeto = postgresql if dialect_name == "postgresql" else sqlite
+    stmt = dialeto.insert(models.ArticleText)
+    colunas = ("pdf_sha256", "texto", "status", "erro", "extraido_em")
+    return stmt.on_conflict_do_update(
+        index_elements=[models.ArticleText.artigo_id],
+        set_={coluna: stmt.excluded[coluna] for coluna in colunas},
+    )
+
+
+# Só preenche resumos vazios: o resumo informado no cadastro ou no BibTeX prevalece
+_FILL_RESUMO = (
+    update(models.Article.__table__)
+    .where(
+        models.Article.__table__.c.id == bindparam("b_id"),
+        or_(models.Article.__table__.c.resumo.is_(None), models.Article.__table__.c.resumo == ""),
+    )
+    .values(resumo=bindparam("b_resumo"))
+)
+
+
+async def extract_pending_texts(batch_size: int = None, limit: int = None):
+    """
+    Processa os artigos pendentes em lotes e devolve os contadores da execução.
+    `limit` interrompe depois de N artigos (o restante fica para a próxima execução).
+    """
+    batch_size = batch_size or PDF_TEXT_BATCH_SIZE
+    relatorio = {"processados": 0, "resumos_preenchidos": 0, "erros": 0}
+
+    async with AsyncSessionLocal() as db:
+        upsert = _upsert_texts(db.get_bind().dialect.name)
+        while limit is None or relatorio["processados"] < limit:
+            tamanho = batch_size if limit is None else min(batch_size, limit - relatorio["processados"])
+            pendentes = (await db.execute(select_pending(tamanho))).all()
+            if not pendentes:
+                break
+
+            caminhos = [
+                pdf_storage.storage.path_for(sha256) if pdf_storage.is_sha256(sha256) else ""
+                for _, sha256, _ in pendentes
+            ]
+            resultados = await _extract_many(caminhos)
+
+            agora = datetime.now(timezone.utc).replace(tzinfo=None)
+            linhas, resumos = [], []
+            for (artigo_id, sha256, sem_resumo), (texto, erro) in zip(pendentes, resultados):
+                status = STATUS_ERRO if erro else (STATUS_OK if texto else STATUS_VAZIO)
+                linhas.append({
+                    "artigo_id": artigo_id, "pdf_sha256": sha256, "texto": texto,
+                    "status": status, "erro": erro, "extraido_em": agora,
+                })
+                resumo = build_resumo(texto) if sem_resumo else None
+                if resumo:
+                    resumos.append({"b_id": artigo_id, "b_resumo": resumo})
+                if erro:
+                    relatorio["erros"] += 1
+                    logger.warning("Falha ao extrair texto do PDF do artigo %s: %s", artigo_id, erro)
+
+            await db.execute(upsert, linhas)
+            if resumos:
+                # rowcount de um executemany não é confiável (-1 no asyncpg); as
+                # linhas estão reservadas, então o resumo continua vazio até o commit
+                await db.execute(_FILL_RESUMO, resumos)
+                relatorio["resumos_preenchidos"] += len(resumos)
+            await db.commit()
+            relatorio["processados"] += len(pendentes)
+
+    return relatorio
+
+
+if __name__ == "__main__":
+    print(asyncio.run(extract_pending_texts()))
@@ -0,0 +1,127 @@
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+
+# ============================================================
+# Pools de conexão instrumentados
+# ============================================================
+#
+# Subclasses dos pools do SQLAlchemy que medem quanto tempo cada checkout
+# esperou por uma conexão livre, quantos estouraram pool_timeout e o pico de
+# conexões em uso. Expostos em GET /internal/pool junto com os contadores
+# nativos do QueuePool (em uso, ociosas, overflow), para dimensionar:
+#
+#   workers * (DB_POOL_SIZE + DB_MAX_OVERFLOW) <= max_connections do Postgres
+#                                                 (menos as reservadas)
+#
+# Espera média alta com poucas conexões ociosas indica pool pequeno; muitas
+# ociosas o tempo todo indicam conexões presas à toa no Postgres.
+
+
+class PoolStats:
+    """Contadores de um pool; compartilhados entre recriações (engine.dispose)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.espera_total = 0.0
+            self.espera_max = 0.0
+            self.em_uso = 0
+            self.pico_em_uso = 0
+
+    def checkout(self, espera: float):
+        with self._lock:
+            self.checkouts += 1
+            self.espera_total += espera
+            self.espera_max = max(self.espera_max, espera)
+            self.em_uso += 1
+            self.pico_em_uso = max(self.pico_em_uso, self.em_uso)
+
+    def timeout(self, espera: float):
+        with self._lock:
+            self.timeouts += 1
+            self.espera_total += espera
+            self.espera_max = max(self.espera_max, espera)
+
+    def checkin(self):
+        with self._lock:
+            self.em_uso = max(0, self.em_uso - 1)
+
+    def snapshot(self):
+        with self._lock:
+            tentativas = self.checkouts + self.timeouts
+            return {
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "espera_media_ms": round(self.espera_total / tentativas * 1000, 3) if tentativas else 0.0,
+                "espera_max_ms": round(self.espera_max * 1000, 3),
+                "em_uso": self.em_uso,
+                "pico_em_uso": self.pico_em_uso,
+            }
+
+
+class _InstrumentedPool:
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.stats = PoolStats()
+
+    def _do_get(self):
+        inicio = time.perf_counter()
+        try:
+            conexao = super()._do_get()
+        except exc.TimeoutError:
+            self.stats.timeout(time.perf_counter() - inicio)
+            raise
+        self.stats.checkout(time.perf_counter() - inicio)
+        return conexao
+
+    def _do_return_conn(self, record):
+        self.stats.checkin()
+        super()._do_return_conn(record)
+
+    def recreate(self):
+        novo = super().recreate()
+        novo.stats = self.stats
+        return novo
+
+
+class InstrumentedQueuePool(_InstrumentedPool, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_InstrumentedPool, AsyncAdaptedQueuePool):
+    pass
+
+
+class InstrumentedNullPool(_InstrumentedPool, NullPool):
+    pass
+
+
+def pool_stats(engine):
+    """Estado atual do pool de uma engine (síncrona ou assíncrona)"""
+    pool = getattr(engine, "sync_engine", engine).pool
+    dados = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        dados.update({
+            "tamanho": pool.size(),
+            "max_overflow": pool._max_overflow,
+            "max_conexoes": pool.size() + max(pool._max_overflow, 0),
+            "timeout_s": pool.timeout(),
+            "ociosas": pool.checkedin(),
+            "overflow": max(pool.overflow(), 0),  # conexões abertas além de `tamanho`
+        })
+    dados["recycle_s"] = pool._recycle
+    dados["pre_ping"] = pool._pre_ping
+    stats = getattr(pool, "stats", None)
+    if stats is not None:
+        dados.update(stats.snapshot())
+    if isinstance(pool, QueuePool):
+        dados["em_uso"] = pool.checkedout()
+    return dados
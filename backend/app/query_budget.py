@@ -0,0 +1,165 @@
+import contextvars
+import logging
+import os
+import re
+from collections import Counter
+
+from sqlalchemy import event
+
+from .metrics import current_db_stats, route_template
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Orçamento de consultas por requisição
+# ============================================================
+#
+# Cada rota declara em configure_routes quantas consultas SQL pode fazer
+# (dependências query_budget(n)); rotas sem declaração usam
+# QUERY_BUDGET_DEFAULT. As consultas são contadas pelos eventos de cursor de
+# metrics.py. Ao começar a resposta, uma rota acima do orçamento gera um aviso
+# estruturado com a consulta mais repetida (com literais e listas IN
+# normalizados), que é o sinal típico de um laço de SELECT por item ou de
+# lazy load de relacionamento. Em TEST_MODE a requisição falha com
+# QueryBudgetExceeded, então a regressão aparece na suíte de testes.
+#
+# Uma resposta nunca falha depois de a escrita ter sido confirmada: em modo
+# raise o orçamento também é conferido antes de cada COMMIT da requisição
+# (a falha desfaz a transação), e consultas feitas depois do COMMIT só geram
+# o aviso. Rotas cujo número de consultas cresce com a entrada (lotes) somam
+# ao orçamento declarado com extend_query_budget.
+#
+# Configuração (.env):
+#   QUERY_BUDGET_DEFAULT  orçamento das rotas sem declaração (padrão 10)
+#   QUERY_BUDGET_MODE     warn | raise | off (padrão raise em TEST_MODE, senão warn)
+
+QUERY_BUDGET_DEFAULT = int(os.getenv("QUERY_BUDGET_DEFAULT", "10"))
+QUERY_BUDGET_MODE = os.getenv("QUERY_BUDGET_MODE", "raise" if os.getenv("TEST_MODE") else "warn")
+
+UNLIMITED = float("inf")
+
+
+class QueryBudgetExceeded(RuntimeError):
+    pass
+
+
+# Estado da requisição em andamento: {"scope", "confirmou", "respondendo"}.
+# Um dict mutável, e não valores no contextvar, para que o que as rotas e os
+# eventos do SQLAlchemy marcam seja visto pelo middleware
+_requisicao_atual = contextvars.ContextVar("query_budget_requisicao", default=None)
+
+
+def query_budget(max_queries):
+    """
+    Dependência que declara o orçamento da rota. None = sem limite, para rotas
+    cujo número de consultas cresce de propósito com a entrada (importação em lotes).
+    """
+    limite = UNLIMITED if max_queries is None else max_queries
+
+    async def declarar_orcamento():
+        stats = current_db_stats()
+        if stats is not None:
+            stats.budget = limite
+
+    return declarar_orcamento
+
+
+def extend_query_budget(consultas: int):
+    """Soma consultas ao orçamento da requisição atual (custo que cresce com o tamanho da entrada)"""
+    stats = current_db_stats()
+    if stats is not None and stats.budget is not None:
+        stats.budget += consultas
+
+
+_PARAMETRO = re.compile(r"\$\d+|%\(\w+\)s")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_LISTA = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """SQL sem literais e com listas IN colapsadas: consultas iguais a menos dos valores"""
+    forma = " ".join(statement.split())
+    forma = _PARAMETRO.sub("?", forma)
+    forma = _LITERAL.sub("?", forma)
+    return _LISTA.sub("(?, ...)", forma)
+
+
+def repeated_statement(statements: Counter):
+    """(forma, execuções) da consulta mais repetida"""
+    formas = Counter()
+    for statement, vezes in statements.items():
+        formas[statement_shape(statement)] += vezes
+    return formas.most_common(1)[0] if formas else (None, 0)
+
+
+def check_budget(scope, stats, falhar=True):
+    """Avisa quando a requisição passou do orçamento; em modo raise (e com falhar) levanta QueryBudgetExceeded"""
+    if stats is None:
+        return
+    orcamento = QUERY_BUDGET_DEFAULT if stats.budget is None else stats.budget
+    if stats.queries <= orcamento:
+        return
+
+    forma, vezes = repeated_statement(stats.statements)
+    detalhes = {
+        "method": scope["method"],
+        "route": route_template(scope),
+        "consultas": stats.queries,
+        "orcamento": orcamento,
+        "consulta_repetida": forma,
+        "repeticoes": vezes,
+    }
+    mensagem = (
+        f"{detalhes['method']} {detalhes['route']} fez {stats.queries} consultas "
+        f"(orçamento {orcamento}); mais repetida {vezes}x: {forma}"
+    )
+    logger.warning("Orçamento de consultas excedido: %s", mensagem, extra={"query_budget": detalhes})
+    if falhar and QUERY_BUDGET_MODE == "raise":
+        raise QueryBudgetExceeded(mensagem)
+
+
+def _antes_do_commit(conn):
+    requisicao = _requisicao_atual.get()
+    # Fora de requisições, ou tarefa em segundo plano depois da resposta
+    if requisicao is None or requisicao["respondendo"]:
+        return
+    if QUERY_BUDGET_MODE == "raise":
+        # Levantar aqui impede o COMMIT: a escrita é desfeita junto com a requisição
+        check_budget(requisicao["scope"], current_db_stats())
+    requisicao["confirmou"] = True
+
+
+def watch_commits(engine):
+    """Confere o orçamento antes dos COMMITs feitos pela engine (síncrona ou assíncrona); idempotente"""
+    engine = getattr(engine, "sync_engine", engine)
+    if not event.contains(engine, "commit", _antes_do_commit):
+        event.listen(engine, "commit", _antes_do_commit)
+
+
+class QueryBudgetMiddleware:
+    """
+    Confere o orçamento quando a resposta começa (só avisa se a requisição já
+    fez COMMIT). Precisa ficar dentro do MetricsMiddleware, que abre a
+    contagem de consultas da requisição.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or QUERY_BUDGET_MODE == "off":
+            return await self.app(scope, receive, send)
+
+        requisicao = {"scope": scope, "confirmou": False, "respondendo": False}
+        token = _requisicao_atual.set(requisicao)
+
+        async def send_verificando(message):
+            if message["type"] == "http.response.start":
+                requisicao["respondendo"] = True
+                check_budget(scope, current_db_stats(), falhar=not requisicao["confirmou"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_verificando)
+        finally:
+            _requisicao_atual.reset(token)
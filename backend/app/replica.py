@@ -0,0 +1,100 @@
+import logging
+import os
+import time
+
+from fastapi import Request
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# Roteamento de leituras para a réplica
+# ============================================================
+#
+# get_db (dependencies.py) entrega uma sessão da réplica para requisições
+# GET/HEAD e do primário para as demais (create_*, login, uploads...).
+#
+# - Atraso: o atraso da réplica é medido no máximo a cada DB_REPLICA_LAG_CHECK
+#   segundos; acima de DB_REPLICA_MAX_LAG (ou se a réplica não responder) as
+#   leituras voltam para o primário até a próxima medição.
+# - Ler o que escreveu: toda escrita grava o cookie db_primario_ate; enquanto
+#   ele valer (DB_STICKY_SECONDS), as leituras desse cliente vão para o
+#   primário e enxergam a própria escrita mesmo com a réplica atrasada.
+#   O frontend precisa enviar cookies (fetch com credentials: "include").
+#
+# Configuração (.env):
+#   DB_REPLICA_MAX_LAG    segundos de atraso tolerados (padrão 5)
+#   DB_REPLICA_LAG_CHECK  intervalo entre medições (padrão 1)
+#   DB_STICKY_SECONDS     leituras no primário após uma escrita (padrão 5)
+
+DB_REPLICA_MAX_LAG = float(os.getenv("DB_REPLICA_MAX_LAG", "5"))
+DB_REPLICA_LAG_CHECK = float(os.getenv("DB_REPLICA_LAG_CHECK", "1"))
+DB_STICKY_SECONDS = float(os.getenv("DB_STICKY_SECONDS", "5"))
+
+STICKY_COOKIE = "db_primario_ate"
+READ_METHODS = {"GET", "HEAD"}
+
+# Réplica em dia (mesmo LSN recebido e aplicado) conta como atraso zero: sem
+# isso, um primário ocioso faria o atraso crescer indefinidamente
+_PG_LAG_SQL = text("""
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+""")
+
+
+async def measure_lag(db: AsyncSession) -> float:
+    """Atraso da réplica em segundos"""
+    if db.get_bind().dialect.name != "postgresql":
+        return 0.0  # SQLite (testes): não há replicação a medir
+    return float((await db.execute(_PG_LAG_SQL)).scalar() or 0)
+
+
+class ReplicaHealth:
+    """Último atraso medido; a medição é refeita a cada DB_REPLICA_LAG_CHECK segundos"""
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.reset()
+
+    def reset(self):
+        self.lag = None
+        self.checked_at = None
+
+    async def usable(self, db: AsyncSession) -> bool:
+        agora = self.clock()
+        if self.checked_at is None or agora - self.checked_at >= DB_REPLICA_LAG_CHECK:
+            self.checked_at = agora
+            try:
+                self.lag = await measure_lag(db)
+            except Exception as e:  # réplica fora do ar: leituras vão para o primário
+                logger.warning("Réplica indisponível, lendo do primário: %s", e)
+                self.lag = None
+            else:
+                if self.lag > DB_REPLICA_MAX_LAG:
+                    logger.warning("Réplica com %.1fs de atraso, lendo do primário", self.lag)
+        return self.lag is not None and self.lag <= DB_REPLICA_MAX_LAG
+
+    def stats(self):
+        return {"atraso_s": self.lag, "max_atraso_s": DB_REPLICA_MAX_LAG}
+
+
+replica_health = ReplicaHealth()
+
+
+def is_read(request: Request) -> bool:
+    return request.method in READ_METHODS
+
+
+def is_sticky(request: Request) -> bool:
+    """True enquanto o cookie gravado pela última escrita do cliente vale"""
+    try:
+        return float(request.cookies.get(STICKY_COOKIE, 0)) > time.time()
+    except ValueError:
+        return False
+
+
+def sticky_cookie_value() -> str:
+    return f"{time.time() + DB_STICKY_SECONDS:.3f}"
@@ -1,219 +1,704 @@
-from fastapi import FastAPI, Depends, HTTPException
-from sqlalchemy.orm import Session
-from .database import SessionLocal
+from fastapi import FastAPI, Depends, HTTPException, UploadFile, File, Form, Query, BackgroundTasks, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import FileResponse
+from sqlalchemy import select, insert, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload, joinedload
+from .dependencies import get_db
 from . import models, schemas
-from typing import List
-import hashlib
-
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-def hash_password(password: str) -> str:
-    """Hasha a senha usando SHA256"""
-    return hashlib.sha256(password.encode()).hexdigest()
+from .pagination import PageParams, paginate, DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from .search import search_articles
+from .keywords import link_article_keywords
+from .bibtex_import import BibtexImporter, preview_bibtex
+from .conditional import conditional_get, table_version
+from .cache import event_cache, author_cache, cache_stats
+from .notifications import fan_out_article_notifications
+from typing import List, Optional
+from .passwords import hash_password_async, verify_password_async, needs_rehash, dummy_password_hash
+from .auth import create_access_token, get_current_user, get_optional_user, require_admin, PERFIL_ADMIN, PERFIL_USUARIO
+from . import pdf_storage
+from .pdf_text import extract_pending_texts, PDF_TEXT_BACKGROUND_LIMIT
+from .pool import pool_stats
+from . import database
+from .replica import replica_health
+from .metrics import CONTENT_TYPE, render_metrics
+from .query_budget import query_budget, extend_query_budget
+import os
 
 # ----------------------
 # Rotas para Eventos
 # ----------------------
-async def create_event(evento: schemas.EventoCreate, db: Session = Depends(get_db)):
+async def create_event(evento: schemas.EventoCreate, db: AsyncSession = Depends(get_db)):
     db_event = models.Event(nome=evento.nome, slug=evento.sigla, admin_id=evento.admin_id)
     db.add(db_event)
-    db.commit()
-    db.refresh(db_event)
+    await db.commit()
+    await db.refresh(db_event)
+    event_cache.invalidate()
     return db_event
 
-async def get_events(db: Session = Depends(get_db)):
-    return db.query(models.Event).all()
+async def get_events(page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await paginate(db, select(models.Event), models.Event.id, page)
 
 # ----------------------
 # Rotas para Edições
 # ----------------------
-async def create_edition(edicao: schemas.EditionCreate, db: Session = Depends(get_db)):
+async def create_edition(edicao: schemas.EditionCreate, db: AsyncSession = Depends(get_db)):
     db_edicao = models.Edition(**edicao.model_dump())
     db.add(db_edicao)
-    db.commit()
-    db.refresh(db_edicao)
+    await db.commit()
+    await db.refresh(db_edicao)
     return db_edicao
 
-async def get_editions(db: Session = Depends(get_db)):
-    return db.query(models.Edition).all()
+async def get_editions(page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await paginate(db, select(models.Edition), models.Edition.id, page)
 
 # ----------------------
 # Rotas para Autores
 # ----------------------
-async def create_author(autor: schemas.AuthorCreate, db: Session = Depends(get_db)):
+async def create_author(autor: schemas.AuthorCreate, db: AsyncSession = Depends(get_db)):
     db_autor = models.Author(**autor.model_dump())
     db.add(db_autor)
-    db.commit()
-    db.refresh(db_autor)
+    await db.commit()
+    await db.refresh(db_autor)
+    author_cache.invalidate()
     return db_autor
 
-async def get_authors(db: Session = Depends(get_db)):
-    return db.query(models.Author).all()
+async def get_authors(page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await paginate(db, select(models.Author), models.Author.id, page)
 
 # ----------------------
 # Rotas para Artigos
 # ----------------------
-async def create_article(artigo: schemas.ArticleCreate, db: Session = Depends(get_db)):
+def select_articles():
+    """
+    SELECT base para qualquer leitura de artigos que será serializada com ArticleRead.
+    Os autores são carregados em lote (SELECT ... WHERE artigo_id IN (...)),
+    evitando uma consulta extra por artigo.
+    """
+    return select(models.Article).options(selectinload(models.Article.authors))
+
+async def create_article(
+    artigo: schemas.ArticleCreate,
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
+    # Resolver autores com um único SELECT ... IN, mantendo a ordem informada
+    autores = {}
+    if artigo.author_ids:
+        autores = {
+            author.id: author
+            for author in (await db.scalars(
+                select(models.Author).where(models.Author.id.in_(artigo.author_ids))
+            )).all()
+        }
+
     db_artigo = models.Article(
         titulo=artigo.titulo,
         area=artigo.area,
         palavras_chave=artigo.palavras_chave,
         edicao_id=artigo.edicao_id,
-        pdf_path=artigo.pdf_path
+        pdf_path=artigo.pdf_path,
+        # Coleção sempre inicializada: após o commit não há lazy load pendente
+        authors=[autores[a] for a in dict.fromkeys(artigo.author_ids) if a in autores]
     )
     db.add(db_artigo)
-    
-    # Adicionar autores ao artigo
-    for author_id in artigo.author_ids:
-        author = db.query(models.Author).filter(models.Author.id == author_id).first()
-        if author:
-            db_artigo.authors.append(author)
-    
-    db.commit()
-    db.refresh(db_artigo)
+
+    await db.flush()
+    await link_article_keywords(db, [(db_artigo.id, artigo.palavras_chave)])
+
+    await db.commit()
+    # Emails para seguidores dos autores saem depois da resposta
+    background_tasks.add_task(fan_out_article_notifications, [db_artigo.id])
+    if db_artigo.pdf_path and db_artigo.pdf_path.startswith("/pdfs/"):
+        background_tasks.add_task(extract_pending_texts, limit=PDF_TEXT_BACKGROUND_LIMIT)
     return db_artigo
 
-async def get_articles(db: Session = Depends(get_db)):
-    return db.query(models.Article).all()
+MAX_BATCH_SIZE = 1000
+
+async def create_articles_batch(
+    artigos: list[schemas.ArticleCreate],
+    background_tasks: BackgroundTasks,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Cria vários artigos em uma única transação.
+    Edições e autores referenciados são resolvidos com um SELECT ... IN cada;
+    artigos e vínculos artigo_autor são inseridos em lote (executemany).
+    Itens inválidos são reportados individualmente sem abortar o restante do lote.
+    """
+    if len(artigos) > MAX_BATCH_SIZE:
+        raise HTTPException(status_code=413, detail=f"O lote aceita no máximo {MAX_BATCH_SIZE} artigos")
+
+    edicao_ids = {artigo.edicao_id for artigo in artigos}
+    author_ids = {author_id for artigo in artigos for author_id in artigo.author_ids}
+
+    edicoes_existentes = set((await db.scalars(
+        select(models.Edition.id).where(models.Edition.id.in_(edicao_ids))
+    )).all()) if edicao_ids else set()
+    autores_existentes = set((await db.scalars(
+        select(models.Author.id).where(models.Author.id.in_(author_ids))
+    )).all()) if author_ids else set()
+
+    resultados = [schemas.ArticleBatchItemResult(indice=i) for i in range(len(artigos))]
+    validos = []
+    for i, artigo in enumerate(artigos):
+        faltando = [a for a in artigo.author_ids if a not in autores_existentes]
+        if artigo.edicao_id not in edicoes_existentes:
+            resultados[i].erro = f"Edição {artigo.edicao_id} não encontrada"
+        elif faltando:
+            resultados[i].erro = f"Autores não encontrados: {faltando}"
+        else:
+            validos.append(i)
+
+    if validos:
+        # No SQLite o INSERT ... RETURNING ordenado roda uma vez por linha
+        extend_query_budget(len(validos))
+        novos_ids = (await db.scalars(
+            insert(models.Article).returning(models.Article.id, sort_by_parameter_order=True),
+            [
+                {
+                    "titulo": artigos[i].titulo,
+                    "area": artigos[i].area,
+                    "palavras_chave": artigos[i].palavras_chave,
+                    "edicao_id": artigos[i].edicao_id,
+                    "pdf_path": artigos[i].pdf_path,
+                }
+                for i in validos
+            ],
+        )).all()
+
+        vinculos = []
+        for i, artigo_id in zip(validos, novos_ids):
+            resultados[i].id = artigo_id
+            # dict.fromkeys remove ids repetidos mantendo a ordem (PK composta)
+            for author_id in dict.fromkeys(artigos[i].author_ids):
+                vinculos.append({"artigo_id": artigo_id, "autor_id": author_id})
+        if vinculos:
+            await db.execute(insert(models.artigo_autor), vinculos)
+        await link_article_keywords(db, [(resultados[i].id, artigos[i].palavras_chave) for i in validos])
+
+        await db.commit()
+        background_tasks.add_task(fan_out_article_notifications, list(novos_ids))
+
+    return {
+        "criados": len(validos),
+        "erros": len(artigos) - len(validos),
+        "resultados": resultados,
+    }
+
+async def get_articles(
+    palavra_chave: Optional[str] = None,
+    page: PageParams = Depends(),
+    db: AsyncSession = Depends(get_db)
+):
+    stmt = select_articles()
+    if palavra_chave is not None:
+        # Filtro pelo slug normalizado: usa o índice de artigo_palavra_chave
+        stmt = stmt.join(models.Article.keywords).where(
+            models.Keyword.slug == models.gerar_slug_generico(palavra_chave)
+        )
+    return await paginate(db, stmt, models.Article.id, page)
+
+# ----------------------
+# Rotas para Palavras-chave
+# ----------------------
+async def get_keywords(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """Palavras-chave mais usadas, com a quantidade de artigos de cada uma"""
+    total = func.count(models.artigo_palavra_chave.c.artigo_id).label("total_artigos")
+    result = await db.execute(
+        select(models.Keyword.id, models.Keyword.nome, models.Keyword.slug, total)
+        .join(models.artigo_palavra_chave)
+        .group_by(models.Keyword.id, models.Keyword.nome, models.Keyword.slug)
+        .order_by(total.desc(), models.Keyword.slug)
+        .limit(limit)
+    )
+    return result.mappings().all()
+
+async def search_articles_route(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """Busca textual em título, resumo e palavras-chave, ordenada por relevância"""
+    return await search_articles(db, q, limit, select_articles())
+
+# ----------------------
+# Rotas para Importação BibTeX
+# ----------------------
+async def upload_bibtex(
+    background_tasks: BackgroundTasks,
+    bibtex_file: UploadFile = File(...),
+    action: str = Form("preview"),
+    pdf_zip: Optional[UploadFile] = File(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Importa um arquivo BibTeX.
+    action=preview apenas interpreta as entradas; action=save grava em lotes
+    e devolve o relatório (processados, cadastrados, edições criadas, pulados, erros).
+    Com pdf_zip, os PDFs do ZIP são armazenados antes e ligados às entradas
+    pela chave BibTeX (sbes-paper1.pdf -> @inproceedings{sbes-paper1, ...}).
+    """
+    if action == "preview":
+        return await run_in_threadpool(preview_bibtex, bibtex_file.file)
+    if action == "save":
+        pdfs, erros_pdf = {}, []
+        if pdf_zip is not None:
+            try:
+                pdfs, erros_pdf = await run_in_threadpool(pdf_storage.store_pdf_zip, pdf_zip.file)
+            except pdf_storage.InvalidPdf as e:
+                raise HTTPException(status_code=400, detail=str(e))
+        importer = BibtexImporter(db, pdfs=pdfs)
+        relatorio = await importer.run(bibtex_file.file)
+        if pdf_zip is not None:
+            relatorio["pdfs"] = {
+                "armazenados": len(pdfs),
+                "associados": len(importer.pdfs_associados),
+                "nao_associados": sorted(pdfs.keys() - importer.pdfs_associados),
+                "erros": erros_pdf,
+            }
+        # A importação pode criar eventos e autores
+        event_cache.invalidate()
+        author_cache.invalidate()
+        background_tasks.add_task(fan_out_article_notifications, importer.artigos_criados)
+        if importer.pdfs_associados:
+            # Texto dos PDFs (e resumos ausentes) é extraído depois da resposta
+            background_tasks.add_task(extract_pending_texts, limit=PDF_TEXT_BACKGROUND_LIMIT)
+        return {"relatorio": relatorio}
+    raise HTTPException(status_code=400, detail="Ação inválida: use 'preview' ou 'save'")
+
+# ----------------------
+# Rotas para PDFs
+# ----------------------
+PDF_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+async def upload_pdf(pdf_file: UploadFile = File(...)):
+    """
+    Armazena um PDF pelo SHA-256 do conteúdo. O mesmo arquivo enviado duas
+    vezes é gravado uma vez só; a `url` devolvida vai em Article.pdf_path.
+    """
+    try:
+        sha256, tamanho, novo = await run_in_threadpool(pdf_storage.storage.save, pdf_file.file)
+    except pdf_storage.PdfTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except pdf_storage.InvalidPdf as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"sha256": sha256, "url": pdf_storage.pdf_url(sha256), "tamanho": tamanho, "duplicado": not novo}
+
+async def get_pdf(sha256: str, request: Request):
+    """
+    Entrega um PDF armazenado. Suporta Range (retomada de download e leitores que
+    buscam páginas sob demanda) e usa envio sem cópia quando o servidor oferece
+    (extensão ASGI pathsend, ou X-Accel-Redirect com nginx na frente).
+    """
+    if not pdf_storage.is_sha256(sha256):
+        raise HTTPException(status_code=404, detail="PDF não encontrado")
+
+    # O arquivo precisa existir antes de qualquer 304: um hash removido do
+    # armazenamento não pode continuar "válido" no cache do cliente
+    caminho = pdf_storage.storage.path_for(sha256)
+    try:
+        stat_result = await run_in_threadpool(os.stat, caminho)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="PDF não encontrado")
+
+    etag = f'"{sha256}"'
+    headers = {"ETag": etag, "Cache-Control": PDF_CACHE_CONTROL, "Accept-Ranges": "bytes"}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]:
+        return Response(status_code=304, headers=headers)
+
+    if pdf_storage.PDF_ACCEL_REDIRECT_PREFIX:
+        destino = pdf_storage.PDF_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + pdf_storage.storage.relative_path(sha256)
+        return Response(media_type="application/pdf", headers={**headers, "X-Accel-Redirect": destino.replace(os.sep, "/")})
+
+    return FileResponse(
+        caminho,
+        media_type="application/pdf",
+        headers=headers,
+        stat_result=stat_result,
+        filename=f"{sha256}.pdf",
+        content_disposition_type="inline",
+    )
 
 # ----------------------
 # Rotas para Usuários
 # ----------------------
-async def create_user(usuario: schemas.UserCreate, db: Session = Depends(get_db)):
+async def create_user(
+    usuario: schemas.UserCreate,
+    db: AsyncSession = Depends(get_db),
+    autor: Optional[schemas.TokenUser] = Depends(get_optional_user),
+):
     # Verifica se usuário já existe
-    db_user = db.query(models.User).filter(models.User.email == usuario.email).first()
+    db_user = await db.scalar(select(models.User).where(models.User.email == usuario.email))
     if db_user:
         raise HTTPException(status_code=400, detail="Email já cadastrado")
-    
+
+    # Só um administrador autenticado atribui perfis; o cadastro público
+    # sempre cria um usuário comum (o perfil vai no token e abre as rotas admin)
+    perfil = usuario.perfil if autor and autor.perfil == PERFIL_ADMIN else PERFIL_USUARIO
+
     db_usuario = models.User(
         nome=usuario.nome,
         email=usuario.email,
-        senha_hash=hash_password(usuario.senha_hash),
-        perfil=usuario.perfil,
+        senha_hash=await hash_password_async(usuario.senha_hash),
+        perfil=perfil,
         receive_notifications=1 if usuario.receive_notifications else 0
     )
     db.add(db_usuario)
-    db.commit()
-    db.refresh(db_usuario)
+    await db.commit()
+    await db.refresh(db_usuario)
     return db_usuario
 
-async def get_users(db: Session = Depends(get_db)):
-    return db.query(models.User).all()
+async def get_users(page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    return await paginate(db, select(models.User), models.User.id, page)
 
 # ----------------------
 # Rotas para Autenticação
 # ----------------------
-async def login(request: schemas.LoginRequest, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.email == request.email).first()
-    if not user or user.senha_hash != hash_password(request.password):
+async def login(request: schemas.LoginRequest, db: AsyncSession = Depends(get_db)):
+    user = await db.scalar(select(models.User).where(models.User.email == request.email))
+    # Email desconhecido também paga um scrypt: o tempo de resposta não
+    # diferencia "email inexistente" de "senha errada"
+    senha_hash = user.senha_hash if user else await dummy_password_hash()
+    if not await verify_password_async(request.password, senha_hash) or not user:
         raise HTTPException(status_code=401, detail="Email ou senha inválidos")
-    
+
+    # Hash legado (SHA-256) ou com custo antigo: regrava com os parâmetros atuais
+    if needs_rehash(user.senha_hash):
+        user.senha_hash = await hash_password_async(request.password)
+        await db.commit()
+
     return {
         "id": user.id,
         "nome": user.nome,
         "email": user.email,
         "perfil": user.perfil,
-        "access_token": "token_placeholder"
+        "access_token": create_access_token(user),
+        "token_type": "bearer"
     }
 
 # ----------------------
 # Rotas para Perfil do Usuário
 # ----------------------
-async def get_user_profile(user_id: int, db: Session = Depends(get_db)):
+async def get_user_profile(user_id: int, db: AsyncSession = Depends(get_db)):
     """Retorna o perfil do usuário logado"""
-    user = db.query(models.User).filter(models.User.id == user_id).first()
+    user = await db.get(models.User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="Usuário não encontrado")
     return user
 
-async def get_current_user_profile(db: Session = Depends(get_db)):
-    """Retorna o perfil do usuário atualmente logado (via token)"""
-    # Por enquanto, retorna um placeholder
-    # TODO: Implementar autenticação via JWT token
-    raise HTTPException(status_code=401, detail="Token não fornecido")
+async def get_current_user_profile(user: schemas.TokenUser = Depends(get_current_user)):
+    """Retorna o usuário atualmente logado, a partir das claims do token"""
+    return user
 
 # ----------------------
 # Rotas para Obter por ID ou Slug
 # ----------------------
-async def get_event_by_id_or_slug(event_id: str, db: Session = Depends(get_db)):
+async def get_event_by_id_or_slug(
+    event_id: str,
+    db: AsyncSession = Depends(get_db),
+    versao: int = Depends(table_version("eventos")),
+):
     """Retorna um evento por ID (número) ou slug (texto)"""
+    cached = event_cache.get((event_id, versao))
+    if cached is not None:
+        return cached
+
     event = None
-    
+
     # Tenta buscar por ID se for número
     if event_id.isdigit():
-        event = db.query(models.Event).filter(models.Event.id == int(event_id)).first()
-    
+        event = await db.scalar(select(models.Event).where(models.Event.id == int(event_id)))
+
     # Se não encontrou, tenta por slug
     if not event:
-        event = db.query(models.Event).filter(models.Event.slug == event_id).first()
-    
+        event = await db.scalar(select(models.Event).where(models.Event.slug == event_id))
+
     if not event:
         raise HTTPException(status_code=404, detail="Evento não encontrado")
-    return event
 
-async def get_author_by_id_or_slug(author_id: str, db: Session = Depends(get_db)):
-    """Retorna um autor por ID (número) ou slug (texto)"""
+    result = schemas.EventoRead.model_validate(event)
+    event_cache.set((event_id, versao), result)
+    return result
+
+async def find_author_by_id_or_slug(db: AsyncSession, author_id: str):
+    """Autor por ID (número) ou slug (texto); 404 se não existir"""
     author = None
-    
+
     if author_id.isdigit():
-        author = db.query(models.Author).filter(models.Author.id == int(author_id)).first()
-    
+        author = await db.scalar(select(models.Author).where(models.Author.id == int(author_id)))
+
     if not author:
-        author = db.query(models.Author).filter(models.Author.slug == author_id).first()
-    
+        author = await db.scalar(select(models.Author).where(models.Author.slug == author_id))
+
     if not author:
         raise HTTPException(status_code=404, detail="Autor não encontrado")
     return author
 
-async def get_edition_by_id(edition_id: int, db: Session = Depends(get_db)):
+async def get_author_by_id_or_slug(
+    author_id: str,
+    db: AsyncSession = Depends(get_db),
+    versao: int = Depends(table_version("autores")),
+):
+    """Retorna um autor por ID (número) ou slug (texto)"""
+    cached = author_cache.get((author_id, versao))
+    if cached is not None:
+        return cached
+
+    author = await find_author_by_id_or_slug(db, author_id)
+
+    result = schemas.AuthorRead.model_validate(author)
+    author_cache.set((author_id, versao), result)
+    return result
+
+MAX_COAUTHORS = 50
+
+async def get_coauthors(db: AsyncSession, author_id: int, limit: int = MAX_COAUTHORS):
+    """
+    Coautores mais frequentes de um autor, calculados no banco:
+    self-join de artigo_autor pelo artigo (índice (autor_id, artigo_id) no lado do autor)
+    """
+    autor = models.artigo_autor.alias("autor")
+    coautor = models.artigo_autor.alias("coautor")
+    total = func.count().label("total_artigos")
+    stmt = (
+        select(models.Author, total)
+        .select_from(autor)
+        .join(coautor, (coautor.c.artigo_id == autor.c.artigo_id) & (coautor.c.autor_id != autor.c.autor_id))
+        .join(models.Author, models.Author.id == coautor.c.autor_id)
+        .where(autor.c.autor_id == author_id)
+        .group_by(models.Author.id)
+        .order_by(total.desc(), models.Author.id)
+        .limit(limit)
+    )
+    return [
+        schemas.CoAuthorRead(**schemas.AuthorRead.model_validate(coauthor).model_dump(), total_artigos=total_artigos)
+        for coauthor, total_artigos in (await db.execute(stmt)).all()
+    ]
+
+async def get_author_articles(author_id: str, page: PageParams = Depends(), db: AsyncSession = Depends(get_db)):
+    """
+    Artigos de um autor (paginados por cursor), com edição e evento de cada artigo.
+    A primeira página inclui também a lista de coautores mais frequentes.
+    """
+    author = await find_author_by_id_or_slug(db, author_id)
+
+    stmt = (
+        select_articles()
+        .options(joinedload(models.Article.edition).joinedload(models.Edition.event))
+        .join(models.artigo_autor, models.artigo_autor.c.artigo_id == models.Article.id)
+        .where(models.artigo_autor.c.autor_id == author.id)
+    )
+    result = await paginate(db, stmt, models.Article.id, page)
+    result["autor"] = author
+    if page.after is None:
+        result["coautores"] = await get_coauthors(db, author.id)
+    return result
+
+async def get_lookup_cache_stats():
+    """Contadores dos caches de busca por ID/slug, para dimensionar LOOKUP_CACHE_SIZE/TTL"""
+    return cache_stats()
+
+async def get_metrics():
+    """Métricas no formato de texto do Prometheus"""
+    return Response(render_metrics(), media_type=CONTENT_TYPE)
+
+async def get_pool_stats():
+    """Estado do pool de conexões das rotas, para dimensionar DB_POOL_SIZE/DB_MAX_OVERFLOW"""
+    stats = {"primario": pool_stats(database.async_engine)}
+    if database.replica_async_engine is not None:
+        stats["replica"] = {**pool_stats(database.replica_async_engine), **replica_health.stats()}
+    return stats
+
+async def get_edition_by_id(edition_id: int, db: AsyncSession = Depends(get_db)):
     """Retorna uma edição específica"""
-    edition = db.query(models.Edition).filter(models.Edition.id == edition_id).first()
+    edition = await db.get(models.Edition, edition_id)
     if not edition:
         raise HTTPException(status_code=404, detail="Edição não encontrada")
     return edition
 
-async def get_article_by_id(article_id: int, db: Session = Depends(get_db)):
+async def get_article_by_id(article_id: int, db: AsyncSession = Depends(get_db)):
     """Retorna um artigo específico"""
-    article = db.query(models.Article).filter(models.Article.id == article_id).first()
+    article = await db.scalar(select_articles().where(models.Article.id == article_id))
     if not article:
         raise HTTPException(status_code=404, detail="Artigo não encontrado")
     return article
 
+async def get_event_summary(slug: str, db: AsyncSession = Depends(get_db)):
+    """
+    Retorna o evento, suas edições ordenadas por ano e, para cada edição, o total
+    de artigos e de autores distintos. Tudo vem de um único GROUP BY, com LEFT JOINs
+    para que eventos sem edições e edições sem artigos também apareçam.
+    """
+    stmt = (
+        select(
+            models.Event,
+            models.Edition,
+            func.count(models.Article.id.distinct()),
+            func.count(models.artigo_autor.c.autor_id.distinct()),
+        )
+        .select_from(models.Event)
+        .outerjoin(models.Edition, models.Edition.evento_id == models.Event.id)
+        .outerjoin(models.Article, models.Article.edicao_id == models.Edition.id)
+        .outerjoin(models.artigo_autor, models.artigo_autor.c.artigo_id == models.Article.id)
+        .where(models.Event.slug == slug)
+        .group_by(models.Event.id, models.Edition.id)
+        .order_by(models.Edition.ano, models.Edition.id)
+    )
+    rows = (await db.execute(stmt)).all()
+    if not rows:
+        raise HTTPException(status_code=404, detail="Evento não encontrado")
+
+    event = rows[0][0]
+    edicoes = [
+        schemas.EditionSummary(
+            **schemas.EditionRead.model_validate(edition).model_dump(),
+            total_artigos=total_artigos,
+            total_autores=total_autores,
+        )
+        for _, edition, total_artigos, total_autores in rows
+        if edition is not None
+    ]
+    return schemas.EventSummary(**schemas.EventoRead.model_validate(event).model_dump(), edicoes=edicoes)
+
+# ----------------------
+# Rotas aninhadas evento/ano
+# ----------------------
+def select_edition_by_event_year(slug: str, ano: int):
+    """
+    Edição de um evento em um ano, resolvida em uma única consulta:
+    eventos.slug (único) -> edicoes(evento_id, ano) pelo índice composto
+    """
+    return (
+        select(models.Edition)
+        .join(models.Event, models.Edition.evento_id == models.Event.id)
+        .where(models.Event.slug == slug, models.Edition.ano == ano)
+        .order_by(models.Edition.id)
+    )
+
+async def get_edition_by_event_year(slug: str, ano: int, db: AsyncSession = Depends(get_db)):
+    """Retorna a edição de um evento (pelo slug) em um ano"""
+    edition = (await db.scalars(select_edition_by_event_year(slug, ano).limit(1))).first()
+    if not edition:
+        raise HTTPException(status_code=404, detail="Edição não encontrada")
+    return edition
+
+async def get_edition_articles_by_event_year(slug: str, ano: int, db: AsyncSession = Depends(get_db)):
+    """
+    Retorna os artigos (com autores) da edição de um evento em um ano.
+    Evento, edição, artigos e autores vêm de uma única consulta com LEFT JOINs,
+    o que também distingue edição inexistente (404) de edição sem artigos ([]).
+    """
+    stmt = select_edition_by_event_year(slug, ano).options(
+        joinedload(models.Edition.articles).joinedload(models.Article.authors)
+    )
+    edition = (await db.scalars(stmt)).unique().first()
+    if not edition:
+        raise HTTPException(status_code=404, detail="Edição não encontrada")
+    return sorted(edition.articles, key=lambda article: article.id)
+
 def configure_routes(app: FastAPI):
+    # Orçamento de consultas SQL por requisição (query_budget.py): acima dele,
+    # aviso com a consulta mais repetida (erro em TEST_MODE). Leituras têm uma
+    # consulta de folga para a medição de atraso da réplica (replica.py)
+    def orcamento(max_queries):
+        return [Depends(query_budget(max_queries))]
+
+    # GET condicional: cada rota lista as tabelas das quais a resposta depende
+    eventos = [Depends(conditional_get("eventos"))] + orcamento(3)
+    edicoes = [Depends(conditional_get("edicoes"))] + orcamento(3)
+    autores = [Depends(conditional_get("autores"))] + orcamento(3)
+    artigos = [Depends(conditional_get("artigos", "artigo_autor", "autores"))] + orcamento(4)
+    artigos_filtrados = [Depends(conditional_get(
+        "artigos", "artigo_autor", "autores", "artigo_palavra_chave", "palavras_chave"
+    ))] + orcamento(4)
+    palavras_chave = [Depends(conditional_get("palavras_chave", "artigo_palavra_chave"))] + orcamento(3)
+    usuarios = [Depends(conditional_get("usuarios"))] + orcamento(3)
+
     # Rotas para eventos
-    app.post("/eventos/", response_model=schemas.EventoRead)(create_event)
-    app.get("/eventos/", response_model=List[schemas.EventoRead])(get_events)
-    
+    app.post("/eventos/", response_model=schemas.EventoRead, dependencies=orcamento(2))(create_event)
+    app.get("/eventos/", response_model=schemas.Page[schemas.EventoRead], dependencies=eventos)(get_events)
+
     # Rotas para edições
-    app.post("/edicoes/", response_model=schemas.EditionRead)(create_edition)
-    app.get("/edicoes/", response_model=List[schemas.EditionRead])(get_editions)
-    
+    app.post("/edicoes/", response_model=schemas.EditionRead, dependencies=orcamento(2))(create_edition)
+    app.get("/edicoes/", response_model=schemas.Page[schemas.EditionRead], dependencies=edicoes)(get_editions)
+
     # Rotas para autores
-    app.post("/autores/", response_model=schemas.AuthorRead)(create_author)
-    app.get("/autores/", response_model=List[schemas.AuthorRead])(get_authors)
-    
+    app.post("/autores/", response_model=schemas.AuthorRead, dependencies=orcamento(2))(create_author)
+    app.get("/autores/", response_model=schemas.Page[schemas.AuthorRead], dependencies=autores)(get_authors)
+
     # Rotas para artigos
-    app.post("/artigos/", response_model=schemas.ArticleRead)(create_article)
-    app.get("/artigos/", response_model=List[schemas.ArticleRead])(get_articles)
-    
-    # Rotas para usuários
-    app.post("/usuarios/", response_model=schemas.UserRead)(create_user)
-    app.get("/usuarios/", response_model=List[schemas.UserRead])(get_users)
+    app.post(
+        "/artigos/", response_model=schemas.ArticleRead, dependencies=[Depends(require_admin)] + orcamento(8)
+    )(create_article)
+    # Lote: 8 mais uma consulta por artigo válido (somada pela própria rota)
+    app.post(
+        "/artigos/lote", response_model=schemas.ArticleBatchResult,
+        dependencies=[Depends(require_admin)] + orcamento(8)
+    )(create_articles_batch)
+    app.get("/artigos/", response_model=schemas.Page[schemas.ArticleRead], dependencies=artigos_filtrados)(get_articles)
+    app.get(
+        "/artigos/busca",
+        response_model=List[schemas.ArticleRead],
+        dependencies=[Depends(conditional_get("artigos", "artigo_autor", "autores", "artigos_texto"))] + orcamento(6)
+    )(search_articles_route)
+
+    # Rotas para palavras-chave
+    app.get("/palavras-chave", response_model=List[schemas.KeywordRead], dependencies=palavras_chave)(get_keywords)
     
-    # Rotas para autenticação
-    app.post("/login/", response_model=schemas.LoginResponse)(login)
+    # Rotas para importação (as consultas crescem com o número de lotes: sem orçamento)
+    app.post("/upload-bibtex", dependencies=[Depends(require_admin)] + orcamento(None))(upload_bibtex)
+
+    # Rotas para PDFs (envio só por administradores; download público)
+    app.post(
+        "/pdfs", response_model=schemas.PdfUploadResult, dependencies=[Depends(require_admin)] + orcamento(0)
+    )(upload_pdf)
+    app.api_route("/pdfs/{sha256}", methods=["GET", "HEAD"], dependencies=orcamento(0))(get_pdf)
     
+    # Rotas para usuários
+    app.post("/usuarios/", response_model=schemas.UserRead, dependencies=orcamento(3))(create_user)
+    app.get("/usuarios/", response_model=schemas.Page[schemas.UserRead], dependencies=usuarios)(get_users)
+
+    # Rotas para autenticação (a terceira consulta regrava um hash de senha desatualizado)
+    app.post("/login/", response_model=schemas.LoginResponse, dependencies=orcamento(3))(login)
+
     # Rotas para perfil
-    app.get("/perfil/{user_id}", response_model=schemas.UserRead)(get_user_profile)
-    app.get("/me", response_model=schemas.UserRead)(get_current_user_profile)
-    
+    app.get("/perfil/{user_id}", response_model=schemas.UserRead, dependencies=usuarios)(get_user_profile)
+    app.get("/me", response_model=schemas.TokenUser, dependencies=orcamento(0))(get_current_user_profile)
+
     # Rotas para obter por ID ou slug (DEVEM VIR ANTES das rotas de lista genéricas)
-    app.get("/eventos/{event_id}", response_model=schemas.EventoRead)(get_event_by_id_or_slug)
-    app.get("/autores/{author_id}", response_model=schemas.AuthorRead)(get_author_by_id_or_slug)
-    app.get("/edicoes/{edition_id}", response_model=schemas.EditionRead)(get_edition_by_id)
-    app.get("/artigos/{article_id}", response_model=schemas.ArticleRead)(get_article_by_id)
\ No newline at end of file
+    app.get("/eventos/{event_id}", response_model=schemas.EventoRead, dependencies=eventos)(get_event_by_id_or_slug)
+    app.get("/autores/{author_id}", response_model=schemas.AuthorRead, dependencies=autores)(get_author_by_id_or_slug)
+    app.get("/edicoes/{edition_id}", response_model=schemas.EditionRead, dependencies=edicoes)(get_edition_by_id)
+    app.get("/artigos/{article_id}", response_model=schemas.ArticleRead, dependencies=artigos)(get_article_by_id)
+
+    # Artigos e coautores de um autor
+    app.get(
+        "/autores/{author_id}/artigos", response_model=schemas.AuthorArticlesPage,
+        dependencies=[Depends(conditional_get("autores", "artigos", "artigo_autor", "edicoes", "eventos"))] + orcamento(6)
+    )(get_author_articles)
+
+    # Resumo do evento (edições e contagens)
+    app.get(
+        "/eventos/{slug}/resumo", response_model=schemas.EventSummary,
+        dependencies=[Depends(conditional_get("eventos", "edicoes", "artigos", "artigo_autor"))] + orcamento(3)
+    )(get_event_summary)
+
+    # Rotas aninhadas evento/ano (o conversor :int deixa /eventos/{slug}/<texto> livre para outras rotas)
+    app.get(
+        "/eventos/{slug}/{ano:int}", response_model=schemas.EditionRead,
+        dependencies=[Depends(conditional_get("eventos", "edicoes"))] + orcamento(3)
+    )(get_edition_by_event_year)
+    app.get(
+        "/eventos/{slug}/{ano:int}/artigos", response_model=List[schemas.ArticleRead],
+        dependencies=[Depends(conditional_get("eventos", "edicoes", "artigos", "artigo_autor", "autores"))] + orcamento(3)
+    )(get_edition_articles_by_event_year)
+
+    # Rotas internas (observabilidade)
+    app.get("/internal/cache", dependencies=[Depends(require_admin)] + orcamento(0))(get_lookup_cache_stats)
+    app.get("/internal/pool", dependencies=[Depends(require_admin)] + orcamento(0))(get_pool_stats)
+    app.get("/metrics", include_in_schema=False, dependencies=orcamento(0))(get_metrics)
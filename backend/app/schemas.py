@@ -1,6 +1,15 @@
 from pydantic import BaseModel, EmailStr, ConfigDict
 from datetime import date
-from typing import List, Optional
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+# ----------------------
+# Paginação
+# ----------------------
+class Page(BaseModel, Generic[T]):
+    items: List[T]
+    next: Optional[str] = None  # cursor opaco para ?after=; None na última página
 
 # ----------------------
 # Evento
@@ -44,6 +53,13 @@ class EditionRead(EditionBase):
     
     model_config = ConfigDict(from_attributes=True)
 
+class EditionSummary(EditionRead):
+    total_artigos: int = 0
+    total_autores: int = 0  # autores distintos nos artigos da edição
+
+class EventSummary(EventoRead):
+    edicoes: List[EditionSummary] = []  # ordenadas por ano
+
 # ----------------------
 # Autor
 # ----------------------
@@ -61,6 +77,9 @@ class AuthorRead(BaseModel):
         "from_attributes": True  # <- substitui orm_mode
     }
 
+class CoAuthorRead(AuthorRead):
+    total_artigos: int  # artigos escritos em conjunto
+
 # ----------------------
 # Artigo
 # ----------------------
@@ -72,6 +91,16 @@ class ArticleCreate(BaseModel):
     edicao_id: int
     author_ids: list[int] = []
 
+class ArticleBatchItemResult(BaseModel):
+    indice: int  # posição do item no lote enviado
+    id: Optional[int] = None  # id do artigo criado, quando não houve erro
+    erro: Optional[str] = None
+
+class ArticleBatchResult(BaseModel):
+    criados: int
+    erros: int
+    resultados: list[ArticleBatchItemResult]
+
 class ArticleRead(BaseModel):
     id: int
     titulo: str
@@ -85,6 +114,33 @@ class ArticleRead(BaseModel):
         "from_attributes": True  # <- substitui orm_mode
     }
 
+class EditionWithEvent(EditionRead):
+    event: EventoRead
+
+class AuthorArticleRead(ArticleRead):
+    edition: EditionWithEvent
+
+class AuthorArticlesPage(Page[AuthorArticleRead]):
+    autor: AuthorRead
+    coautores: Optional[List[CoAuthorRead]] = None  # apenas na primeira página
+
+class PdfUploadResult(BaseModel):
+    sha256: str
+    url: str  # valor para Article.pdf_path
+    tamanho: int
+    duplicado: bool  # o mesmo conteúdo já estava armazenado
+
+# ----------------------
+# Palavra-chave
+# ----------------------
+class KeywordRead(BaseModel):
+    id: int
+    nome: str
+    slug: str
+    total_artigos: int = 0
+
+    model_config = ConfigDict(from_attributes=True)
+
 # ----------------------
 # Usuário
 # ----------------------
@@ -92,6 +148,7 @@ class UserCreate(BaseModel):
     nome: str
     email: EmailStr
     senha_hash: str
+    # Respeitado apenas quando quem cadastra é um administrador
     perfil: str = "usuario"
     receive_notifications: bool = True
 
@@ -131,4 +188,12 @@ class LoginResponse(BaseModel):
     nome: str
     email: str
     perfil: str
-    access_token: str
\ No newline at end of file
+    access_token: str
+    token_type: str = "bearer"
+
+class TokenUser(BaseModel):
+    """Usuário autenticado, lido das claims do token (sem consulta ao banco)"""
+    id: int
+    nome: str
+    email: Optional[str] = None
+    perfil: str
@@ -0,0 +1,90 @@
+import re
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from . import models
+
+# ============================================================
+# Busca textual de artigos
+# ============================================================
+#
+# A estrutura de índice é criada junto com a tabela artigos (ver o fim de
+# models.py). Aqui a busca acontece em duas etapas: o índice devolve apenas
+# os ids mais relevantes (limitados) e depois os artigos são carregados com
+# os autores em lote, como nas demais leituras de artigos. O texto completo
+# dos PDFs (artigos_texto, ver pdf_text.py) tem índice separado e completa
+# os resultados com menor prioridade.
+
+_PG_SEARCH_SQL = text("""
+    SELECT a.id
+    FROM artigos a,
+         (SELECT websearch_to_tsquery('portuguese', :q) || websearch_to_tsquery('english', :q) AS query) busca
+    WHERE a.search_vector @@ busca.query
+    ORDER BY ts_rank_cd(a.search_vector, busca.query) DESC, a.id
+    LIMIT :limit
+""")
+
+# bm25: pesos por coluna (titulo, resumo, palavras_chave); menor = mais relevante
+_SQLITE_SEARCH_SQL = text("""
+    SELECT rowid
+    FROM artigos_fts
+    WHERE artigos_fts MATCH :q
+    ORDER BY bm25(artigos_fts, 10.0, 1.0, 5.0), rowid
+    LIMIT :limit
+""")
+
+
+# Texto completo dos PDFs (artigos_texto): só completa a lista quando o
+# título/resumo/palavras-chave não bastam para preencher o limite
+_PG_TEXT_SEARCH_SQL = text("""
+    SELECT t.artigo_id
+    FROM artigos_texto t,
+         (SELECT websearch_to_tsquery('portuguese', :q) || websearch_to_tsquery('english', :q) AS query) busca
+    WHERE t.search_vector @@ busca.query
+    ORDER BY ts_rank_cd(t.search_vector, busca.query) DESC, t.artigo_id
+    LIMIT :limit
+""")
+
+_SQLITE_TEXT_SEARCH_SQL = text("""
+    SELECT rowid
+    FROM artigos_texto_fts
+    WHERE artigos_texto_fts MATCH :q
+    ORDER BY bm25(artigos_texto_fts), rowid
+    LIMIT :limit
+""")
+
+
+def _fts5_query(q: str):
+    """Converte o texto livre em termos FTS5 entre aspas (todos obrigatórios)"""
+    termos = re.findall(r"\w+", q)
+    return " ".join(f'"{termo}"' for termo in termos)
+
+
+async def search_article_ids(db: AsyncSession, q: str, limit: int):
+    """Ids dos artigos que casam com `q`, do mais para o menos relevante"""
+    if db.get_bind().dialect.name == "postgresql":
+        consulta, sql, sql_texto = q, _PG_SEARCH_SQL, _PG_TEXT_SEARCH_SQL
+    else:
+        consulta, sql, sql_texto = _fts5_query(q), _SQLITE_SEARCH_SQL, _SQLITE_TEXT_SEARCH_SQL
+        if not consulta:
+            return []
+    ids = [row[0] for row in await db.execute(sql, {"q": consulta, "limit": limit})]
+    if len(ids) < limit:
+        # Artigos que só casam pelo texto do PDF vêm depois dos demais
+        vistos = set(ids)
+        for (artigo_id,) in await db.execute(sql_texto, {"q": consulta, "limit": limit}):
+            if artigo_id not in vistos and len(ids) < limit:
+                ids.append(artigo_id)
+                vistos.add(artigo_id)
+    return ids
+
+
+async def search_articles(db: AsyncSession, q: str, limit: int, base_query):
+    """Carrega os artigos encontrados preservando a ordem de relevância"""
+    ids = await search_article_ids(db, q, limit)
+    if not ids:
+        return []
+    artigos = (await db.scalars(base_query.where(models.Article.id.in_(ids)))).all()
+    por_id = {artigo.id: artigo for artigo in artigos}
+    return [por_id[i] for i in ids if i in por_id]
@@ -1,14 +1,17 @@
 import hashlib
 import unicodedata
 import re
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-import smtplib
+from email.message import EmailMessage
 import os
 from dotenv import load_dotenv
+import logging
+from .mail import SimulatedTransport, get_transport
+from .metrics import EMAILS
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 def sha256(s: str) -> str:
     """Calcula o hash SHA-256 de uma string"""
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
@@ -34,10 +37,10 @@ def generate_slug(text: str) -> str:
     return text
 
 async def send_notification_email(to_email: str, author_name: str, article_title: str, event_name: str):
-    """Função para enviar email de notificação"""
+    """Função para enviar email de notificação (pelo transporte configurado em mail.py)"""
     try:
-        msg = MIMEMultipart()
-        msg['From'] = os.getenv("EMAIL_FROM")
+        msg = EmailMessage()
+        msg['From'] = os.getenv("EMAIL_FROM") or "biblioteca@localhost"
         msg['To'] = to_email
         msg['Subject'] = f"Novo artigo publicado - {article_title}"
         
@@ -55,17 +58,15 @@ async def send_notification_email(to_email: str, author_name: str, article_title
         Equipe da Biblioteca Digital
         """
         
-        msg.attach(MIMEText(body, 'plain'))
+        msg.set_content(body)
         
-        # Configurar servidor SMTP
-        server = smtplib.SMTP(os.getenv("SMTP_SERVER", "smtp.gmail.com"), 
-                             int(os.getenv("SMTP_PORT", "587")))
-        server.starttls()
-        server.login(os.getenv("EMAIL_FROM"), os.getenv("EMAIL_PASSWORD"))
-        text = msg.as_string()
-        server.sendmail(os.getenv("EMAIL_FROM"), to_email, text)
-        server.quit()
+        # Conexões SMTP reaproveitadas (pool), sem bloquear o event loop
+        transport = get_transport()
+        await transport.send(msg)
+        # Mesmo rótulo do fan-out (notifications.send_batch): simulação não conta como envio
+        EMAILS.inc(status="simulated" if isinstance(transport, SimulatedTransport) else "sent")
         return True
-    except Exception as e:
-        print(f"Erro ao enviar email: {e}")
+    except Exception:
+        logger.exception("Erro ao enviar email para %s", to_email)
+        EMAILS.inc(status="failed")
         return False
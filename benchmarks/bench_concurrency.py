@@ -0,0 +1,104 @@
+"""
+Benchmark de vazão concorrente das rotas de leitura.
+
+Dispara requisições concorrentes contra a aplicação FastAPI (via ASGI, sem
+rede) e mede requisições por segundo. Com rotas bloqueantes cada consulta
+trava o event loop e as requisições são atendidas uma a uma; com a engine
+assíncrona elas se sobrepõem enquanto esperam o banco.
+
+Uso:
+    python benchmarks/bench_concurrency.py --artigos 2000 --concorrencia 32 --requisicoes 640
+    python benchmarks/bench_concurrency.py --postgres   # usa DB_* do .env (banco já criado)
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artigos", type=int, default=2000, help="artigos semeados no banco")
+    parser.add_argument("--concorrencia", type=int, default=32, help="requisições simultâneas")
+    parser.add_argument("--requisicoes", type=int, default=640, help="total de requisições")
+    parser.add_argument("--rota", default="/artigos/?limit=50", help="rota exercitada")
+    parser.add_argument("--postgres", action="store_true", help="usa o Postgres configurado no .env")
+    return parser.parse_args()
+
+
+def preparar_banco(n_artigos):
+    """Cria as tabelas e semeia artigos com dois autores cada"""
+    from backend.app.database import Base, engine, SessionLocal
+    from backend.app.models import Event, Edition, Author, Article
+
+    engine.echo = False
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    evento = Event(nome="Evento Benchmark", slug="bench")
+    db.add(evento)
+    db.flush()
+    edicao = Edition(ano=2024, evento_id=evento.id)
+    db.add(edicao)
+    db.flush()
+    autores = [Author(nome="Autor", sobrenome=f"N{i}") for i in range(max(2, n_artigos // 4))]
+    db.add_all(autores)
+    for i in range(n_artigos):
+        artigo = Article(titulo=f"Artigo {i}", edicao_id=edicao.id)
+        artigo.authors.extend([autores[i % len(autores)], autores[(i + 1) % len(autores)]])
+        db.add(artigo)
+    db.commit()
+    db.close()
+
+
+async def disparar(app, rota, concorrencia, total):
+    import httpx
+
+    semaforo = asyncio.Semaphore(concorrencia)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def uma():
+            async with semaforo:
+                response = await client.get(rota)
+                response.raise_for_status()
+
+        await uma()  # aquecimento
+        inicio = time.perf_counter()
+        await asyncio.gather(*(uma() for _ in range(total)))
+        return time.perf_counter() - inicio
+
+
+def main():
+    args = parse_args()
+    if not args.postgres:
+        os.environ["TEST_MODE"] = "1"
+        os.environ.setdefault("TEST_DB_PATH", os.path.join(tempfile.mkdtemp(), "bench.db"))
+
+    preparar_banco(args.artigos)
+
+    from backend.app import database
+    from backend.app.main import app
+
+    if hasattr(database, "async_engine"):
+        database.async_engine.echo = False
+
+    duracao = asyncio.run(disparar(app, args.rota, args.concorrencia, args.requisicoes))
+    print(json.dumps({
+        "rota": args.rota,
+        "banco": "postgres" if args.postgres else "sqlite",
+        "artigos": args.artigos,
+        "concorrencia": args.concorrencia,
+        "requisicoes": args.requisicoes,
+        "segundos": round(duracao, 3),
+        "req_por_segundo": round(args.requisicoes / duracao, 1),
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
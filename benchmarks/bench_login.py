@@ -0,0 +1,136 @@
+"""
+Benchmark de latência do login sob carga concorrente.
+
+Dispara logins concorrentes (via ASGI, sem rede) e, ao mesmo tempo, requisições
+leves em GET /eventos/ para medir quanto o hash de senha atrapalha as outras
+rotas. Compara o scrypt rodando no próprio event loop (inline) com o pool de
+threads ou de processos de backend/app/passwords.py.
+
+Uso:
+    python benchmarks/bench_login.py --logins 200 --concorrencia 16
+    python benchmarks/bench_login.py --modos inline thread process --usuarios 16
+"""
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+SENHA = "senha-benchmark"
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--usuarios", type=int, default=16, help="usuários semeados no banco")
+    parser.add_argument("--logins", type=int, default=200, help="total de logins por modo")
+    parser.add_argument("--concorrencia", type=int, default=16, help="logins simultâneos")
+    parser.add_argument("--modos", nargs="+", default=["inline", "thread"], choices=["inline", "thread", "process"])
+    return parser.parse_args()
+
+
+def preparar_banco(n_usuarios):
+    from backend.app.database import Base, engine, SessionLocal
+    from backend.app.models import User, Event
+    from backend.app.passwords import hash_password
+
+    engine.echo = False
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    db = SessionLocal()
+    db.add(Event(nome="Evento Benchmark", slug="bench"))
+    senha_hash = hash_password(SENHA)  # mesmo custo para todos; o salt não muda o tempo
+    db.add_all([
+        User(nome=f"Usuário {i}", email=f"usuario{i}@example.com", senha_hash=senha_hash)
+        for i in range(n_usuarios)
+    ])
+    db.commit()
+    db.close()
+
+
+def percentis(amostras):
+    ordenadas = sorted(amostras)
+
+    def p(q):
+        return round(ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))] * 1000, 1)
+
+    return {"p50_ms": p(0.50), "p95_ms": p(0.95), "p99_ms": p(0.99), "media_ms": round(statistics.mean(ordenadas) * 1000, 1)}
+
+
+async def disparar(app, n_usuarios, total, concorrencia):
+    import httpx
+
+    semaforo = asyncio.Semaphore(concorrencia)
+    logins, sondas = [], []
+    terminou = asyncio.Event()
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def login(i):
+            async with semaforo:
+                inicio = time.perf_counter()
+                response = await client.post("/login/", json={
+                    "email": f"usuario{i % n_usuarios}@example.com", "password": SENHA,
+                })
+                response.raise_for_status()
+                logins.append(time.perf_counter() - inicio)
+
+        async def sonda():
+            # Uma requisição leve por vez enquanto os logins rodam
+            while not terminou.is_set():
+                inicio = time.perf_counter()
+                (await client.get("/eventos/")).raise_for_status()
+                sondas.append(time.perf_counter() - inicio)
+                await asyncio.sleep(0.005)
+
+        await login(0)  # aquecimento (e regravação do hash, se necessário)
+        logins.clear()
+        tarefa_sonda = asyncio.create_task(sonda())
+        inicio = time.perf_counter()
+        await asyncio.gather(*(login(i) for i in range(total)))
+        duracao = time.perf_counter() - inicio
+        terminou.set()
+        await tarefa_sonda
+
+    return duracao, logins, sondas
+
+
+def main():
+    args = parse_args()
+    os.environ["TEST_MODE"] = "1"
+    os.environ.setdefault("TEST_DB_PATH", os.path.join(tempfile.mkdtemp(), "bench_login.db"))
+
+    preparar_banco(args.usuarios)
+
+    from backend.app import database, passwords
+    from backend.app.main import app
+
+    database.async_engine.echo = False
+
+    resultados = {}
+    for modo in args.modos:
+        passwords.PASSWORD_HASH_EXECUTOR = modo
+        passwords._executor = None
+        duracao, logins, sondas = asyncio.run(disparar(app, args.usuarios, args.logins, args.concorrencia))
+        resultados[modo] = {
+            "logins_por_segundo": round(args.logins / duracao, 1),
+            "login": percentis(logins),
+            "get_eventos_durante_logins": percentis(sondas) if sondas else None,
+        }
+
+    print(json.dumps({
+        "scrypt": {"n": passwords.PASSWORD_SCRYPT_N, "r": passwords.PASSWORD_SCRYPT_R, "p": passwords.PASSWORD_SCRYPT_P},
+        "workers": passwords.PASSWORD_HASH_WORKERS,
+        "logins": args.logins,
+        "concorrencia": args.concorrencia,
+        "modos": resultados,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,499 @@
+"""
+Benchmark de carga e latência de todas as rotas de configure_routes.
+
+Semeia um acervo sintético no tamanho pedido (eventos com edições anuais,
+artigos com número variável de autores, autores com popularidade de cauda
+longa, palavras-chave) e dispara requisições concorrentes contra a aplicação
+FastAPI (via ASGI, sem rede) para cada rota, inclusive as de escrita. Imprime
+um JSON com vazão e p50/p95/p99 por rota, além do commit e do banco usados,
+para comparar resultados entre commits e entre SQLite e Postgres.
+
+Modos de carga:
+  misto    todas as rotas ao mesmo tempo, em ordem embaralhada (padrão)
+  isolado  uma rota por vez; dá a vazão de cada rota sozinha
+
+A latência é medida no cliente: inclui as BackgroundTasks da rota (o
+transporte ASGI só devolve a resposta quando a aplicação termina). Uma rota
+nova em configure_routes sem cenário aqui faz o benchmark falhar.
+
+Uso:
+    python benchmarks/bench_routes.py --artigos 1000
+    python benchmarks/bench_routes.py --artigos 100000 --sqlite-path /tmp/bench.db
+    python benchmarks/bench_routes.py --artigos 100000 --sqlite-path /tmp/bench.db --reutilizar
+    python benchmarks/bench_routes.py --artigos 1000000 --postgres   # usa DB_* do .env (APAGA as tabelas)
+    python benchmarks/bench_routes.py --saida atual.json --comparar base.json
+"""
+import argparse
+import asyncio
+import hashlib
+import io
+import itertools
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+
+RAIZ = os.path.join(os.path.dirname(__file__), "..")
+sys.path.insert(0, RAIZ)
+
+SENHA = "senha-benchmark"
+ANOS = range(2015, 2025)  # edições anuais de cada evento
+ARTIGOS_POR_EDICAO = 60
+# Autores por artigo (1..8) e pesos: média ~3,2, como em anais de conferência
+AUTORES_POR_ARTIGO = [1, 2, 3, 4, 5, 6, 7, 8]
+PESOS_AUTORES = [12, 22, 25, 19, 11, 6, 3, 2]
+PALAVRAS_CHAVE = 400
+LOTE_SEMEADURA = 5000
+PALAVRAS = (
+    "software engenharia testes dados aprendizado máquina redes segurança requisitos "
+    "arquitetura desempenho banco consultas distribuídos nuvem mobile android código "
+    "refatoração métricas qualidade evolução manutenção modelos grafos otimização "
+    "compiladores verificação privacidade usabilidade acessibilidade educação"
+).split()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--artigos", type=int, default=1000, help="artigos semeados (ex.: 1000, 100000, 1000000)")
+    parser.add_argument("--autores", type=int, default=None, help="autores distintos (padrão: um por artigo)")
+    parser.add_argument("--concorrencia", type=int, default=32, help="requisições simultâneas")
+    parser.add_argument("--requisicoes", type=int, default=50, help="requisições por rota")
+    parser.add_argument("--modo", choices=["misto", "isolado"], default="misto")
+    parser.add_argument("--rotas", nargs="+", help="só as rotas que contêm estes trechos (ex.: 'GET /artigos')")
+    parser.add_argument("--semente", type=int, default=42, help="semente do acervo e da ordem das requisições")
+    parser.add_argument("--postgres", action="store_true", help="usa o Postgres configurado no .env")
+    parser.add_argument("--sqlite-path", help="arquivo SQLite (padrão: temporário)")
+    parser.add_argument("--reutilizar", action="store_true", help="usa o acervo já semeado no banco")
+    parser.add_argument("--saida", help="grava o JSON também neste arquivo")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior: inclui a variação por rota")
+    return parser.parse_args()
+
+
+# ----------------------
+# Acervo sintético
+# ----------------------
+def _pesos_cauda_longa(n, s=0.9):
+    """Pesos acumulados de uma Zipf: poucos autores/palavras concentram muitos artigos"""
+    return list(itertools.accumulate(1 / (rank ** s) for rank in range(1, n + 1)))
+
+
+def _inserir(conn, tabela, linhas):
+    if linhas:
+        conn.execute(tabela.insert(), linhas)
+
+
+def preparar_banco(n_artigos, n_autores, semente):
+    """Recria as tabelas e semeia o acervo em lotes (executemany), sem passar pelo ORM"""
+    from sqlalchemy import text
+    from backend.app import models
+    from backend.app.database import Base, engine, SessionLocal
+    from backend.app.models import User, gerar_slug_generico
+    from backend.app.passwords import hash_password
+
+    rng = random.Random(semente)
+    engine.echo = False
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+
+    n_edicoes = max(1, -(-n_artigos // ARTIGOS_POR_EDICAO))
+    n_eventos = max(1, -(-n_edicoes // len(ANOS)))
+    inicio = time.perf_counter()
+
+    with engine.begin() as conn:
+        _inserir(conn, models.Event.__table__, [
+            {"id": e, "nome": f"Simpósio Benchmark {e}", "slug": f"bench-{e}"} for e in range(1, n_eventos + 1)
+        ])
+        edicoes = [(e, ano) for e in range(1, n_eventos + 1) for ano in ANOS][:n_edicoes]
+        _inserir(conn, models.Edition.__table__, [
+            {"id": i, "evento_id": e, "ano": ano, "slug": f"bench-{e}-{ano}", "local": "Online"}
+            for i, (e, ano) in enumerate(edicoes, start=1)
+        ])
+        for inicio_lote in range(1, n_autores + 1, LOTE_SEMEADURA):
+            _inserir(conn, models.Author.__table__, [
+                {"id": a, "nome": rng.choice(PALAVRAS).title(), "sobrenome": f"Autor{a}", "slug": f"autor-{a}"}
+                for a in range(inicio_lote, min(inicio_lote + LOTE_SEMEADURA, n_autores + 1))
+            ])
+        palavras_chave = [f"{a} {b}" for a, b in itertools.permutations(PALAVRAS, 2)][:PALAVRAS_CHAVE]
+        _inserir(conn, models.Keyword.__table__, [
+            {"id": k, "nome": nome, "slug": gerar_slug_generico(nome)} for k, nome in enumerate(palavras_chave, start=1)
+        ])
+
+        pesos_autores = _pesos_cauda_longa(n_autores)
+        pesos_palavras = _pesos_cauda_longa(len(palavras_chave))
+        vinculos = 0
+        for inicio_lote in range(1, n_artigos + 1, LOTE_SEMEADURA):
+            artigos, autorias, marcacoes = [], [], []
+            for a in range(inicio_lote, min(inicio_lote + LOTE_SEMEADURA, n_artigos + 1)):
+                k = rng.choices(AUTORES_POR_ARTIGO, PESOS_AUTORES)[0]
+                autores = set(rng.choices(range(1, n_autores + 1), cum_weights=pesos_autores, k=k))
+                chaves = set(rng.choices(range(1, len(palavras_chave) + 1), cum_weights=pesos_palavras, k=rng.randint(1, 4)))
+                artigos.append({
+                    "id": a,
+                    "titulo": " ".join(rng.sample(PALAVRAS, 6)).capitalize(),
+                    "resumo": " ".join(rng.choices(PALAVRAS, k=40)),
+                    "area": rng.choice(PALAVRAS),
+                    "palavras_chave": ", ".join(palavras_chave[c - 1] for c in sorted(chaves)),
+                    "data_publicacao": date(ANOS[0] + a % len(ANOS), 6, 1),
+                    "edicao_id": (a - 1) // ARTIGOS_POR_EDICAO + 1,
+                })
+                autorias.extend({"artigo_id": a, "autor_id": autor} for autor in autores)
+                marcacoes.extend({"artigo_id": a, "palavra_chave_id": c} for c in chaves)
+            _inserir(conn, models.Article.__table__, artigos)
+            _inserir(conn, models.artigo_autor, autorias)
+            _inserir(conn, models.artigo_palavra_chave, marcacoes)
+            vinculos += len(autorias)
+
+        if engine.dialect.name == "postgresql":
+            # Ids explícitos não avançam as sequences do SERIAL
+            for tabela in ("eventos", "edicoes", "autores", "palavras_chave", "artigos"):
+                conn.execute(text(f"SELECT setval(pg_get_serial_sequence('{tabela}', 'id'), (SELECT max(id) FROM {tabela}))"))
+
+    db = SessionLocal()
+    db.add(User(nome="Usuário Benchmark", email="bench@example.com", senha_hash=hash_password(SENHA), perfil="admin"))
+    db.commit()
+    db.close()
+    return {"semeadura_s": round(time.perf_counter() - inicio, 1), "vinculos_autor": vinculos}
+
+
+def carregar_acervo():
+    """Ids e slugs que os cenários sorteiam, lidos do banco (semeado agora ou antes)"""
+    from sqlalchemy import func, select
+    from backend.app import models
+    from backend.app.database import SessionLocal, engine
+
+    engine.echo = False
+    db = SessionLocal()
+    try:
+        def contar(coluna):
+            return db.scalar(select(func.max(coluna))) or 0
+
+        usuario = db.scalars(select(models.User).where(models.User.email == "bench@example.com")).first()
+        if usuario is None:
+            raise SystemExit("Acervo de benchmark não encontrado: rode sem --reutilizar")
+        edicoes = db.execute(
+            select(models.Event.slug, models.Edition.ano).join(models.Edition.event).order_by(models.Edition.id).limit(1000)
+        ).all()
+        return SimpleNamespace(
+            artigos=contar(models.Article.id),
+            autores=contar(models.Author.id),
+            edicoes=contar(models.Edition.id),
+            eventos=contar(models.Event.id),
+            vinculos_autor=db.scalar(select(func.count()).select_from(models.artigo_autor)),
+            slugs_ano=[tuple(linha) for linha in edicoes],
+            usuario=SimpleNamespace(id=usuario.id, nome=usuario.nome, email=usuario.email, perfil=usuario.perfil),
+        )
+    finally:
+        db.close()
+
+
+# ----------------------
+# Cenários por rota
+# ----------------------
+def _pdf(marca):
+    return b"%PDF-1.4\n" + f"benchmark {marca} ".encode() * 200 + b"\n%%EOF\n"
+
+
+def _bibtex(marca, n=5):
+    return "\n".join(
+        f"@inproceedings{{bench-{marca}-{i},\n author = {{Ana Souza and Bruno Lima{i}}},\n"
+        f" title = {{Artigo importado {marca} {i}}},\n booktitle = {{Anais do Simpósio Benchmark}},\n"
+        f" year = {{2024}},\n}}\n"
+        for i in range(n)
+    ).encode()
+
+
+def montar_cenarios(acervo, rng, token, pdf_sha256, execucao):
+    """
+    Uma função por (método, rota de configure_routes) que gera os argumentos
+    da requisição i. Escritas usam nomes únicos por execução, então o mesmo
+    acervo pode ser reutilizado.
+    """
+    pesos_autores = _pesos_cauda_longa(acervo.autores)
+    admin = {"Authorization": f"Bearer {token}"}
+
+    def autor():
+        return rng.choices(range(1, acervo.autores + 1), cum_weights=pesos_autores)[0]
+
+    def artigo():
+        return rng.randint(1, acervo.artigos)
+
+    def edicao():
+        return rng.randint(1, acervo.edicoes)
+
+    def slug_ano():
+        return rng.choice(acervo.slugs_ano)
+
+    def novo_artigo(i):
+        return {
+            "titulo": f"Artigo benchmark {execucao} {i}",
+            "edicao_id": edicao(),
+            "palavras_chave": ", ".join(rng.sample(PALAVRAS, 2)),
+            "author_ids": [autor() for _ in range(3)],
+        }
+
+    return {
+        ("POST", "/eventos/"): lambda i: {"json": {"nome": f"Evento {execucao} {i}", "sigla": f"ev-{execucao}-{i}"}},
+        ("GET", "/eventos/"): lambda i: {"params": {"limit": 50}},
+        ("POST", "/edicoes/"): lambda i: {"json": {"ano": 2025, "evento_id": rng.randint(1, acervo.eventos)}},
+        ("GET", "/edicoes/"): lambda i: {"params": {"limit": 50}},
+        ("POST", "/autores/"): lambda i: {"json": {"nome": "Autora", "sobrenome": f"Benchmark {execucao} {i}"}},
+        ("GET", "/autores/"): lambda i: {"params": {"limit": 50}},
+        ("POST", "/artigos/"): lambda i: {"json": novo_artigo(i), "headers": admin},
+        ("POST", "/artigos/lote"): lambda i: {"json": [novo_artigo(f"{i}-{j}") for j in range(20)], "headers": admin},
+        ("GET", "/artigos/"): lambda i: {"params": {"limit": 50, **({"palavra_chave": rng.choice(PALAVRAS)} if rng.random() < 0.5 else {})}},
+        ("GET", "/artigos/busca"): lambda i: {"params": {"q": rng.choice(PALAVRAS), "limit": 20}},
+        ("GET", "/palavras-chave"): lambda i: {"params": {"limit": 50}},
+        ("POST", "/upload-bibtex"): lambda i: {
+            "files": {"bibtex_file": ("anais.bib", _bibtex(f"{execucao}-{i}"), "application/x-bibtex")},
+            "data": {"action": "save"},
+            "headers": admin,
+        },
+        ("POST", "/pdfs"): lambda i: {
+            "files": {"pdf_file": ("artigo.pdf", _pdf(f"{execucao}-{i}"), "application/pdf")},
+            "headers": admin,
+        },
+        ("GET", "/pdfs/{sha256}"): lambda i: {"url": f"/pdfs/{pdf_sha256}"},
+        ("HEAD", "/pdfs/{sha256}"): lambda i: {"url": f"/pdfs/{pdf_sha256}"},
+        ("POST", "/usuarios/"): lambda i: {"json": {
+            "nome": f"Usuário {i}", "email": f"bench-{execucao}-{i}@example.com", "senha_hash": SENHA,
+        }},
+        ("GET", "/usuarios/"): lambda i: {"params": {"limit": 50}},
+        ("POST", "/login/"): lambda i: {"json": {"email": "bench@example.com", "password": SENHA}},
+        ("GET", "/perfil/{user_id}"): lambda i: {"url": f"/perfil/{acervo.usuario.id}"},
+        ("GET", "/me"): lambda i: {"headers": admin},
+        ("GET", "/eventos/{event_id}"): lambda i: {"url": f"/eventos/{slug_ano()[0]}"},
+        ("GET", "/autores/{author_id}"): lambda i: {"url": f"/autores/{autor()}"},
+        ("GET", "/edicoes/{edition_id}"): lambda i: {"url": f"/edicoes/{edicao()}"},
+        ("GET", "/artigos/{article_id}"): lambda i: {"url": f"/artigos/{artigo()}"},
+        ("GET", "/autores/{author_id}/artigos"): lambda i: {"url": f"/autores/{autor()}/artigos"},
+        ("GET", "/eventos/{slug}/resumo"): lambda i: {"url": f"/eventos/{slug_ano()[0]}/resumo"},
+        ("GET", "/eventos/{slug}/{ano:int}"): lambda i: {"url": "/eventos/{}/{}".format(*slug_ano())},
+        ("GET", "/eventos/{slug}/{ano:int}/artigos"): lambda i: {"url": "/eventos/{}/{}/artigos".format(*slug_ano())},
+        ("GET", "/internal/cache"): lambda i: {"headers": admin},
+        ("GET", "/internal/pool"): lambda i: {"headers": admin},
+        ("GET", "/metrics"): lambda i: {},
+    }
+
+
+def rotas_da_aplicacao(app):
+    """(método, template) de cada rota registrada por configure_routes"""
+    from backend.app import routes
+
+    return {
+        (metodo, rota.path)
+        for rota in app.routes
+        if getattr(rota, "endpoint", None) is not None and rota.endpoint.__module__ == routes.__name__
+        for metodo in rota.methods
+    }
+
+
+# ----------------------
+# Carga
+# ----------------------
+def percentis(amostras):
+    ordenadas = sorted(amostras)
+
+    def p(q):
+        return round(ordenadas[min(len(ordenadas) - 1, int(q * len(ordenadas)))] * 1000, 2)
+
+    return {
+        "p50_ms": p(0.50), "p95_ms": p(0.95), "p99_ms": p(0.99),
+        "media_ms": round(statistics.mean(ordenadas) * 1000, 2), "max_ms": round(ordenadas[-1] * 1000, 2),
+    }
+
+
+async def disparar(app, cenarios, chaves, total_por_rota, concorrencia, modo, rng):
+    import httpx
+
+    semaforo = asyncio.Semaphore(concorrencia)
+    amostras = {chave: [] for chave in chaves}
+    status = {chave: {} for chave in chaves}
+    duracoes = {}
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def uma(chave, i, medir=True):
+            metodo, template = chave
+            kwargs = cenarios[chave](i)
+            url = kwargs.pop("url", template)
+            async with semaforo:
+                inicio = time.perf_counter()
+                try:
+                    codigo = (await client.request(metodo, url, **kwargs)).status_code
+                except Exception as e:  # erro da aplicação (ex.: QueryBudgetExceeded)
+                    codigo = type(e).__name__
+                if medir:
+                    amostras[chave].append(time.perf_counter() - inicio)
+                    status[chave][str(codigo)] = status[chave].get(str(codigo), 0) + 1
+
+        # Aquecimento: uma requisição por rota (caches, conexões, imports tardios)
+        for chave in chaves:
+            await uma(chave, "aquecimento", medir=False)
+        client.cookies.clear()  # sem o cookie de "ler o que escreveu" das escritas do aquecimento
+        from backend.app import metrics
+        metrics.REGISTRY.reset()
+
+        inicio = time.perf_counter()
+        if modo == "misto":
+            fila = [(chave, i) for chave in chaves for i in range(total_por_rota)]
+            rng.shuffle(fila)
+            await asyncio.gather(*(uma(chave, i) for chave, i in fila))
+        else:
+            for chave in chaves:
+                inicio_rota = time.perf_counter()
+                await asyncio.gather(*(uma(chave, i) for i in range(total_por_rota)))
+                duracoes[chave] = time.perf_counter() - inicio_rota
+        duracao = time.perf_counter() - inicio
+
+    return duracao, duracoes, amostras, status
+
+
+def resumir(chaves, duracao, duracoes, amostras, status):
+    from backend.app import metrics
+
+    rotas, todas, erros = {}, [], 0
+    for chave in chaves:
+        metodo, template = chave
+        falhas = sum(n for codigo, n in status[chave].items() if not codigo.isdigit() or int(codigo) >= 400)
+        erros += falhas
+        todas.extend(amostras[chave])
+        n_consultas = metrics.DB_QUERIES_PER_REQUEST.count(method=metodo, route=template)
+        rota = {
+            "requisicoes": len(amostras[chave]),
+            "erros": falhas,
+            "status": status[chave],
+            **percentis(amostras[chave]),
+            "consultas_por_requisicao": round(
+                metrics.DB_QUERIES_PER_REQUEST.sum(method=metodo, route=template) / n_consultas, 2
+            ) if n_consultas else None,
+        }
+        if chave in duracoes:
+            rota["req_por_segundo"] = round(len(amostras[chave]) / duracoes[chave], 1)
+        rotas[f"{metodo} {template}"] = rota
+    total = {
+        "requisicoes": len(todas),
+        "erros": erros,
+        "segundos": round(duracao, 3),
+        "req_por_segundo": round(len(todas) / duracao, 1),
+        **percentis(todas),
+    }
+    return total, rotas
+
+
+def comparar(resultado, caminho):
+    """Variação percentual (atual vs. anterior) da vazão total e dos percentis de cada rota"""
+    with open(caminho, encoding="utf-8") as f:
+        anterior = json.load(f)
+
+    def variacao(atual, antes):
+        return round((atual - antes) / antes * 100, 1) if atual is not None and antes else None
+
+    avisos = [
+        f"{campo} diferente da execução anterior"
+        for campo in ("banco", "volume", "carga")
+        if {k: v for k, v in resultado[campo].items() if k != "versao"}
+        != {k: v for k, v in anterior.get(campo, {}).items() if k != "versao"}
+    ]
+    rotas = {}
+    for nome, rota in resultado["rotas"].items():
+        antes = anterior.get("rotas", {}).get(nome)
+        if antes:
+            rotas[nome] = {f"{campo}_pct": variacao(rota.get(campo), antes.get(campo))
+                           for campo in ("p50_ms", "p95_ms", "p99_ms", "req_por_segundo") if campo in rota}
+    return {
+        "base": {"arquivo": caminho, "commit": anterior.get("commit")},
+        "avisos": avisos,
+        "total": {"req_por_segundo_pct": variacao(resultado["total"]["req_por_segundo"], anterior["total"]["req_por_segundo"]),
+                  "p95_ms_pct": variacao(resultado["total"]["p95_ms"], anterior["total"]["p95_ms"])},
+        "rotas": rotas,
+    }
+
+
+def commit_atual():
+    def git(*args):
+        try:
+            return subprocess.run(["git", *args], cwd=RAIZ, capture_output=True, text=True, check=True).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    commit = git("rev-parse", "HEAD")
+    return commit, bool(git("status", "--porcelain", "--untracked-files=no")) if commit else None
+
+
+def main():
+    args = parse_args()
+    n_autores = args.autores or args.artigos
+    if not args.postgres:
+        os.environ["TEST_MODE"] = "1"
+        os.environ["TEST_DB_PATH"] = args.sqlite_path or os.path.join(tempfile.mkdtemp(), "bench_routes.db")
+    # Estouro de orçamento de consultas vira aviso (em TEST_MODE derrubaria a requisição)
+    os.environ.setdefault("QUERY_BUDGET_MODE", "warn")
+    os.environ.setdefault("PDF_STORAGE_DIR", os.path.join(tempfile.mkdtemp(), "pdfs"))
+    os.environ.setdefault("PDF_TEXT_EXECUTOR", "inline")
+
+    semeadura = {} if args.reutilizar else preparar_banco(args.artigos, n_autores, args.semente)
+    acervo = carregar_acervo()
+
+    from backend.app import database, pdf_storage
+    from backend.app.auth import create_access_token
+    from backend.app.main import app
+
+    database.async_engine.echo = False
+    pdf = _pdf("leitura")
+    pdf_storage.storage.save(io.BytesIO(pdf))
+
+    rng = random.Random(args.semente)
+    execucao = f"{int(time.time())}-{os.getpid()}"
+    cenarios = montar_cenarios(acervo, rng, create_access_token(acervo.usuario), hashlib.sha256(pdf).hexdigest(), execucao)
+    sem_cenario = rotas_da_aplicacao(app) - cenarios.keys()
+    if sem_cenario:
+        raise SystemExit(f"Rotas sem cenário no benchmark: {sorted(sem_cenario)}")
+    chaves = sorted(cenarios)
+    if args.rotas:
+        chaves = [c for c in chaves if any(trecho in f"{c[0]} {c[1]}" for trecho in args.rotas)]
+
+    duracao, duracoes, amostras, status = asyncio.run(
+        disparar(app, cenarios, chaves, args.requisicoes, args.concorrencia, args.modo, rng)
+    )
+    total, rotas = resumir(chaves, duracao, duracoes, amostras, status)
+
+    commit, sujo = commit_atual()
+    dialeto = database.engine.dialect
+    resultado = {
+        "commit": commit,
+        "alteracoes_locais": sujo,
+        "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "cpus": os.cpu_count(),
+        "banco": {"dialeto": dialeto.name, "versao": ".".join(map(str, dialeto.server_version_info or ()))},
+        "volume": {
+            "artigos": acervo.artigos, "autores": acervo.autores, "edicoes": acervo.edicoes,
+            "eventos": acervo.eventos, "vinculos_autor": acervo.vinculos_autor,
+        },
+        "semeadura_s": semeadura.get("semeadura_s"),
+        "carga": {
+            "modo": args.modo, "concorrencia": args.concorrencia,
+            "requisicoes_por_rota": args.requisicoes, "semente": args.semente,
+        },
+        "total": total,
+        "rotas": rotas,
+    }
+    if args.comparar:
+        resultado["comparacao"] = comparar(resultado, args.comparar)
+
+    saida = json.dumps(resultado, indent=2, ensure_ascii=False)
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as f:
+            f.write(saida + "\n")
+    print(saida)
+
+
+if __name__ == "__main__":
+    main()
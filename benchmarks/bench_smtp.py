@@ -0,0 +1,126 @@
+"""
+Benchmark de envio de emails: uma conexão por email x pool de conexões.
+
+Sobe o servidor SMTP de depuração (backend/app/mail.py) com uma latência
+artificial por resposta, simulando a ida e volta até um servidor remoto, e
+mede emails por segundo em três modos:
+
+    por_email   abre, autentica e fecha uma conexão para cada email
+                (comportamento antigo de send_notification_email)
+    pool_1      SMTPPool com uma conexão persistente
+    pool_N      SMTPPool com N conexões persistentes enviando em paralelo
+
+Uso:
+    python benchmarks/bench_smtp.py --emails 200 --latencia-ms 5 --pool 8
+    python benchmarks/bench_smtp.py --host smtp.exemplo.com --porta 587 --starttls   # servidor real (EMAIL_FROM/EMAIL_PASSWORD do ambiente)
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from email.message import EmailMessage
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import aiosmtplib  # noqa: E402
+
+from backend.app.mail import DebuggingSMTPServer, SMTPPool  # noqa: E402
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--emails", type=int, default=200, help="emails enviados em cada modo")
+    parser.add_argument("--latencia-ms", type=float, default=5.0, help="atraso por resposta do servidor local")
+    parser.add_argument("--pool", type=int, default=8, help="conexões do pool no modo pool_N")
+    parser.add_argument("--host", help="servidor SMTP real (padrão: servidor de depuração local)")
+    parser.add_argument("--porta", type=int, default=587)
+    parser.add_argument("--starttls", action="store_true")
+    return parser.parse_args()
+
+
+def mensagens(n):
+    lista = []
+    for i in range(n):
+        msg = EmailMessage()
+        msg["From"] = os.getenv("EMAIL_FROM", "biblioteca@localhost")
+        msg["To"] = f"leitor{i}@example.com"
+        msg["Subject"] = f"Novo artigo {i}"
+        msg.set_content("Um novo artigo de um autor que você segue foi publicado.\n")
+        lista.append(msg)
+    return lista
+
+
+async def por_email(host, porta, starttls, msgs):
+    for msg in msgs:
+        smtp = aiosmtplib.SMTP(
+            hostname=host, port=porta, start_tls=starttls,
+            username=os.getenv("EMAIL_FROM") if starttls else None,
+            password=os.getenv("EMAIL_PASSWORD") if starttls else None,
+        )
+        await smtp.connect()
+        await smtp.send_message(msg)
+        await smtp.quit()
+    return len(msgs)
+
+
+async def com_pool(host, porta, starttls, msgs, tamanho):
+    pool = SMTPPool(
+        host, porta, start_tls=starttls, size=tamanho,
+        username=os.getenv("EMAIL_FROM") if starttls else None,
+        password=os.getenv("EMAIL_PASSWORD") if starttls else None,
+    )
+    erros = await pool.send_many(msgs)
+    await pool.close()
+    falhas = [e for e in erros if e is not None]
+    if falhas:
+        raise falhas[0]
+    return pool.connections_opened
+
+
+async def medir(coro):
+    inicio = time.perf_counter()
+    extra = await coro
+    return time.perf_counter() - inicio, extra
+
+
+async def executar(args):
+    servidor = None
+    host, porta = args.host, args.porta
+    if not host:
+        servidor = await DebuggingSMTPServer(port=0, latency=args.latencia_ms / 1000).start()
+        host, porta = servidor.host, servidor.port
+
+    resultados = {}
+    try:
+        modos = [
+            ("por_email", por_email(host, porta, args.starttls, mensagens(args.emails))),
+            ("pool_1", com_pool(host, porta, args.starttls, mensagens(args.emails), 1)),
+            (f"pool_{args.pool}", com_pool(host, porta, args.starttls, mensagens(args.emails), args.pool)),
+        ]
+        for nome, coro in modos:
+            duracao, _ = await medir(coro)
+            resultados[nome] = {
+                "segundos": round(duracao, 3),
+                "emails_por_segundo": round(args.emails / duracao, 1),
+            }
+    finally:
+        if servidor:
+            await servidor.stop()
+    return resultados
+
+
+def main():
+    args = parse_args()
+    resultados = asyncio.run(executar(args))
+    print(json.dumps({
+        "servidor": args.host or "depuracao-local",
+        "latencia_ms": None if args.host else args.latencia_ms,
+        "emails": args.emails,
+        "modos": resultados,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
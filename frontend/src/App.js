@@ -21,12 +21,27 @@ import AuthorDetailPage from './pages/AuthorDetailPage';
 import UserSettingsPage from './pages/UserSettingsPage';
 import NewEditionPage from './pages/NewEditionPage';
 import EditionsPage from './pages/EditionsPage';
+import { fetchAllPages } from './utils/api';
+import { usePaginatedApi } from './hooks/useApi';
 
 function App() {
-  const [artigos, setArtigos] = useState([]);
-  const [loadingArtigos, setLoading] = useState(true);
-  const [autores, setAutores] = useState([]);
-  const [loadingAutores, setLoadingAutores] = useState(true);
+  // Artigos e autores crescem com o acervo: uma página por vez, seguindo o cursor
+  const {
+    data: artigos,
+    loading: loadingArtigos,
+    loadingMore: loadingMaisArtigos,
+    hasMore: haMaisArtigos,
+    loadMore: carregarMaisArtigos,
+    reload: recarregarArtigos,
+  } = usePaginatedApi('/artigos/');
+  const {
+    data: autores,
+    loading: loadingAutores,
+    loadingMore: loadingMaisAutores,
+    hasMore: haMaisAutores,
+    loadMore: carregarMaisAutores,
+    reload: reloadAutores,
+  } = usePaginatedApi('/autores/');
   const [eventos, setEventos] = useState([]);
   const [loadingEventos, setLoadingEventos] = useState(true);
   const [edicoes, setEdicoes] = useState([]);
@@ -34,62 +49,15 @@ function App() {
 
   const navigate = useNavigate(); // <-- hook para navegação
 
-  // Função para recarregar autores
-  const reloadAutores = useCallback(() => {
-    setLoadingAutores(true);
-    console.log('🔄 Recarregando autores...');
-    
-    fetch('http://localhost:8000/autores')
-      .then(response => {
-        if (!response.ok) {
-          throw new Error(`HTTP error! status: ${response.status}`);
-        }
-        return response.json();
-      })
-      .then(data => {
-        console.log('✅ Autores carregados:', data.length);
-        setAutores(data);
-      })
-      .catch(error => {
-        console.error('❌ Erro ao carregar autores:', error);
-        setAutores([]);
-      })
-      .finally(() => {
-        setLoadingAutores(false);
-      });
-  }, []);
-
   // Função para recarregar eventos
   const reloadEventos = useCallback(() => {
     console.log("🔄 Recarregando eventos...");
     setLoadingEventos(true);
     
-    fetch("http://localhost:8000/eventos")
-      .then(res => {
-        console.log("📡 Resposta eventos status:", res.status);
-        if (!res.ok) {
-          throw new Error(`HTTP ${res.status}`);
-        }
-        return res.json();
-      })
+    fetchAllPages("/eventos/")
       .then(data => { 
-        console.log("✅ Eventos carregados:", data);
-        console.log("📊 Tipo de dados:", typeof data, "É array:", Array.isArray(data));
-        console.log("📋 Primeiro evento:", data[0]);
-        
-        // Verificar se é um array direto ou se os dados estão em uma propriedade
-        let eventosArray = [];
-        if (Array.isArray(data)) {
-          eventosArray = data;
-        } else if (data && Array.isArray(data.eventos)) {
-          eventosArray = data.eventos;
-        } else if (data && Array.isArray(data.data)) {
-          eventosArray = data.data;
-        } else {
-          console.warn("⚠️ Formato de dados inesperado:", data);
-        }
-        
-        setEventos(eventosArray);
+        console.log("✅ Eventos carregados:", data.length);
+        setEventos(data);
         setLoadingEventos(false); 
       })
       .catch(error => {
@@ -100,56 +68,18 @@ function App() {
   }, []);
 
   const reloadEdicoes = useCallback(() => {
-    fetch("http://localhost:8000/edicoes")
-      .then(res => res.json())
+    fetchAllPages("/edicoes/")
       .then(data => { setEdicoes(data); setLoadingEdicoes(false); })
       .catch(() => setLoadingEdicoes(false));
   }, []);
 
   const reloadArtigos = useCallback(() => {
     console.log("Recarregando artigos...");
-    fetch("http://localhost:8000/artigos")
-      .then(res => {
-        console.log("Resposta reload artigos:", res.status);
-        return res.json();
-      })
-      .then(data => { 
-        console.log("Artigos recarregados:", data);
-        setArtigos(data); 
-        setLoading(false); 
-        
-        // IMPORTANTE: Recarregar autores após carregar artigos
-        // porque novos autores podem ter sido criados
-        reloadAutores();
-      })
-      .catch(error => {
-        console.error("Erro ao recarregar artigos:", error);
-        setLoading(false);
-      });
-  }, [reloadAutores]);
-
-  useEffect(() => {
-    console.log("Carregando artigos...");
-    fetch("http://localhost:8000/artigos")
-      .then(res => {
-        console.log("Resposta do backend:", res.status);
-        return res.json();
-      })
-      .then(data => { 
-        console.log("Artigos carregados:", data);
-        setArtigos(data); 
-        setLoading(false); 
-      })
-      .catch(error => {
-        console.error("Erro ao carregar artigos:", error);
-        setLoading(false);
-      });
-  }, []);
-
-  useEffect(() => {
-    console.log('🚀 Carregando autores inicialmente...');
+    recarregarArtigos();
+    // IMPORTANTE: Recarregar autores junto com os artigos
+    // porque novos autores podem ter sido criados
     reloadAutores();
-  }, [reloadAutores]);
+  }, [recarregarArtigos, reloadAutores]);
 
   useEffect(() => {
     reloadEventos();
@@ -175,15 +105,15 @@ function App() {
               path="/"
               element={
                 <HomePage
-                  totalArticles={artigos.length}
+                  totalArticles={haMaisArtigos ? `${artigos.length}+` : artigos.length}
                   onNavigate={route => navigate(route.startsWith('/') ? route : `/${route}`)}
                 />
               }
             />
             
             {/* ROTAS FIXAS PRIMEIRO - MUITO IMPORTANTE A ORDEM */}
-            <Route path="/articles" element={<ArticlesPage artigos={artigos} loading={loadingArtigos} />} />
-            <Route path="/authors" element={<AuthorsPage data={autores} loading={loadingAutores} onReload={reloadAutores} />} />
+            <Route path="/articles" element={<ArticlesPage artigos={artigos} loading={loadingArtigos} hasMore={haMaisArtigos} loadingMore={loadingMaisArtigos} onLoadMore={carregarMaisArtigos} />} />
+            <Route path="/authors" element={<AuthorsPage data={autores} loading={loadingAutores} onReload={reloadAutores} hasMore={haMaisAutores} loadingMore={loadingMaisAutores} onLoadMore={carregarMaisAutores} />} />
             <Route path="/events" element={<EventsPage data={eventos} loading={loadingEventos} onReload={reloadEventos} />} />
             <Route path="/login" element={<LoginPage />} />
             <Route path="/register" element={<RegisterPage />} />
@@ -191,7 +121,7 @@ function App() {
             
             {/* ROTAS ADMIN */}
             <Route path="/admin" element={<AdminPanel />} />
-            <Route path="/admin/articles" element={<AdminArticlesPage artigos={artigos} onReload={reloadArtigos} />} />
+            <Route path="/admin/articles" element={<AdminArticlesPage artigos={artigos} onReload={reloadArtigos} hasMore={haMaisArtigos} loadingMore={loadingMaisArtigos} onLoadMore={carregarMaisArtigos} />} />
             <Route path="/admin/articles/new" element={<NewArticlePage onReload={reloadArtigos} />} />
             <Route path="/admin/articles/:id/edit" element={<NewArticlePage onReload={reloadArtigos} />} />
             <Route path="/admin/events" element={<EventsPage data={eventos} loading={loadingEventos} onReload={reloadEventos} />} />
@@ -206,6 +136,9 @@ function App() {
                   eventos={eventos} 
                   edicoes={edicoes} 
                   artigos={artigos}
+                  haMaisArtigos={haMaisArtigos}
+                  loadingMaisArtigos={loadingMaisArtigos}
+                  onLoadMoreArtigos={carregarMaisArtigos}
                   onReloadEventos={reloadEventos}
                   onReloadEdicoes={reloadEdicoes}
                   onReloadArtigos={reloadArtigos}
@@ -1,6 +1,7 @@
 import React from 'react';
 import { useNavigate } from 'react-router-dom';
 import { FolderIcon } from '../common/Icons';
+import { apiFetch } from '../../utils/api';
 
 const EditionCard = ({ edition, event }) => {
   const navigate = useNavigate();
@@ -18,7 +19,7 @@ const EditionCard = ({ edition, event }) => {
       // Se não temos o evento, buscar primeiro
       try {
         console.log('Buscando evento para navegação:', edition.evento_id);
-        const response = await fetch(`http://localhost:8000/eventos/${edition.evento_id}`);
+        const response = await apiFetch(`/eventos/${edition.evento_id}`);
         if (response.ok) {
           const eventoData = await response.json();
           console.log('Evento encontrado:', eventoData);
@@ -1,4 +1,5 @@
 import React, { createContext, useContext, useState, useEffect } from 'react';
+import { apiFetch } from '../../utils/api';
 
 const AuthContext = createContext();
 
@@ -39,7 +40,7 @@ export const AuthProvider = ({ children }) => {
   // 🔹 Login
   const login = async (email, password) => {
     try {
-      const response = await fetch('http://127.0.0.1:8000/login/', {
+      const response = await apiFetch('/login/', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify({ email, password }),
@@ -64,7 +65,7 @@ export const AuthProvider = ({ children }) => {
   // 🔹 Registro
   const register = async (userData) => {
     try {
-      const response = await fetch('http://127.0.0.1:8000/usuarios/', {
+      const response = await apiFetch('/usuarios/', {
         method: 'POST',
         headers: { 'Content-Type': 'application/json' },
         body: JSON.stringify(userData),
@@ -98,7 +99,7 @@ export const AuthProvider = ({ children }) => {
     }
 
     try {
-      const response = await fetch(`http://127.0.0.1:8000/perfil/${user.id}`, {
+      const response = await apiFetch(`/perfil/${user.id}`, {
         method: 'GET',
         headers: { 'Content-Type': 'application/json' },
       });
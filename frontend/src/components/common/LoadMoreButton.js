@@ -0,0 +1,20 @@
+import React from 'react';
+
+// Próxima página das listas paginadas por cursor (ver hooks/useApi.js)
+const LoadMoreButton = ({ hasMore, loading, onClick }) => {
+  if (!hasMore) return null;
+  return (
+    <div className="flex justify-center mt-8">
+      <button
+        type="button"
+        onClick={onClick}
+        disabled={loading}
+        className="px-5 py-2 border border-gray-300 bg-white text-gray-700 rounded-lg shadow-sm hover:bg-gray-50 disabled:opacity-50"
+      >
+        {loading ? 'Carregando...' : 'Carregar mais'}
+      </button>
+    </div>
+  );
+};
+
+export default LoadMoreButton;
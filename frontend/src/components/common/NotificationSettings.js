@@ -1,4 +1,5 @@
 import React, { useState, useEffect } from 'react';
+import { apiFetch } from '../../utils/api';
 
 function NotificationSettings({ userId }) {
   const [receberNotificacoes, setReceberNotificacoes] = useState(true);
@@ -9,7 +10,7 @@ function NotificationSettings({ userId }) {
   useEffect(() => {
     const fetchPreferences = async () => {
       try {
-        const response = await fetch(`http://localhost:8000/usuarios/${userId}/notificacoes`);
+        const response = await apiFetch(`/usuarios/${userId}/notificacoes`);
         if (response.ok) {
           const data = await response.json();
           setReceberNotificacoes(data.receber_notificacoes);
@@ -31,7 +32,7 @@ function NotificationSettings({ userId }) {
     setMessage('');
 
     try {
-      const response = await fetch(`http://localhost:8000/usuarios/${userId}/notificacoes`, {
+      const response = await apiFetch(`/usuarios/${userId}/notificacoes`, {
         method: 'PUT',
         headers: {
           'Content-Type': 'application/json',
@@ -1,5 +1,5 @@
 import { useState, useEffect, useCallback } from 'react';
-import { fetchData } from '../utils/api';
+import { fetchData, fetchPage } from '../utils/api';
 
 export const useApi = (endpoint) => {
   const [data, setData] = useState([]);
@@ -24,4 +24,47 @@ export const useApi = (endpoint) => {
   }, [loadData]);
 
   return { data, loading, error, refetch: loadData };
-};
\ No newline at end of file
+};
+// Listas paginadas ({items, next}): carrega uma página por vez seguindo o
+// cursor. loadMore() acrescenta a próxima página; reload() volta à primeira.
+export const usePaginatedApi = (endpoint, pageSize = 50) => {
+  const [data, setData] = useState([]);
+  const [next, setNext] = useState(null);
+  const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [error, setError] = useState(null);
+
+  const reload = useCallback(async () => {
+    try {
+      setLoading(true);
+      const page = await fetchPage(endpoint, { limit: pageSize });
+      setData(page.items);
+      setNext(page.next);
+      setError(null);
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setLoading(false);
+    }
+  }, [endpoint, pageSize]);
+
+  const loadMore = useCallback(async () => {
+    if (!next) return;
+    try {
+      setLoadingMore(true);
+      const page = await fetchPage(endpoint, { limit: pageSize, after: next });
+      setData(prev => [...prev, ...page.items]);
+      setNext(page.next);
+    } catch (err) {
+      setError(err.message);
+    } finally {
+      setLoadingMore(false);
+    }
+  }, [endpoint, pageSize, next]);
+
+  useEffect(() => {
+    reload();
+  }, [reload]);
+
+  return { data, loading, loadingMore, error, hasMore: Boolean(next), loadMore, reload };
+};
@@ -1,8 +1,9 @@
 import React, { useEffect } from "react";
 import { useAuth } from "../components/common/AuthContext";
 import { useNavigate } from "react-router-dom";
+import LoadMoreButton from "../components/common/LoadMoreButton";
 
-const AdminArticlesPage = ({ artigos = [], onReload }) => {
+const AdminArticlesPage = ({ artigos = [], onReload, hasMore, loadingMore, onLoadMore }) => {
   const { user, isAdmin } = useAuth();
   const navigate = useNavigate();
 
@@ -49,6 +50,8 @@ const AdminArticlesPage = ({ artigos = [], onReload }) => {
           </li>
         ))}
       </ul>
+
+      <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={onLoadMore} />
     </div>
   );
 };
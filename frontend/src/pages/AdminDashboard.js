@@ -1,11 +1,16 @@
 import React, { useEffect } from "react";
 import { useAuth } from "../components/common/AuthContext";
 import { useNavigate, useLocation } from "react-router-dom";
+import { apiFetch } from "../utils/api";
+import LoadMoreButton from "../components/common/LoadMoreButton";
 
 const AdminDashboard = ({ 
   artigos = [], // CORREÇÃO: Valor padrão
   eventos = [], // CORREÇÃO: Valor padrão
   edicoes = [], // CORREÇÃO: Valor padrão
+  haMaisArtigos,
+  loadingMaisArtigos,
+  onLoadMoreArtigos,
   onReloadArtigos, 
   onReloadEventos, 
   onReloadEdicoes 
@@ -43,7 +48,7 @@ const AdminDashboard = ({
     if (!confirmar) return;
 
     try {
-      const res = await fetch(`http://localhost:8000/artigos/${id}`, {
+      const res = await apiFetch(`/artigos/${id}`, {
         method: "DELETE",
       });
 
@@ -67,7 +72,7 @@ const AdminDashboard = ({
     if (!confirmar) return;
 
     try {
-      const res = await fetch(`http://localhost:8000/eventos/${id}`, {
+      const res = await apiFetch(`/eventos/${id}`, {
         method: "DELETE",
       });
 
@@ -100,7 +105,7 @@ const AdminDashboard = ({
     if (!confirmar) return;
 
     try {
-      const res = await fetch(`http://localhost:8000/edicoes/${id}`, {
+      const res = await apiFetch(`/edicoes/${id}`, {
         method: "DELETE",
       });
 
@@ -185,6 +190,7 @@ const AdminDashboard = ({
               ))}
             </div>
           )}
+          <LoadMoreButton hasMore={haMaisArtigos} loading={loadingMaisArtigos} onClick={onLoadMoreArtigos} />
         </section>
 
         {/* Seção de Eventos */}
@@ -2,8 +2,10 @@ import React, { useState, useEffect } from 'react';
 import { SearchIcon } from '../components/common/Icons';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ArticleCard from '../components/cards/ArticleCard';
+import LoadMoreButton from '../components/common/LoadMoreButton';
+import { fetchAllPages } from '../utils/api';
 
-const ArticlesPage = ({ artigos = [], loading, error }) => {
+const ArticlesPage = ({ artigos = [], loading, error, hasMore, loadingMore, onLoadMore }) => {
   const [searchTerm, setSearchTerm] = useState("");
   const [selectedArea, setSelectedArea] = useState("all");
   const [eventos, setEventos] = useState([]);
@@ -13,12 +15,10 @@ const ArticlesPage = ({ artigos = [], loading, error }) => {
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [resEventos, resEdicoes] = await Promise.all([
-          fetch("http://localhost:8000/eventos"),
-          fetch("http://localhost:8000/edicoes"),
+        const [dataEventos, dataEdicoes] = await Promise.all([
+          fetchAllPages("/eventos/"),
+          fetchAllPages("/edicoes/"),
         ]);
-        const dataEventos = await resEventos.json();
-        const dataEdicoes = await resEdicoes.json();
         setEventos(dataEventos);
         setEdicoes(dataEdicoes);
       } catch (err) {
@@ -74,7 +74,7 @@ const ArticlesPage = ({ artigos = [], loading, error }) => {
         <div className="mb-8">
           <h1 className="text-3xl font-bold text-gray-900 mb-2">Artigos</h1>
           <p className="text-gray-600">
-            Explore nossa coleção de {artigos.length} artigos acadêmicos
+            Explore nossa coleção de {artigos.length}{hasMore ? '+' : ''} artigos acadêmicos
           </p>
         </div>
 
@@ -148,7 +148,9 @@ const ArticlesPage = ({ artigos = [], loading, error }) => {
           ))}
         </div>
 
-        {filteredArtigos.length === 0 && (
+        <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={onLoadMore} />
+
+        {filteredArtigos.length === 0 && !hasMore && (
           <div className="text-center py-12">
             <p className="text-gray-500 text-lg">
               Nenhum artigo encontrado com os critérios de busca.
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useParams, Link, useNavigate } from 'react-router-dom';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ArticleCard from '../components/cards/ArticleCard';
+import { apiFetch } from '../utils/api';
 
 function AuthorDetailPage() {
   const { slug, authorSlug } = useParams();
@@ -20,7 +21,7 @@ function AuthorDetailPage() {
   const checkIfFollowing = async () => {
     if (!autor) return;
     try {
-      const response = await fetch('http://localhost:8000/autores-seguidos', {
+      const response = await apiFetch('/autores-seguidos', {
         headers: {
           'Content-Type': 'application/json',
         },
@@ -41,7 +42,7 @@ function AuthorDetailPage() {
     
     setFollowLoading(true);
     try {
-      const response = await fetch('http://localhost:8000/seguir-autor', {
+      const response = await apiFetch('/seguir-autor', {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
@@ -79,45 +80,44 @@ function AuthorDetailPage() {
         setError(null);
         console.log('Fetching author:', currentSlug);
         
-        // 1. Buscar dados do autor
-        const autorResponse = await fetch(`http://localhost:8000/autores/${currentSlug}`);
-        
-        if (!autorResponse.ok) {
-          if (autorResponse.status === 404 && authorSlug) {
-            console.log('Author not found, trying as event:', authorSlug);
-            navigate(`/eventos/${authorSlug}`, { replace: true });
-            return;
+        // Autor e seus artigos (com edição e evento), página a página
+        const artigosDoAutor = [];
+        let autorData = null;
+        let after = null;
+        do {
+          const params = new URLSearchParams({ limit: '200' });
+          if (after) params.set('after', after);
+          const response = await apiFetch(`/autores/${currentSlug}/artigos?${params}`);
+
+          if (!response.ok) {
+            if (response.status === 404 && authorSlug) {
+              console.log('Author not found, trying as event:', authorSlug);
+              navigate(`/eventos/${authorSlug}`, { replace: true });
+              return;
+            }
+            throw new Error(`Erro ${response.status}: Autor não encontrado`);
           }
-          throw new Error(`Erro ${autorResponse.status}: Autor não encontrado`);
-        }
-        
-        const autorData = await autorResponse.json();
-        console.log('Author data:', autorData);
+
+          const page = await response.json();
+          autorData = autorData || page.autor;
+          artigosDoAutor.push(...page.items);
+          after = page.next;
+        } while (after);
+
         setAutor(autorData);
-        
-        // 2. Buscar todos os artigos e filtrar pelos do autor
-        const artigosResponse = await fetch(`http://localhost:8000/artigos/`);
-        if (artigosResponse.ok) {
-          const artigos = await artigosResponse.json();
-          
-          // Filtrar artigos que têm este autor
-          const artigosDoAutor = artigos.filter(artigo => 
-            artigo.authors && artigo.authors.some(a => a.id === autorData.id)
-          );
-          
-          // Agrupar por ano
-          const agrupadoPorAno = {};
-          artigosDoAutor.forEach(artigo => {
-            const ano = artigo.edicao_id ? new Date().getFullYear() : 'Sem data'; // Ajuste conforme necessário
-            if (!agrupadoPorAno[ano]) {
-              agrupadoPorAno[ano] = [];
-            }
-            agrupadoPorAno[ano].push(artigo);
-          });
-          
-          setArtigosPorAno(agrupadoPorAno);
-          setTotalArtigos(artigosDoAutor.length);
-        }
+
+        // Agrupar pelo ano da edição
+        const agrupadoPorAno = {};
+        artigosDoAutor.forEach(artigo => {
+          const ano = artigo.edition ? artigo.edition.ano : 'Sem data';
+          if (!agrupadoPorAno[ano]) {
+            agrupadoPorAno[ano] = [];
+          }
+          agrupadoPorAno[ano].push(artigo);
+        });
+
+        setArtigosPorAno(agrupadoPorAno);
+        setTotalArtigos(artigosDoAutor.length);
         
       } catch (err) {
         console.error('Fetch error:', err);
@@ -2,8 +2,9 @@ import React, { useState, useEffect } from 'react';
 import { SearchIcon } from '../components/common/Icons';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import AuthorCard from '../components/cards/AuthorCard';
+import LoadMoreButton from '../components/common/LoadMoreButton';
 
-const AuthorsPage = ({ data: authors, loading, error, onReload }) => {
+const AuthorsPage = ({ data: authors, loading, error, onReload, hasMore, loadingMore, onLoadMore }) => {
   const [searchTerm, setSearchTerm] = useState("");
 
   // Auto-reload quando a página é carregada
@@ -34,7 +35,7 @@ const AuthorsPage = ({ data: authors, loading, error, onReload }) => {
         <div className="mb-8">
           <h1 className="text-3xl font-bold text-gray-900 mb-2">Autores</h1>
           <p className="text-gray-600">
-            Conheça os {authorsArray.length} autores de nossa biblioteca
+            Conheça os {authorsArray.length}{hasMore ? '+' : ''} autores de nossa biblioteca
           </p>
           
           {/* Debug info - remover em produção */}
@@ -82,6 +83,8 @@ const AuthorsPage = ({ data: authors, loading, error, onReload }) => {
           </div>
         )}
 
+        <LoadMoreButton hasMore={hasMore} loading={loadingMore} onClick={onLoadMore} />
+
         {filteredAuthors.length === 0 && authorsArray.length > 0 && (
           <div className="text-center py-12">
             <p className="text-gray-500 text-lg">
@@ -1,5 +1,6 @@
 import React, { useEffect, useState } from "react";
 import { useParams, useNavigate } from "react-router-dom";
+import { apiFetch } from "../utils/api";
 
 const EditEventPage = () => {
   const { id } = useParams(); // ID da URL
@@ -16,7 +17,7 @@ const EditEventPage = () => {
   useEffect(() => {
     const fetchEvent = async () => {
       try {
-        const res = await fetch(`http://localhost:8000/eventos/by-id/${id}`);
+        const res = await apiFetch(`/eventos/by-id/${id}`);
         if (!res.ok) throw new Error("Erro ao buscar evento");
         const data = await res.json();
 
@@ -54,7 +55,7 @@ const EditEventPage = () => {
         updateData.entidade_promotora = form.entidade_promotora.trim();
       }
 
-      const res = await fetch(`http://localhost:8000/eventos/${id}`, {
+      const res = await apiFetch(`/eventos/${id}`, {
         method: "PUT",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify(updateData),
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import ArticleCard from '../components/cards/ArticleCard';
+import { apiFetch } from '../utils/api';
 
 function EditionDetailPage() {
   const { slug, ano, eventSlug, year } = useParams();
@@ -21,44 +22,19 @@ function EditionDetailPage() {
         setLoading(true);
         
         // Buscar dados do evento usando slug
-        const eventoResponse = await fetch(`http://localhost:8000/eventos/${currentSlug}`);
+        const eventoResponse = await apiFetch(`/eventos/${currentSlug}`);
         if (!eventoResponse.ok) {
           throw new Error('Evento não encontrado');
         }
         const eventoData = await eventoResponse.json();
         setEvento(eventoData);
 
-        // Tentar buscar dados da edição usando endpoint específico primeiro
-        let edicaoData = null;
-        try {
-          const edicaoResponse = await fetch(`http://localhost:8000/eventos/${currentSlug}/${currentYear}`);
-          if (edicaoResponse.ok) {
-            edicaoData = await edicaoResponse.json();
-          }
-        } catch (e) {
-          console.log('Endpoint específico não disponível, usando fallback');
-        }
-
-        // Se não conseguiu pelo endpoint específico, buscar todas as edições e filtrar
-        if (!edicaoData) {
-          const edicoesResponse = await fetch(`http://localhost:8000/edicoes`);
-          if (!edicoesResponse.ok) {
-            throw new Error('Erro ao carregar edições');
-          }
-          const edicoesData = await edicoesResponse.json();
-          
-          // Encontrar a edição específica
-          const edicaoEncontrada = edicoesData.find(e => 
-            e.evento_id === eventoData.id && 
-            e.ano.toString() === currentYear.toString()
-          );
-          
-          if (!edicaoEncontrada) {
-            throw new Error('Edição não encontrada');
-          }
-          
-          edicaoData = edicaoEncontrada;
+        // Edição pelo slug do evento e ano (GET /eventos/{slug}/{ano})
+        const edicaoResponse = await apiFetch(`/eventos/${currentSlug}/${currentYear}`);
+        if (!edicaoResponse.ok) {
+          throw new Error('Edição não encontrada');
         }
+        const edicaoData = await edicaoResponse.json();
         
         console.log('Edição encontrada:', edicaoData);
         console.log('Dados da edição - Descrição:', edicaoData.descricao);
@@ -69,23 +45,8 @@ function EditionDetailPage() {
 
         // Buscar artigos da edição
         try {
-          const artigosResponse = await fetch(`http://localhost:8000/eventos/${currentSlug}/${currentYear}/artigos`);
-          if (artigosResponse.ok) {
-            const artigosData = await artigosResponse.json();
-            setArtigos(artigosData);
-          } else {
-            // Fallback: buscar todos os artigos e filtrar
-            const allArtigosResponse = await fetch(`http://localhost:8000/artigos`);
-            if (allArtigosResponse.ok) {
-              const allArtigos = await allArtigosResponse.json();
-              const artigosDaEdicao = allArtigos.filter(artigo => 
-                artigo.edicao_id === edicaoData.id
-              );
-              setArtigos(artigosDaEdicao);
-            } else {
-              setArtigos([]);
-            }
-          }
+          const artigosResponse = await apiFetch(`/eventos/${currentSlug}/${currentYear}/artigos`);
+          setArtigos(artigosResponse.ok ? await artigosResponse.json() : []);
         } catch (e) {
           setArtigos([]);
         }
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { SearchIcon} from '../components/common/Icons';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import EditionCard from '../components/cards/EditionCard';
+import { fetchAllPages } from '../utils/api';
 
 const EditionsPage = ({ data: editions, loading, error, onReload }) => {
   const [searchTerm, setSearchTerm] = useState("");
@@ -19,11 +20,7 @@ const EditionsPage = ({ data: editions, loading, error, onReload }) => {
   useEffect(() => {
     const fetchEventos = async () => {
       try {
-        const response = await fetch('http://localhost:8000/eventos');
-        if (response.ok) {
-          const data = await response.json();
-          setEventos(data);
-        }
+        setEventos(await fetchAllPages('/eventos/'));
       } catch (error) {
         console.error('Erro ao carregar eventos:', error);
       }
@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useParams, Link } from 'react-router-dom';
 import LoadingSpinner from '../components/common/LoadingSpinner';
 import EditionCard from '../components/cards/EditionCard';
+import { apiFetch } from '../utils/api';
 
 function EventDetailPage() {
   const { slug } = useParams();
@@ -15,26 +16,14 @@ function EventDetailPage() {
       try {
         setLoading(true);
         
-        // Buscar dados do evento
-        const eventoResponse = await fetch(`http://localhost:8000/eventos/${slug}`);
-        if (!eventoResponse.ok) {
+        // Evento e suas edições (ordenadas por ano) em uma única requisição
+        const resumoResponse = await apiFetch(`/eventos/${slug}/resumo`);
+        if (!resumoResponse.ok) {
           throw new Error('Evento não encontrado');
         }
-        const eventoData = await eventoResponse.json();
+        const { edicoes: edicoesDeste, ...eventoData } = await resumoResponse.json();
         setEvento(eventoData);
-
-        // Buscar edições deste evento
-        const edicoesResponse = await fetch(`http://localhost:8000/edicoes`);
-        if (edicoesResponse.ok) {
-          const edicoesData = await edicoesResponse.json();
-          // Filtrar edições deste evento
-          const edicoesDeste = edicoesData.filter(edicao => 
-            edicao.evento_id === eventoData.id
-          );
-          setEdicoes(edicoesDeste);
-        } else {
-          setEdicoes([]);
-        }
+        setEdicoes(edicoesDeste);
         
       } catch (err) {
         setError(err.message);
@@ -2,6 +2,7 @@ import React, { useState } from "react";
 import { useNavigate } from "react-router-dom";
 import LoadingSpinner from "../components/common/LoadingSpinner";
 import { useAuth } from '../components/common/AuthContext';
+import { apiFetch } from '../utils/api';
 
 const ImportBibtexPage = ({ onReload }) => {
   const [file, setFile] = useState(null);
@@ -52,7 +53,7 @@ const ImportBibtexPage = ({ onReload }) => {
       formData.append("action", "save");
       
       try {
-        const response = await fetch("http://localhost:8000/upload-bibtex", {
+        const response = await apiFetch("/upload-bibtex", {
           method: "POST",
           headers: {
             ...(token && { 'Authorization': `Bearer ${token}` })
@@ -84,8 +85,11 @@ const ImportBibtexPage = ({ onReload }) => {
       formData.append("action", "preview");
       
       try {
-        const response = await fetch("http://localhost:8000/upload-bibtex", {
+        const response = await apiFetch("/upload-bibtex", {
           method: "POST",
+          headers: {
+            ...(token && { 'Authorization': `Bearer ${token}` })
+          },
           body: formData,
         });
 
@@ -114,7 +118,7 @@ const ImportBibtexPage = ({ onReload }) => {
       formData.append("bibtex_file", file);
       formData.append("action", "save");
 
-      const response = await fetch("http://localhost:8000/upload-bibtex", {
+      const response = await apiFetch("/upload-bibtex", {
         method: "POST",
         headers: {
           ...(token && { 'Authorization': `Bearer ${token}` })
@@ -249,6 +253,24 @@ const ImportBibtexPage = ({ onReload }) => {
                   </div>
                 )}
 
+                {relatorio.pdfs && (
+                  <div className="mb-4 p-4 bg-blue-50 rounded">
+                    <h4 className="font-medium text-blue-700 mb-2">
+                      📄 PDFs: {relatorio.pdfs.associados} de {relatorio.pdfs.armazenados} associados
+                    </h4>
+                    {relatorio.pdfs.nao_associados.length > 0 && (
+                      <p className="text-sm text-blue-800">
+                        Sem artigo novo correspondente: {relatorio.pdfs.nao_associados.join(", ")}
+                      </p>
+                    )}
+                    {relatorio.pdfs.erros.map((item, index) => (
+                      <p key={index} className="text-sm text-red-800">
+                        <strong>{item.id}:</strong> {item.erro}
+                      </p>
+                    ))}
+                  </div>
+                )}
+
                 {relatorio.pulados && relatorio.pulados.length > 0 && (
                   <div className="mb-4 p-4 bg-yellow-50 rounded">
                     <h4 className="font-medium text-yellow-700 mb-2">
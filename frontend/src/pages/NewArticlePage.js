@@ -1,5 +1,6 @@
 import React, { useState, useEffect } from "react";
 import { useNavigate, useParams } from "react-router-dom";
+import { fetchAllPages, apiFetch } from "../utils/api";
 
 const NewArticlePage = ({ onReload }) => {
   const { id } = useParams(); // Para detectar se é edição
@@ -22,11 +23,10 @@ const NewArticlePage = ({ onReload }) => {
     // Carregar edições disponíveis com informações do evento
     const carregarEdicoes = async () => {
       try {
-        const edicoesRes = await fetch("http://localhost:8000/edicoes");
-        const edicoesData = await edicoesRes.json();
-        
-        const eventosRes = await fetch("http://localhost:8000/eventos");
-        const eventosData = await eventosRes.json();
+        const [edicoesData, eventosData] = await Promise.all([
+          fetchAllPages("/edicoes/"),
+          fetchAllPages("/eventos/"),
+        ]);
         
         // Combinar dados das edições com informações dos eventos
         const edicoesComEventos = edicoesData.map(edicao => {
@@ -49,7 +49,7 @@ const NewArticlePage = ({ onReload }) => {
   // Carregar dados do artigo se for edição
   useEffect(() => {
     if (isEditing) {
-      fetch(`http://localhost:8000/artigos/${id}`)
+      apiFetch(`/artigos/${id}`)
         .then(res => res.json())
         .then(data => {
           setForm({
@@ -74,8 +74,8 @@ const NewArticlePage = ({ onReload }) => {
     const file = e.target.files[0];
     setPdfFile(file);
     if (file) {
-      // Definir o caminho onde o arquivo será salvo
-      setForm(prev => ({ ...prev, pdf_path: `uploads/${file.name}` }));
+      // O caminho definitivo (/pdfs/<sha256>) é devolvido pelo upload no envio do formulário
+      setForm(prev => ({ ...prev, pdf_path: file.name }));
     }
   };
 
@@ -145,14 +145,34 @@ const NewArticlePage = ({ onReload }) => {
       formData.append('edicao_id', form.edicao_id);
       formData.append('autores', JSON.stringify(autoresData));
       
+      // Envio de PDFs e publicação de artigos são restritos a administradores
+      const token = localStorage.getItem('authToken');
+
       if (pdfFile) {
-        formData.append('pdf_file', pdfFile);
+        // O PDF vai para o armazenamento por hash; o artigo guarda só a URL
+        const pdfData = new FormData();
+        pdfData.append('pdf_file', pdfFile);
+        const pdfRes = await apiFetch("/pdfs", {
+          method: "POST",
+          headers: {
+            ...(token && { 'Authorization': `Bearer ${token}` })
+          },
+          body: pdfData,
+        });
+        if (!pdfRes.ok) {
+          const errData = await pdfRes.json().catch(() => ({}));
+          throw new Error(`Erro ao enviar PDF: ${errData.detail || pdfRes.status}`);
+        }
+        const { url: pdfUrl } = await pdfRes.json();
+        formData.append('pdf_path', pdfUrl);
+      } else if (form.pdf_path) {
+        formData.append('pdf_path', form.pdf_path);
       }
 
       // CORREÇÃO: Usar endpoint correto para edição
       const url = isEditing 
-        ? `http://localhost:8000/artigos/${id}/form`  // Endpoint específico para FormData
-        : "http://localhost:8000/artigos";
+        ? `/artigos/${id}/form`  // Endpoint específico para FormData
+        : "/artigos";
       const method = isEditing ? "PUT" : "POST";
       
       // Não precisamos de flags extras para edição
@@ -166,8 +186,11 @@ const NewArticlePage = ({ onReload }) => {
         edicao_id: form.edicao_id
       });
 
-      const res = await fetch(url, {
+      const res = await apiFetch(url, {
         method: method,
+        headers: {
+          ...(token && { 'Authorization': `Bearer ${token}` })
+        },
         body: formData,  // Usar FormData em vez de JSON
       });
 
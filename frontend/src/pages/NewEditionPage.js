@@ -2,6 +2,7 @@ import React, { useState, useEffect } from 'react';
 import { useNavigate, useParams } from 'react-router-dom';
 import { useAuth } from '../components/common/AuthContext';
 import LoadingSpinner from '../components/common/LoadingSpinner';
+import { fetchAllPages, apiFetch } from '../utils/api';
 
 const NewEditionPage = () => {
   const { id } = useParams();
@@ -41,10 +42,7 @@ const NewEditionPage = () => {
     
     const fetchEventos = async () => {
       try {
-        const response = await fetch('http://localhost:8000/eventos');
-        if (!response.ok) throw new Error('Erro ao carregar eventos');
-        const data = await response.json();
-        setEventos(data);
+        setEventos(await fetchAllPages('/eventos/'));
       } catch (error) {
         console.error('Erro ao carregar eventos:', error);
       } finally {
@@ -62,7 +60,7 @@ const NewEditionPage = () => {
     const fetchEdicao = async () => {
       try {
         setLoading(true);
-        const response = await fetch(`http://localhost:8000/edicoes/${id}`);
+        const response = await apiFetch(`/edicoes/${id}`);
         if (!response.ok) throw new Error('Edição não encontrada');
         const data = await response.json();
         
@@ -169,7 +167,7 @@ const NewEditionPage = () => {
     setLoading(true);
     try {
       const token = localStorage.getItem('authToken');
-      const url = id ? `http://localhost:8000/edicoes/${id}` : 'http://localhost:8000/edicoes';
+      const url = id ? `/edicoes/${id}` : '/edicoes';
       const method = id ? 'PUT' : 'POST';
 
       const requestData = {
@@ -180,7 +178,7 @@ const NewEditionPage = () => {
 
       console.log('Enviando dados para criação de edição:', requestData);
 
-      const response = await fetch(url, {
+      const response = await apiFetch(url, {
         method,
         headers: {
           'Content-Type': 'application/json',
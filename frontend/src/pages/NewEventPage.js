@@ -1,6 +1,7 @@
 import React, { useState } from "react";
 import { useNavigate } from "react-router-dom";
 import { useAuth } from "../components/common/AuthContext";
+import { apiFetch } from "../utils/api";
 
 const NewEventPage = () => {
   const [form, setForm] = useState({
@@ -28,7 +29,7 @@ const NewEventPage = () => {
         admin_id: user?.id
       };
 
-      const res = await fetch("http://localhost:8000/eventos", {
+      const res = await apiFetch("/eventos", {
         method: "POST",
         headers: { "Content-Type": "application/json" },
         body: JSON.stringify(eventData),
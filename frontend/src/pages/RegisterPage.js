@@ -1,8 +1,11 @@
 // src/pages/RegisterPage.jsx
 import React, { useState } from "react";
 import { EmailIcon } from "../components/common/Icons";
+import { apiFetch } from "../utils/api";
+import { useAuth } from "../components/common/AuthContext";
 
 const RegisterPage = () => {
+  const { isAdmin } = useAuth();
   const [perfil, setPerfil] = useState(""); // "usuario" | "admin"
   const [inputs, setInputs] = useState({
     nome: "",
@@ -32,11 +35,17 @@ const RegisterPage = () => {
 
     setLoading(true);
     try {
-      const url = "http://127.0.0.1:8000/usuarios/";
+      const url = "/usuarios/";
 
-      const resposta = await fetch(url, {
+      // O servidor só respeita o perfil escolhido quando quem cadastra é um
+      // administrador logado; no cadastro público a conta é sempre "usuario"
+      const token = localStorage.getItem("authToken");
+      const resposta = await apiFetch(url, {
         method: "POST",
-        headers: { "Content-Type": "application/json" },
+        headers: {
+          "Content-Type": "application/json",
+          ...(token && { Authorization: `Bearer ${token}` }),
+        },
         body: JSON.stringify({
           nome: inputs.nome,
           email: inputs.email,
@@ -92,17 +101,20 @@ const RegisterPage = () => {
                 >
                   Usuário
                 </button>
-                <button
-                  type="button"
-                  onClick={() => setPerfil("admin")}
-                  className={`rounded-lg border px-4 py-2.5 text-sm transition ${
-                    perfil === "admin"
-                      ? "border-blue-600 bg-blue-50 text-blue-700"
-                      : "border-gray-300 bg-white text-gray-700 hover:bg-gray-50"
-                  }`}
-                >
-                  Administrador
-                </button>
+                {/* Só um administrador logado cadastra outros administradores */}
+                {isAdmin() && (
+                  <button
+                    type="button"
+                    onClick={() => setPerfil("admin")}
+                    className={`rounded-lg border px-4 py-2.5 text-sm transition ${
+                      perfil === "admin"
+                        ? "border-blue-600 bg-blue-50 text-blue-700"
+                        : "border-gray-300 bg-white text-gray-700 hover:bg-gray-50"
+                    }`}
+                  >
+                    Administrador
+                  </button>
+                )}
               </div>
               {!perfil && (
                 <p className="text-xs text-gray-500 mt-2">
@@ -1,5 +1,13 @@
 export const API_BASE_URL = 'http://localhost:8000';
 
+// Todas as chamadas à API passam por aqui. credentials: 'include' envia o
+// cookie de "ler o que escreveu": após uma escrita, as leituras deste navegador
+// vão ao banco primário por alguns segundos (ver backend/app/replica.py).
+// O cookie é do host de API_BASE_URL; chamar o mesmo backend por outro nome
+// (127.0.0.1 em vez de localhost) não o enviaria.
+export const apiFetch = (path, options = {}) =>
+  fetch(`${API_BASE_URL}${path}`, { ...options, credentials: 'include' });
+
 export const apiEndpoints = {
   artigos: '/artigos',
   autores: '/autores',
@@ -14,7 +22,7 @@ export const apiEndpoints = {
 
 export const fetchData = async (endpoint) => {
   try {
-    const response = await fetch(`${API_BASE_URL}${endpoint}`);
+    const response = await apiFetch(endpoint);
     if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
     return await response.json();
   } catch (error) {
@@ -23,17 +31,43 @@ export const fetchData = async (endpoint) => {
   }
 };
 
+// Rotas de lista devolvem páginas {items, next}; `after` é o cursor `next`
+// da página anterior
+export const fetchPage = async (endpoint, { limit = 50, after = null } = {}) => {
+  const params = new URLSearchParams({ limit });
+  if (after) params.set('after', after);
+  const response = await apiFetch(`${endpoint}?${params}`);
+  if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+  return await response.json();
+};
+
+// Segue os cursores até o fim e devolve todos os itens (limit máximo aceito
+// pelo backend: 200). Passo de compatibilidade, só para eventos e edições:
+// listas curtas que os selects e a junção edição -> evento precisam inteiras.
+// Artigos e autores crescem com o acervo e são exibidos uma página por vez
+// (usePaginatedApi em hooks/useApi.js).
+export const fetchAllPages = async (endpoint, pageSize = 200) => {
+  const items = [];
+  let after = null;
+  do {
+    const page = await fetchPage(endpoint, { limit: pageSize, after });
+    items.push(...page.items);
+    after = page.next;
+  } while (after);
+  return items;
+};
+
 // Specific API functions for each endpoint
 export const api = {
   // GET requests
-  getArtigos: () => fetchData(apiEndpoints.artigos),
-  getAutores: () => fetchData(apiEndpoints.autores),
-  getEventos: () => fetchData(apiEndpoints.eventos),
-  getEdicoes: () => fetchData(apiEndpoints.edicoes),
+  getArtigos: (page) => fetchPage(`${apiEndpoints.artigos}/`, page),
+  getAutores: (page) => fetchPage(`${apiEndpoints.autores}/`, page),
+  getEventos: () => fetchAllPages(`${apiEndpoints.eventos}/`),
+  getEdicoes: () => fetchAllPages(`${apiEndpoints.edicoes}/`),
   
   // POST requests
   createArtigo: async (artigoData) => {
-    const response = await fetch(`${API_BASE_URL}${apiEndpoints.artigos}`, {
+    const response = await apiFetch(apiEndpoints.artigos, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -45,7 +79,7 @@ export const api = {
   },
   
   createAutor: async (autorData) => {
-    const response = await fetch(`${API_BASE_URL}${apiEndpoints.autores}`, {
+    const response = await apiFetch(apiEndpoints.autores, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -57,7 +91,7 @@ export const api = {
   },
   
   createEvento: async (eventoData) => {
-    const response = await fetch(`${API_BASE_URL}${apiEndpoints.eventos}`, {
+    const response = await apiFetch(apiEndpoints.eventos, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -69,7 +103,7 @@ export const api = {
   },
   
   createEdicao: async (edicaoData) => {
-    const response = await fetch(`${API_BASE_URL}${apiEndpoints.edicoes}`, {
+    const response = await apiFetch(apiEndpoints.edicoes, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -82,7 +116,7 @@ export const api = {
 
   // PUT requests
   updateEvent: async (eventoId, eventoData) => {
-    const response = await fetch(`${API_BASE_URL}/eventos/${eventoId}`, {
+    const response = await apiFetch(`/eventos/${eventoId}`, {
       method: 'PUT',
       headers: {
         'Content-Type': 'application/json',
@@ -95,7 +129,7 @@ export const api = {
 
   // DELETE requests  
   deleteEvent: async (eventoId) => {
-    const response = await fetch(`${API_BASE_URL}/eventos/${eventoId}`, {
+    const response = await apiFetch(`/eventos/${eventoId}`, {
       method: 'DELETE',
       headers: {
         'Content-Type': 'application/json',
@@ -109,7 +143,7 @@ export const api = {
 // Authentication API functions
 export const authAPI = {
   login: async (email, password) => {
-    const response = await fetch(`${API_BASE_URL}${apiEndpoints.login}`, {
+    const response = await apiFetch(apiEndpoints.login, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -121,7 +155,7 @@ export const authAPI = {
   },
   
   register: async (userData) => {
-    const response = await fetch(`${API_BASE_URL}${apiEndpoints.register}`, {
+    const response = await apiFetch(apiEndpoints.register, {
       method: 'POST',
       headers: {
         'Content-Type': 'application/json',
@@ -133,7 +167,7 @@ export const authAPI = {
   },
 
   getCurrentUser: async (token) => {
-    const response = await fetch(`${API_BASE_URL}${apiEndpoints.me}`, {
+    const response = await apiFetch(apiEndpoints.me, {
       method: 'GET',
       headers: {
         'Content-Type': 'application/json',
@@ -2,10 +2,15 @@ import os
 os.environ["TEST_MODE"] = "1"  # Define TEST_MODE antes de importar database e models
 
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from backend.app.database import Base, engine, SessionLocal
+from sqlalchemy import event
+from backend.app.database import Base, engine, async_engine, SessionLocal, AsyncSessionLocal
+from backend.app.cache import reset_caches
 from backend.app.models import Event, Edition, Author, Article  # Importamos os modelos
 from backend.app.main import app, get_db
+from backend.app.auth import create_access_token
+from types import SimpleNamespace
 import tempfile
 import shutil
 
@@ -17,6 +22,7 @@ def test_db():
     # Limpamos e recriamos todas as tabelas em cada teste
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    reset_caches()  # o banco é recriado; entradas de testes anteriores ficariam inválidas
     
     try:
         yield db
@@ -27,17 +33,45 @@ def test_db():
 
 @pytest.fixture(scope="function")
 def client(test_db):  # Adicionamos test_db como dependência
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass  # O rollback e fechamento serão feitos no fixture test_db
+    # As rotas usam AsyncSession; test_db (síncrona) e a sessão abaixo
+    # compartilham o mesmo arquivo SQLite de testes
+    async def override_get_db():
+        async with AsyncSessionLocal() as db:
+            yield db
     
     app.dependency_overrides[get_db] = override_get_db
     client = TestClient(app)
     yield client
     app.dependency_overrides.clear()  # Limpamos os overrides
 
+@pytest.fixture(scope="function")
+def admin_headers():
+    # Importação BibTeX, lote de artigos e envio de PDFs exigem um administrador
+    admin = SimpleNamespace(id=1, nome="Admin", email="admin@example.com", perfil="admin")
+    return {"Authorization": f"Bearer {create_access_token(admin)}"}
+
+@pytest.fixture(scope="function")
+def contar_queries():
+    """
+    Coleta as instruções SQL que as rotas executam.
+    Uso: with contar_queries() as statements: client.get(...)
+    """
+    @contextmanager
+    def contar():
+        statements = []
+
+        def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        sync_engine = async_engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", before_cursor_execute)
+
+    return contar
+
 @pytest.fixture(scope="function")
 def temp_upload_dir():
     temp_dir = tempfile.mkdtemp()
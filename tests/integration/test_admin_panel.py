@@ -59,7 +59,7 @@ async def test_get_events_in_admin_panel(client, test_db):
     
     response = client.get("/eventos/")
     assert response.status_code == 200
-    events = response.json()
+    events = response.json()["items"]
     assert len(events) == 2
     assert events[0]["nome"] == "Evento 1"
 
@@ -74,7 +74,7 @@ async def test_get_authors_in_admin_panel(client, test_db):
     
     response = client.get("/autores/")
     assert response.status_code == 200
-    authors = response.json()
+    authors = response.json()["items"]
     assert len(authors) == 2
     assert authors[0]["nome"] == "Alan"
 
@@ -99,7 +99,7 @@ async def test_get_articles_in_admin_panel(client, test_db):
     
     response = client.get("/artigos/")
     assert response.status_code == 200
-    articles = response.json()
+    articles = response.json()["items"]
     assert len(articles) == 1
     assert articles[0]["titulo"] == "Artigo 1"
 
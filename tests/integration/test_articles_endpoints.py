@@ -37,7 +37,7 @@ async def test_get_events(client, test_db):
     
     response = client.get("/eventos/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 2
     assert data[0]["nome"] == "Conferência 1"
     assert data[1]["nome"] == "Conferência 2"
@@ -91,13 +91,13 @@ async def test_get_authors(client, test_db):
     
     response = client.get("/autores/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 2
     assert data[0]["nome"] == "Alan"
     assert data[1]["nome"] == "Ada"
 
 @pytest.mark.asyncio
-async def test_create_article(client, test_db):
+async def test_create_article(client, test_db, admin_headers):
     # Criar evento, edição e autor primeiro
     event = Event(nome="Conferência de IA", slug="conf-ia")
     test_db.add(event)
@@ -112,6 +112,7 @@ async def test_create_article(client, test_db):
     
     response = client.post(
         "/artigos/",
+        headers=admin_headers,
         json={
             "titulo": "Inteligência Artificial",
             "area": "Computação",
@@ -166,7 +167,7 @@ async def test_get_articles(client, test_db):
     # Fazer requisição GET para listar artigos
     response = client.get("/artigos/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 2
     assert data[0]["titulo"] == "Inteligência Artificial"
     assert data[1]["titulo"] == "Computação Quântica"
@@ -189,7 +190,7 @@ async def test_get_editions(client, test_db):
     
     response = client.get("/edicoes/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 2
     assert data[0]["ano"] == 2024
     assert data[1]["ano"] == 2023
@@ -226,7 +227,7 @@ async def test_get_users(client, test_db):
     
     response = client.get("/usuarios/")
     assert response.status_code == 200
-    data = response.json()
+    data = response.json()["items"]
     assert len(data) == 2
     assert data[0]["nome"] == "João"
     assert data[1]["nome"] == "Maria"
@@ -259,6 +260,39 @@ async def test_login(client, test_db):
     assert data["perfil"] == "usuario"
     assert "access_token" in data
 
+
+@pytest.mark.asyncio
+async def test_login_regrava_hash_legado(client, test_db):
+    from backend.app.models import User
+
+    # Usuário antigo, com SHA-256 sem salt
+    user = User(nome="João", email="joao@example.com", senha_hash=hash_password("senha123"), perfil="usuario")
+    test_db.add(user)
+    test_db.commit()
+
+    response = client.post("/login/", json={"email": "joao@example.com", "password": "senha123"})
+    assert response.status_code == 200
+
+    test_db.refresh(user)
+    assert user.senha_hash.startswith("scrypt$")
+
+    # O novo hash continua aceitando a mesma senha, e só ela
+    assert client.post("/login/", json={"email": "joao@example.com", "password": "senha123"}).status_code == 200
+    assert client.post("/login/", json={"email": "joao@example.com", "password": "errada"}).status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_cadastro_grava_scrypt(client, test_db):
+    from backend.app.models import User
+
+    response = client.post("/usuarios/", json={
+        "nome": "Maria", "email": "maria@example.com", "senha_hash": "segredo", "perfil": "usuario",
+    })
+    assert response.status_code == 200
+    user = test_db.query(User).filter_by(email="maria@example.com").one()
+    assert user.senha_hash.startswith("scrypt$")
+    assert "segredo" not in user.senha_hash
+
 @pytest.mark.asyncio
 async def test_login_invalid(client, test_db):
     response = client.post(
@@ -403,3 +437,73 @@ async def test_get_author_by_existing_slug(client, test_db):
     assert data["sobrenome"] == "Freitas"
     assert data["slug"] == "davi-freitas"
     print(f"✓ Autor encontrado: {data['nome']} {data['sobrenome']} ({data['slug']})")
+
+
+def _contar_queries_listagem(client, test_db, contar_queries, n_artigos):
+    """Cria n artigos com 2 autores cada e conta os SELECTs de GET /artigos/"""
+
+    evento = Event(nome=f"Conferência {n_artigos}", slug=f"conf-{n_artigos}")
+    test_db.add(evento)
+    test_db.commit()
+    edicao = Edition(ano=2024, evento_id=evento.id)
+    test_db.add(edicao)
+    test_db.commit()
+    for i in range(n_artigos):
+        artigo = Article(titulo=f"Artigo {i}", edicao_id=edicao.id)
+        artigo.authors.append(Author(nome=f"Autor{n_artigos}", sobrenome=f"A{i}"))
+        artigo.authors.append(Author(nome=f"Autor{n_artigos}", sobrenome=f"B{i}"))
+        test_db.add(artigo)
+    test_db.commit()
+    test_db.expire_all()
+
+    with contar_queries() as statements:
+        response = client.get("/artigos/", params={"limit": 200})
+
+    assert response.status_code == 200
+    assert all(len(a["authors"]) == 2 for a in response.json()["items"])
+    return len(statements)
+
+
+@pytest.mark.asyncio
+async def test_listagem_artigos_sem_n_mais_1(client, test_db, contar_queries):
+    """O número de consultas para listar artigos não deve crescer com o número de artigos"""
+    poucos = _contar_queries_listagem(client, test_db, contar_queries, 2)
+    muitos = _contar_queries_listagem(client, test_db, contar_queries, 20)
+    assert poucos == muitos
+
+
+@pytest.mark.asyncio
+async def test_create_articles_batch(client, test_db, admin_headers):
+    event = Event(nome="Conferência de IA", slug="conf-ia")
+    test_db.add(event)
+    test_db.commit()
+    edition = Edition(ano=2024, evento_id=event.id)
+    author1 = Author(nome="Alan", sobrenome="Turing")
+    author2 = Author(nome="Ada", sobrenome="Lovelace")
+    test_db.add_all([edition, author1, author2])
+    test_db.commit()
+
+    response = client.post(
+        "/artigos/lote",
+        headers=admin_headers,
+        json=[
+            {"titulo": "Artigo 1", "edicao_id": edition.id, "author_ids": [author1.id, author2.id]},
+            {"titulo": "Artigo 2", "edicao_id": 9999, "author_ids": [author1.id]},
+            {"titulo": "Artigo 3", "edicao_id": edition.id, "author_ids": [author2.id, 9999]},
+            {"titulo": "Artigo 4", "edicao_id": edition.id, "author_ids": [author2.id, author2.id]},
+        ]
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["criados"] == 2
+    assert data["erros"] == 2
+    resultados = data["resultados"]
+    assert resultados[0]["id"] is not None and resultados[0]["erro"] is None
+    assert "Edição 9999" in resultados[1]["erro"]
+    assert "9999" in resultados[2]["erro"] and resultados[2]["id"] is None
+    assert resultados[3]["id"] is not None
+
+    artigo = client.get(f"/artigos/{resultados[0]['id']}").json()
+    assert {a["nome"] for a in artigo["authors"]} == {"Alan", "Ada"}
+    artigo = client.get(f"/artigos/{resultados[3]['id']}").json()
+    assert [a["nome"] for a in artigo["authors"]] == ["Ada"]
@@ -0,0 +1,153 @@
+from types import SimpleNamespace
+
+import jwt
+import pytest
+
+from backend.app import auth, routes
+from backend.app.models import User
+from backend.app.passwords import hash_password
+
+
+def _usuario(perfil="usuario"):
+    return SimpleNamespace(id=7, nome="Maria", email="maria@example.com", perfil=perfil)
+
+
+ANTIGO = "segredo-antigo-com-32-bytes-ou-mais"
+NOVO = "segredo-novo-com-32-bytes-ou-mais!!"
+
+
+def _bearer(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.mark.asyncio
+async def test_login_devolve_jwt_com_claims(client, test_db):
+    test_db.add(User(nome="Maria", email="maria@example.com", senha_hash=hash_password("senha"), perfil="admin"))
+    test_db.commit()
+
+    data = client.post("/login/", json={"email": "maria@example.com", "password": "senha"}).json()
+    assert data["token_type"] == "bearer"
+
+    claims = auth.decode_access_token(data["access_token"])
+    assert (claims.id, claims.nome, claims.perfil) == (data["id"], "Maria", "admin")
+
+
+@pytest.mark.asyncio
+async def test_login_com_email_desconhecido_tambem_confere_senha(client, test_db, monkeypatch):
+    # Sem o scrypt, "email inexistente" responderia bem mais rápido que "senha errada"
+    conferidos = []
+    verificar = routes.verify_password_async
+
+    async def verify_password_async(password, stored):
+        conferidos.append(stored)
+        return await verificar(password, stored)
+
+    monkeypatch.setattr(routes, "verify_password_async", verify_password_async)
+
+    response = client.post("/login/", json={"email": "ninguem@example.com", "password": "senha"})
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Email ou senha inválidos"
+    assert len(conferidos) == 1 and conferidos[0].startswith("scrypt$")
+
+
+@pytest.mark.asyncio
+async def test_me_sem_consultar_o_banco(client, test_db, contar_queries):
+    token = auth.create_access_token(_usuario())
+    with contar_queries() as statements:
+        response = client.get("/me", headers=_bearer(token))
+
+    assert response.status_code == 200
+    assert response.json() == {"id": 7, "nome": "Maria", "email": "maria@example.com", "perfil": "usuario"}
+    assert statements == []
+
+
+@pytest.mark.asyncio
+async def test_me_sem_token_ou_com_token_invalido(client, test_db):
+    assert client.get("/me").status_code == 401
+
+    token = auth.create_access_token(_usuario())
+    adulterado = token[:-2] + ("AA" if not token.endswith("AA") else "BB")
+    response = client.get("/me", headers=_bearer(adulterado))
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token inválido"
+
+
+@pytest.mark.asyncio
+async def test_token_expirado(client, test_db):
+    token = auth.create_access_token(_usuario(), expires_minutes=-1)
+    response = client.get("/me", headers=_bearer(token))
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token expirado"
+
+
+@pytest.mark.asyncio
+async def test_rotacao_de_chaves(client, test_db, monkeypatch):
+    monkeypatch.setattr(auth, "KEYS", [("k1", ANTIGO)])
+    antigo = auth.create_access_token(_usuario())
+
+    # Nova chave passa a assinar; a antiga continua validando
+    monkeypatch.setattr(auth, "KEYS", [("k2", NOVO), ("k1", ANTIGO)])
+    novo = auth.create_access_token(_usuario())
+    assert jwt.get_unverified_header(novo)["kid"] == "k2"
+    assert client.get("/me", headers=_bearer(antigo)).status_code == 200
+    assert client.get("/me", headers=_bearer(novo)).status_code == 200
+
+    # Chave antiga removida: tokens emitidos com ela deixam de valer
+    monkeypatch.setattr(auth, "KEYS", [("k2", NOVO)])
+    assert client.get("/me", headers=_bearer(antigo)).status_code == 401
+    assert client.get("/me", headers=_bearer(novo)).status_code == 200
+
+
+def test_load_keys(monkeypatch):
+    monkeypatch.setenv("JWT_KEYS", "k2:novo, k1:antigo")
+    assert auth.load_keys() == [("k2", "novo"), ("k1", "antigo")]
+
+    monkeypatch.delenv("JWT_KEYS")
+    monkeypatch.setenv("JWT_SECRET", "unico")
+    assert auth.load_keys() == [("default", "unico")]
+
+
+@pytest.mark.asyncio
+async def test_rota_de_admin(client, test_db):
+    assert client.get("/internal/cache").status_code == 401
+
+    usuario = auth.create_access_token(_usuario("usuario"))
+    response = client.get("/internal/cache", headers=_bearer(usuario))
+    assert response.status_code == 403
+    assert response.json()["detail"] == "Acesso restrito a administradores"
+
+    admin = auth.create_access_token(_usuario("admin"))
+    assert client.get("/internal/cache", headers=_bearer(admin)).status_code == 200
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("rota", ["/upload-bibtex", "/artigos/", "/artigos/lote", "/pdfs"])
+async def test_escritas_no_acervo_exigem_admin(client, test_db, rota):
+    # O 401/403 vem antes da validação do corpo (formulário ou JSON ausentes)
+    assert client.post(rota).status_code == 401
+
+    usuario = auth.create_access_token(_usuario("usuario"))
+    response = client.post(rota, headers=_bearer(usuario))
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_cadastro_publico_nao_escolhe_perfil(client, test_db):
+    novo = {"nome": "Eva", "email": "eva@example.com", "senha_hash": "senha", "perfil": "admin"}
+    assert client.post("/usuarios/", json=novo).json()["perfil"] == "usuario"
+
+    token = client.post("/login/", json={"email": "eva@example.com", "password": "senha"}).json()["access_token"]
+    assert client.get("/internal/pool", headers=_bearer(token)).status_code == 403
+
+    # Um usuário comum autenticado também não atribui perfis
+    novo = {**novo, "email": "eva2@example.com"}
+    usuario = auth.create_access_token(_usuario("usuario"))
+    assert client.post("/usuarios/", json=novo, headers=_bearer(usuario)).json()["perfil"] == "usuario"
+
+
+@pytest.mark.asyncio
+async def test_admin_cadastra_outro_admin(client, test_db, admin_headers):
+    novo = {"nome": "Eva", "email": "eva@example.com", "senha_hash": "senha", "perfil": "admin"}
+    response = client.post("/usuarios/", json=novo, headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["perfil"] == "admin"
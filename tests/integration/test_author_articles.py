@@ -0,0 +1,81 @@
+import pytest
+
+from backend.app.models import Event, Edition, Author, Article
+
+
+def _seed(test_db):
+    evento = Event(nome="Simpósio Brasileiro de Bancos de Dados", slug="sbbd")
+    test_db.add(evento)
+    test_db.commit()
+    edicao = Edition(ano=2024, evento_id=evento.id)
+    test_db.add(edicao)
+    test_db.commit()
+    ada = Author(nome="Ada", sobrenome="Lovelace")
+    alan = Author(nome="Alan", sobrenome="Turing")
+    grace = Author(nome="Grace", sobrenome="Hopper")
+    outro = Author(nome="Edsger", sobrenome="Dijkstra")
+    test_db.add_all([
+        Article(titulo="A1", edicao_id=edicao.id, authors=[ada, alan]),
+        Article(titulo="A2", edicao_id=edicao.id, authors=[ada, alan, grace]),
+        Article(titulo="A3", edicao_id=edicao.id, authors=[ada]),
+        Article(titulo="B1", edicao_id=edicao.id, authors=[outro, grace]),
+    ])
+    test_db.commit()
+
+
+@pytest.mark.asyncio
+async def test_artigos_do_autor_com_edicao_e_evento(client, test_db):
+    _seed(test_db)
+
+    response = client.get("/autores/ada-lovelace/artigos")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["autor"]["slug"] == "ada-lovelace"
+    assert [a["titulo"] for a in data["items"]] == ["A1", "A2", "A3"]
+    assert data["items"][0]["edition"]["ano"] == 2024
+    assert data["items"][0]["edition"]["event"]["slug"] == "sbbd"
+    assert data["next"] is None
+
+
+@pytest.mark.asyncio
+async def test_coautores_ordenados_por_frequencia(client, test_db):
+    _seed(test_db)
+
+    coautores = client.get("/autores/ada-lovelace/artigos").json()["coautores"]
+    assert [(c["slug"], c["total_artigos"]) for c in coautores] == [
+        ("alan-turing", 2),
+        ("grace-hopper", 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_artigos_do_autor_paginados(client, test_db):
+    _seed(test_db)
+
+    page = client.get("/autores/ada-lovelace/artigos", params={"limit": 2}).json()
+    assert [a["titulo"] for a in page["items"]] == ["A1", "A2"]
+    assert page["coautores"] is not None
+
+    page = client.get("/autores/ada-lovelace/artigos", params={"limit": 2, "after": page["next"]}).json()
+    assert [a["titulo"] for a in page["items"]] == ["A3"]
+    assert page["next"] is None
+    # Coautores só são calculados na primeira página
+    assert page["coautores"] is None
+
+
+@pytest.mark.asyncio
+async def test_artigos_do_autor_consultas_constantes(client, test_db, contar_queries):
+    _seed(test_db)
+    with contar_queries() as statements:
+        response = client.get("/autores/ada-lovelace/artigos")
+
+    assert response.status_code == 200
+    # autor, artigos (+edição/evento), autores dos artigos, coautores
+    assert len([s for s in statements if "versoes_tabelas" not in s]) == 4
+
+
+@pytest.mark.asyncio
+async def test_artigos_de_autor_inexistente(client, test_db):
+    response = client.get("/autores/nao-existe/artigos")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Autor não encontrado"
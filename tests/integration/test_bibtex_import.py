@@ -0,0 +1,199 @@
+import hashlib
+import io
+import os
+import zipfile
+import pytest
+from backend.app import pdf_storage
+from backend.app.models import Event, Edition, Author, Article
+from backend.app.bibtex_import import iter_bibtex_entries, parse_entry, split_author_name
+
+SAMPLE_BIB = os.path.join(os.path.dirname(__file__), "..", "..", "uploads", "bibtexex.bib")
+
+
+def _sample_bytes():
+    with open(SAMPLE_BIB, "rb") as f:
+        return f.read()
+
+
+def test_iter_bibtex_entries_em_blocos_pequenos():
+    # Blocos de 7 bytes forçam entradas (e caracteres UTF-8) divididos entre leituras
+    entradas = list(iter_bibtex_entries(io.BytesIO(_sample_bytes()), chunk_size=7))
+    assert len(entradas) == 4
+    assert entradas[0].startswith("@inproceedings{sbes-paper1")
+    assert parse_entry(entradas[1])["autores"][0] == ("Fábio", "Santos")
+
+
+def test_split_author_name():
+    assert split_author_name("Davi Freitas") == ("Davi", "Freitas")
+    assert split_author_name("Lovelace, Ada") == ("Ada", "Lovelace")
+    assert split_author_name("Turing") == ("Turing", "")
+
+
+@pytest.mark.asyncio
+async def test_upload_bibtex_preview(client, test_db, admin_headers):
+    response = client.post(
+        "/upload-bibtex",
+        headers=admin_headers,
+        files={"bibtex_file": ("bibtexex.bib", _sample_bytes())},
+        data={"action": "preview"},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] == 4
+    assert data["articles"][0]["titulo"] == "Robotic-supported Data Loss Detection in Android Applications"
+    assert data["articles"][0]["data_publicacao"] == 2024
+    assert test_db.query(Article).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_upload_bibtex_save(client, test_db, admin_headers):
+    # Evento já existente deve ser reaproveitado pelo booktitle
+    evento = Event(nome="Anais do XXXVIII Simpósio Brasileiro de Engenharia de Software", slug="sbes")
+    test_db.add(evento)
+    test_db.add(Author(nome="Davi", sobrenome="Freitas"))
+    test_db.commit()
+
+    response = client.post(
+        "/upload-bibtex",
+        headers=admin_headers,
+        files={"bibtex_file": ("bibtexex.bib", _sample_bytes())},
+        data={"action": "save"},
+    )
+    assert response.status_code == 200
+    relatorio = response.json()["relatorio"]
+    assert relatorio["processados"] == 4
+    assert relatorio["cadastrados"] == 3
+    assert relatorio["pulados"] == [{"id": "sbes-paper2", "motivo": "Sem ano"}]
+    assert relatorio["erros"] == []
+    assert len(relatorio["edicoes_criadas"]) == 1
+
+    assert test_db.query(Event).count() == 1
+    assert test_db.query(Edition).filter(Edition.evento_id == evento.id, Edition.ano == 2024).count() == 1
+    # "Davi Freitas" aparece no arquivo e já existia: não é duplicado
+    assert test_db.query(Author).filter(Author.slug == "davi-freitas").count() == 1
+    artigo = test_db.query(Article).filter(Article.titulo.like("Robotic%")).one()
+    assert len(artigo.authors) == 3
+
+    # Reimportar o mesmo arquivo não duplica artigos
+    response = client.post(
+        "/upload-bibtex",
+        headers=admin_headers,
+        files={"bibtex_file": ("bibtexex.bib", _sample_bytes())},
+        data={"action": "save"},
+    )
+    relatorio = response.json()["relatorio"]
+    assert relatorio["cadastrados"] == 0
+    assert len(relatorio["pulados"]) == 4
+    assert relatorio["edicoes_criadas"] == []
+
+
+@pytest.mark.asyncio
+async def test_upload_bibtex_acao_invalida(client, test_db, admin_headers):
+    response = client.post(
+        "/upload-bibtex",
+        headers=admin_headers,
+        files={"bibtex_file": ("bibtexex.bib", _sample_bytes())},
+        data={"action": "apagar"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_upload_bibtex_com_zip_de_pdfs(client, test_db, tmp_path, monkeypatch, admin_headers):
+    monkeypatch.setattr(pdf_storage, "storage", pdf_storage.PdfStorage(str(tmp_path / "pdfs")))
+    pdf = b"%PDF-1.4\nsbes-paper1\n%%EOF\n"
+    zip_bytes = io.BytesIO()
+    with zipfile.ZipFile(zip_bytes, "w") as arquivo:
+        arquivo.writestr("sbes-paper1.pdf", pdf)
+        arquivo.writestr("sem-entrada.pdf", b"%PDF-1.4\noutro\n")
+
+    response = client.post(
+        "/upload-bibtex",
+        headers=admin_headers,
+        files={
+            "bibtex_file": ("bibtexex.bib", _sample_bytes()),
+            "pdf_zip": ("anais.zip", zip_bytes.getvalue(), "application/zip"),
+        },
+        data={"action": "save"},
+    )
+    assert response.status_code == 200
+    relatorio = response.json()["relatorio"]
+    assert relatorio["cadastrados"] == 3
+    assert relatorio["pdfs"] == {"armazenados": 2, "associados": 1, "nao_associados": ["sem-entrada"], "erros": []}
+
+    artigo = test_db.query(Article).filter(Article.titulo.like("Robotic%")).one()
+    assert artigo.pdf_path == f"/pdfs/{hashlib.sha256(pdf).hexdigest()}"
+    assert client.get(artigo.pdf_path).content == pdf
+
+
+@pytest.mark.asyncio
+async def test_upload_bibtex_zip_invalido(client, test_db, admin_headers):
+    response = client.post(
+        "/upload-bibtex",
+        headers=admin_headers,
+        files={
+            "bibtex_file": ("bibtexex.bib", _sample_bytes()),
+            "pdf_zip": ("anais.zip", b"nao e zip", "application/zip"),
+        },
+        data={"action": "save"},
+    )
+    assert response.status_code == 400
+    assert test_db.query(Article).count() == 0
+
+
+
+@pytest.mark.asyncio
+async def test_upload_bibtex_grafias_com_o_mesmo_slug(client, test_db, admin_headers):
+    # Três grafias de um evento novo e duas de um existente geram só dois slugs
+    test_db.add(Event(nome="Workshop de Redes", slug="workshop-de-redes"))
+    test_db.commit()
+    titulos = ["Simpósio de IA", "Simposio de IA", "SIMPÓSIO DE IA", "Workshop de Redes", "Workshop de redes"]
+    bib = "\n".join(
+        f"@inproceedings{{g{i},\n author = {{Autora Grafia}},\n title = {{Artigo {i}}},\n"
+        f" booktitle = {{{titulo}}},\n year = {{2024}},\n}}\n"
+        for i, titulo in enumerate(titulos)
+    ).encode()
+
+    response = client.post(
+        "/upload-bibtex",
+        headers=admin_headers,
+        files={"bibtex_file": ("anais.bib", bib)},
+        data={"action": "save"},
+    )
+    relatorio = response.json()["relatorio"]
+    assert relatorio["erros"] == [] and relatorio["cadastrados"] == 5
+    assert sorted(e.slug for e in test_db.query(Event)) == ["simposio-de-ia", "workshop-de-redes"]
+    assert test_db.query(Edition).count() == 2
+
+
+def _bib(chaves):
+    return "\n".join(
+        f"@inproceedings{{e{e}-{ano}-{i},\n author = {{Autora Numero{e}}},\n title = {{Artigo {e} {ano} {i}}},\n"
+        f" booktitle = {{Simpósio {e}}},\n year = {{{ano}}},\n}}\n"
+        for i, (e, ano) in enumerate(chaves)
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_upload_bibtex_cria_eventos_e_edicoes_em_lote(client, test_db, admin_headers):
+    from backend.app import metrics
+
+    # Seis artigos nos dois casos: um evento/edição novo contra seis
+    consultas = []
+    for chaves in ([(0, 2023)] * 6, [(e, ano) for e in (1, 2, 3) for ano in (2022, 2023)]):
+        metrics.REGISTRY.reset()
+        response = client.post(
+            "/upload-bibtex",
+            headers=admin_headers,
+            files={"bibtex_file": ("anais.bib", _bib(chaves))},
+            data={"action": "save"},
+        )
+        relatorio = response.json()["relatorio"]
+        assert relatorio["erros"] == [] and relatorio["cadastrados"] == 6
+        consultas.append(metrics.DB_QUERIES_PER_REQUEST.sum(method="POST", route="/upload-bibtex"))
+
+    # Eventos e edições novos entram com um INSERT por lote, não um por linha
+    assert consultas[0] == consultas[1]
+    assert len(relatorio["edicoes_criadas"]) == 6
+    edicao = test_db.query(Edition).filter(Edition.ano == 2022).join(Event).filter(Event.nome == "Simpósio 3").one()
+    assert edicao.slug == "simposio-3-2022"
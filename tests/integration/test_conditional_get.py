@@ -0,0 +1,95 @@
+import pytest
+
+from backend.app.models import Event
+
+
+@pytest.mark.asyncio
+async def test_listagem_envia_etag(client, test_db):
+    test_db.add(Event(nome="Conferência de IA", slug="conf-ia"))
+    test_db.commit()
+
+    response = client.get("/eventos/")
+    assert response.status_code == 200
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "no-cache"
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_responde_304_sem_corpo(client, test_db):
+    test_db.add(Event(nome="Conferência de IA", slug="conf-ia"))
+    test_db.commit()
+
+    etag = client.get("/eventos/conf-ia").headers["etag"]
+    response = client.get("/eventos/conf-ia", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    # ETag fraco e lista de ETags também conferem
+    response = client.get("/eventos/conf-ia", headers={"If-None-Match": f'"outro", W/{etag}'})
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_etag_muda_apos_escrita(client, test_db):
+    etag = client.get("/eventos/").headers["etag"]
+
+    client.post("/eventos/", json={"nome": "Simpósio", "sigla": "simp"})
+
+    response = client.get("/eventos/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert [e["slug"] for e in response.json()["items"]] == ["simp"]
+
+
+@pytest.mark.asyncio
+async def test_etag_depende_da_query_string(client, test_db):
+    primeira = client.get("/eventos/", params={"limit": 1}).headers["etag"]
+    segunda = client.get("/eventos/", params={"limit": 2}).headers["etag"]
+    assert primeira != segunda
+
+
+@pytest.mark.asyncio
+async def test_escrita_em_outra_tabela_nao_invalida(client, test_db):
+    etag = client.get("/eventos/").headers["etag"]
+    client.post("/autores/", json={"nome": "Ada", "sobrenome": "Lovelace"})
+
+    response = client.get("/eventos/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_304_executa_uma_unica_consulta(client, test_db, contar_queries):
+    etag = client.get("/artigos/").headers["etag"]
+
+    with contar_queries() as statements:
+        response = client.get("/artigos/", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert len(statements) == 1
+    assert "versoes_tabelas" in statements[0]
+
+
+@pytest.mark.asyncio
+async def test_if_modified_since_e_ignorado(client, test_db):
+    # Last-Modified tem resolução de um segundo: uma escrita no mesmo segundo
+    # da leitura devolveria 304 com conteúdo antigo. Só o ETag vale.
+    test_db.add(Event(nome="Conferência de IA", slug="conf-ia"))
+    test_db.commit()
+
+    response = client.get("/eventos/")
+    assert "last-modified" not in response.headers
+    etag = response.headers["etag"]
+
+    test_db.add(Event(nome="Simpósio de Redes", slug="simp-redes"))
+    test_db.commit()
+
+    response = client.get("/eventos/", headers={
+        "If-None-Match": etag,
+        "If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT",
+    })
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+
+    response = client.get("/eventos/", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+    assert response.status_code == 200
@@ -0,0 +1,57 @@
+import pytest
+
+from backend.app.models import Event, Edition, Author, Article
+
+
+@pytest.mark.asyncio
+async def test_resumo_do_evento(client, test_db, contar_queries):
+    evento = Event(nome="Simpósio Brasileiro de Bancos de Dados", slug="sbbd")
+    outro = Event(nome="Conferência de IA", slug="conf-ia")
+    test_db.add_all([evento, outro])
+    test_db.commit()
+    e2024 = Edition(ano=2024, evento_id=evento.id)
+    e2022 = Edition(ano=2022, evento_id=evento.id)
+    e2023 = Edition(ano=2023, evento_id=evento.id)
+    de_outro = Edition(ano=2024, evento_id=outro.id)
+    test_db.add_all([e2024, e2022, e2023, de_outro])
+    test_db.commit()
+    ada = Author(nome="Ada", sobrenome="Lovelace")
+    alan = Author(nome="Alan", sobrenome="Turing")
+    test_db.add_all([
+        Article(titulo="A", edicao_id=e2024.id, authors=[ada, alan]),
+        Article(titulo="B", edicao_id=e2024.id, authors=[ada]),
+        Article(titulo="C", edicao_id=e2022.id, authors=[alan]),
+        Article(titulo="D", edicao_id=de_outro.id, authors=[ada]),
+    ])
+    test_db.commit()
+
+    with contar_queries() as statements:
+        response = client.get("/eventos/sbbd/resumo")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["slug"] == "sbbd"
+    assert [(e["ano"], e["total_artigos"], e["total_autores"]) for e in data["edicoes"]] == [
+        (2022, 1, 1),
+        (2023, 0, 0),
+        (2024, 2, 2),
+    ]
+    # Além da consulta de versões (ETag), um único GROUP BY
+    assert len([s for s in statements if "versoes_tabelas" not in s]) == 1
+
+
+@pytest.mark.asyncio
+async def test_resumo_evento_sem_edicoes(client, test_db):
+    test_db.add(Event(nome="Workshop", slug="ws"))
+    test_db.commit()
+
+    response = client.get("/eventos/ws/resumo")
+    assert response.status_code == 200
+    assert response.json()["edicoes"] == []
+
+
+@pytest.mark.asyncio
+async def test_resumo_evento_inexistente(client, test_db):
+    response = client.get("/eventos/nao-existe/resumo")
+    assert response.status_code == 404
+    assert response.json()["detail"] == "Evento não encontrado"
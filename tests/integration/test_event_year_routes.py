@@ -0,0 +1,69 @@
+import pytest
+
+from backend.app.models import Event, Edition, Author, Article
+
+
+def _seed(test_db):
+    evento = Event(nome="Simpósio Brasileiro de Bancos de Dados", slug="sbbd")
+    outro = Event(nome="Conferência de IA", slug="conf-ia")
+    test_db.add_all([evento, outro])
+    test_db.commit()
+    edicao = Edition(ano=2024, evento_id=evento.id, local="Florianópolis")
+    test_db.add_all([
+        edicao,
+        Edition(ano=2023, evento_id=evento.id),
+        Edition(ano=2024, evento_id=outro.id),
+    ])
+    test_db.commit()
+    ada = Author(nome="Ada", sobrenome="Lovelace")
+    alan = Author(nome="Alan", sobrenome="Turing")
+    test_db.add_all([
+        Article(titulo="Artigo A", edicao_id=edicao.id, authors=[ada, alan]),
+        Article(titulo="Artigo B", edicao_id=edicao.id, authors=[ada]),
+    ])
+    test_db.commit()
+    return edicao.id
+
+
+@pytest.mark.asyncio
+async def test_edicao_por_slug_e_ano(client, test_db):
+    edicao_id = _seed(test_db)
+
+    response = client.get("/eventos/sbbd/2024")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["id"] == edicao_id
+    assert data["local"] == "Florianópolis"
+
+
+@pytest.mark.asyncio
+async def test_edicao_inexistente(client, test_db):
+    _seed(test_db)
+    assert client.get("/eventos/sbbd/1999").status_code == 404
+    assert client.get("/eventos/nao-existe/2024").status_code == 404
+    assert client.get("/eventos/sbbd/1999/artigos").status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_artigos_da_edicao(client, test_db):
+    _seed(test_db)
+
+    response = client.get("/eventos/sbbd/2024/artigos")
+    assert response.status_code == 200
+    artigos = response.json()
+    assert [a["titulo"] for a in artigos] == ["Artigo A", "Artigo B"]
+    assert {a["nome"] for a in artigos[0]["authors"]} == {"Ada", "Alan"}
+
+    # Edição existente sem artigos
+    assert client.get("/eventos/sbbd/2023/artigos").json() == []
+
+
+@pytest.mark.asyncio
+async def test_artigos_da_edicao_em_uma_consulta(client, test_db, contar_queries):
+    _seed(test_db)
+    with contar_queries() as statements:
+        response = client.get("/eventos/sbbd/2024/artigos")
+
+    assert response.status_code == 200
+    # Além da consulta de versões (ETag), uma única consulta
+    assert len([s for s in statements if "versoes_tabelas" not in s]) == 1
@@ -0,0 +1,67 @@
+import pytest
+from backend.app.database import engine
+from backend.app.models import Event, Edition, Article, Keyword
+from backend.app.keywords import parse_palavras_chave, backfill_palavras_chave
+from backend.app.migrations.versions import m0003_palavras_chave as m0003
+
+
+def _criar_edicao(test_db):
+    event = Event(nome="Conferência de IA", slug="conf-ia")
+    test_db.add(event)
+    test_db.commit()
+    edition = Edition(ano=2024, evento_id=event.id)
+    test_db.add(edition)
+    test_db.commit()
+    return edition
+
+
+def test_parse_palavras_chave():
+    assert parse_palavras_chave("IA, Machine Learning; ia , ") == {
+        "ia": "IA",
+        "machine-learning": "Machine Learning",
+    }
+    assert parse_palavras_chave(None) == {}
+
+
+@pytest.mark.asyncio
+async def test_filtro_e_contagem_de_palavras_chave(client, test_db, admin_headers):
+    edition = _criar_edicao(test_db)
+    client.post("/artigos/", headers=admin_headers, json={"titulo": "A1", "edicao_id": edition.id, "palavras_chave": "IA, Saúde"})
+    client.post("/artigos/lote", headers=admin_headers, json=[
+        {"titulo": "A2", "edicao_id": edition.id, "palavras_chave": "ia; Robótica"},
+        {"titulo": "A3", "edicao_id": edition.id, "palavras_chave": "Saude"},
+    ])
+
+    response = client.get("/artigos/", params={"palavra_chave": "IA"})
+    assert response.status_code == 200
+    assert [a["titulo"] for a in response.json()["items"]] == ["A1", "A2"]
+    response = client.get("/artigos/", params={"palavra_chave": "saude"})
+    assert [a["titulo"] for a in response.json()["items"]] == ["A1", "A3"]
+
+    response = client.get("/palavras-chave")
+    assert response.status_code == 200
+    assert [(k["slug"], k["total_artigos"]) for k in response.json()] == [
+        ("ia", 2), ("saude", 2), ("robotica", 1)
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backfill", [backfill_palavras_chave, m0003.backfill])
+async def test_backfill_palavras_chave_idempotente(client, test_db, backfill):
+    edition = _criar_edicao(test_db)
+    # Artigos gravados sem passar pelas rotas não têm vínculos normalizados
+    test_db.add_all([
+        Article(titulo="A1", edicao_id=edition.id, palavras_chave="Grafos, Algoritmos"),
+        Article(titulo="A2", edicao_id=edition.id, palavras_chave="algoritmos"),
+        Article(titulo="A3", edicao_id=edition.id),
+    ])
+    test_db.commit()
+    assert client.get("/palavras-chave").json() == []
+
+    for _ in range(2):
+        with engine.begin() as connection:
+            backfill(connection, batch_size=1)
+
+    assert test_db.query(Keyword).count() == 2
+    contagens = {k["slug"]: k["total_artigos"] for k in client.get("/palavras-chave").json()}
+    assert contagens == {"algoritmos": 2, "grafos": 1}
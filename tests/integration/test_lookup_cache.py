@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.app.auth import create_access_token
+from backend.app.cache import event_cache
+
+from backend.app.models import Event, TableVersion
+
+
+def _consultas_da_busca(client, contar_queries, url):
+    with contar_queries() as statements:
+        response = client.get(url)
+    assert response.status_code == 200
+    # A consulta de versões (ETag) sempre roda; as demais são a busca do evento
+    return len([s for s in statements if "versoes_tabelas" not in s])
+
+
+@pytest.mark.asyncio
+async def test_busca_por_slug_usa_cache(client, test_db, contar_queries):
+    test_db.add(Event(nome="Conferência de IA", slug="conf-ia"))
+    test_db.commit()
+
+    assert _consultas_da_busca(client, contar_queries, "/eventos/conf-ia") == 1
+    assert _consultas_da_busca(client, contar_queries, "/eventos/conf-ia") == 0
+
+    admin = SimpleNamespace(id=1, nome="Admin", email="admin@example.com", perfil="admin")
+    headers = {"Authorization": f"Bearer {create_access_token(admin)}"}
+    stats = client.get("/internal/cache", headers=headers).json()["eventos"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+async def test_criar_evento_invalida_cache(client, test_db, contar_queries):
+    test_db.add(Event(nome="Conferência de IA", slug="conf-ia"))
+    test_db.commit()
+    client.get("/eventos/conf-ia")
+
+    client.post("/eventos/", json={"nome": "Simpósio", "sigla": "simp"})
+
+    assert _consultas_da_busca(client, contar_queries, "/eventos/conf-ia") == 1
+
+
+@pytest.mark.asyncio
+async def test_escrita_em_outro_processo_nao_serve_corpo_antigo(client, test_db):
+    evento = Event(nome="Conferência de IA", slug="conf-ia")
+    test_db.add(evento)
+    test_db.commit()
+    antes = client.get("/eventos/conf-ia")
+    versao_antiga = test_db.get(TableVersion, "eventos").versao
+
+    # Outro worker renomeia o evento: o invalidate() dele não alcança este cache
+    evento.nome = "Conferência de IA Aplicada"
+    test_db.commit()
+    # Uma leitura lenta deste processo, iniciada antes da escrita, grava o corpo antigo depois dela
+    event_cache.set(("conf-ia", versao_antiga), antes.json())
+
+    depois = client.get("/eventos/conf-ia")
+    assert depois.json()["nome"] == "Conferência de IA Aplicada"
+    assert depois.headers["etag"] != antes.headers["etag"]
+    assert client.get("/eventos/conf-ia", headers={"If-None-Match": depois.headers["etag"]}).status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_autor_nao_encontrado_nao_fica_em_cache(client, test_db):
+    assert client.get("/autores/ada-lovelace").status_code == 404
+
+    client.post("/autores/", json={"nome": "Ada", "sobrenome": "Lovelace"})
+
+    response = client.get("/autores/ada-lovelace")
+    assert response.status_code == 200
+    assert response.json()["nome"] == "Ada"
+
+
+@pytest.mark.asyncio
+async def test_estatisticas_do_pool_restritas_a_admin(client, test_db):
+    assert client.get("/internal/pool").status_code == 401
+
+    admin = SimpleNamespace(id=1, nome="Admin", email="admin@example.com", perfil="admin")
+    headers = {"Authorization": f"Bearer {create_access_token(admin)}"}
+    client.get("/eventos/")
+    stats = client.get("/internal/pool", headers=headers).json()["primario"]
+    assert stats["checkouts"] >= 1
+    assert stats["em_uso"] == 0
+    assert {"espera_media_ms", "espera_max_ms", "timeouts", "pico_em_uso"} <= stats.keys()
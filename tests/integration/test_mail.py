@@ -0,0 +1,72 @@
+from email.message import EmailMessage
+
+import aiosmtplib
+import pytest
+
+from backend.app import mail
+
+
+@pytest.fixture
+def mensagens():
+    def criar(n):
+        lista = []
+        for i in range(n):
+            msg = EmailMessage()
+            msg["From"] = "biblioteca@example.com"
+            msg["To"] = f"leitor{i}@example.com"
+            msg["Subject"] = f"Novo artigo {i}"
+            msg.set_content(f"Corpo {i}\n.linha que começa com ponto\n")
+            lista.append(msg)
+        return lista
+
+    return criar
+
+
+@pytest.mark.asyncio
+async def test_pool_reaproveita_conexoes(mensagens):
+    async with mail.DebuggingSMTPServer(port=0) as server:
+        pool = mail.SMTPPool("127.0.0.1", server.port, username="u", password="p", start_tls=False, size=3)
+        erros = await pool.send_many(mensagens(20))
+        await pool.close()
+
+    assert erros == [None] * 20
+    assert len(server.messages) == 20
+    # No máximo `size` conexões para 20 emails (o handshake não se repete por email)
+    assert pool.connections_opened <= 3
+    assert server.connections == pool.connections_opened
+    assert server.messages[0].get_content().splitlines()[1] == ".linha que começa com ponto"
+
+
+@pytest.mark.asyncio
+async def test_pool_refaz_conexao_fechada_pelo_servidor(mensagens):
+    async with mail.DebuggingSMTPServer(port=0) as server:
+        pool = mail.SMTPPool("127.0.0.1", server.port, start_tls=False, size=1)
+        await pool.send(mensagens(1)[0])
+        # Simula o servidor encerrando a conexão ociosa
+        pool._idle[0].close()
+        await pool.send(mensagens(1)[0])
+        await pool.close()
+
+    assert len(server.messages) == 2
+    assert pool.connections_opened == 2
+
+
+@pytest.mark.asyncio
+async def test_pool_devolve_excecao_por_mensagem(mensagens):
+    pool = mail.SMTPPool("127.0.0.1", 1, start_tls=False, size=1, timeout=1)
+    erros = await pool.send_many(mensagens(2))
+    assert all(isinstance(e, (OSError, aiosmtplib.SMTPException)) for e in erros)
+
+
+def test_transport_from_env(monkeypatch):
+    monkeypatch.delenv("MAIL_TRANSPORT", raising=False)
+    monkeypatch.delenv("EMAIL_FROM", raising=False)
+    assert isinstance(mail.transport_from_env(), mail.SimulatedTransport)
+
+    monkeypatch.setenv("EMAIL_FROM", "biblioteca@example.com")
+    monkeypatch.setenv("SMTP_SERVER", "localhost")
+    monkeypatch.setenv("SMTP_PORT", "1025")
+    monkeypatch.setenv("SMTP_STARTTLS", "0")
+    transport = mail.transport_from_env()
+    assert isinstance(transport, mail.SMTPPool)
+    assert (transport.hostname, transport.port, transport.start_tls) == ("localhost", 1025, False)
@@ -0,0 +1,43 @@
+import pytest
+
+from backend.app import metrics
+from backend.app.models import Event
+
+
+@pytest.fixture(autouse=True)
+def zerar_metricas():
+    metrics.REGISTRY.reset()
+
+
+@pytest.mark.asyncio
+async def test_latencia_tamanho_e_consultas_por_rota(client, test_db):
+    test_db.add(Event(nome="Simpósio", slug="simp"))
+    test_db.commit()
+
+    resposta = client.get("/eventos/simp")
+    client.get("/eventos/outro-que-nao-existe")
+
+    labels = {"method": "GET", "route": "/eventos/{event_id}"}
+    assert metrics.HTTP_LATENCY.count(**labels) == 2
+    assert metrics.HTTP_REQUESTS.value(status=200, **labels) == 1
+    assert metrics.HTTP_REQUESTS.value(status=404, **labels) == 1
+    assert metrics.HTTP_RESPONSE_SIZE.sum(**labels) >= len(resposta.content)
+    assert metrics.DB_QUERIES_PER_REQUEST.count(**labels) == 2
+    assert metrics.DB_QUERIES_PER_REQUEST.sum(**labels) >= 2
+    assert metrics.DB_TIME_PER_REQUEST.sum(**labels) > 0
+    assert metrics.HTTP_IN_PROGRESS.value(method="GET") == 0
+
+
+@pytest.mark.asyncio
+async def test_endpoint_metrics_em_texto(client, test_db):
+    client.get("/eventos/")
+    client.get("/rota/inexistente")
+
+    resposta = client.get("/metrics")
+    assert resposta.status_code == 200
+    assert resposta.headers["content-type"] == metrics.CONTENT_TYPE
+    texto = resposta.text
+    assert "# TYPE http_request_duration_seconds histogram" in texto
+    assert 'http_request_duration_seconds_count{method="GET",route="/eventos/"} 1' in texto
+    assert 'http_requests_total{method="GET",route="sem_rota",status="404"} 1' in texto
+    assert "db_queries_total" in texto
@@ -0,0 +1,95 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from backend.app.database import Base
+from backend.app import migrations
+
+
+@pytest.fixture
+def engine_vazio(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'migracoes.db'}")
+    yield engine
+    engine.dispose()
+
+
+def test_upgrade_banco_novo(engine_vazio):
+    aplicadas = migrations.upgrade(engine_vazio)
+    assert aplicadas == [m.VERSION for m in migrations.load_migrations()]
+    assert migrations.check_indexes(engine_vazio) == {"faltando": [], "sobrando": []}
+
+    # Rodar de novo não reaplica nada
+    assert migrations.upgrade(engine_vazio) == []
+    assert all(aplicada for _, _, aplicada in migrations.status(engine_vazio))
+
+
+def test_upgrade_banco_legado(engine_vazio):
+    # Banco criado antes das migrações: sem os índices dos caminhos quentes,
+    # sem palavras-chave normalizadas e sem busca textual
+    with engine_vazio.begin() as conn:
+        tabelas = [t for t in Base.metadata.sorted_tables
+                   if t.name not in ("palavras_chave", "artigo_palavra_chave")]
+        for table in tabelas:
+            table.create(conn)
+        for nome in ("ix_artigos_edicao_id", "ix_edicoes_evento_id_ano", "ix_artigo_autor_autor_id",
+                     "ix_notificacoes_user_id_author_id", "ix_notificacoes_author_id_user_id",
+                     "ix_email_logs_user_id"):
+            conn.execute(text(f"DROP INDEX {nome}"))
+        for trigger in ("artigos_fts_ai", "artigos_fts_ad", "artigos_fts_au"):
+            conn.execute(text(f"DROP TRIGGER {trigger}"))
+        conn.execute(text("DROP TABLE artigos_fts"))
+        conn.execute(text("INSERT INTO eventos (id, nome, slug) VALUES (1, 'Evento', 'evento')"))
+        conn.execute(text("INSERT INTO edicoes (id, ano, evento_id) VALUES (1, 2024, 1)"))
+        conn.execute(text(
+            "INSERT INTO artigos (id, titulo, palavras_chave, edicao_id) "
+            "VALUES (1, 'Grafos dinâmicos', 'Grafos, Algoritmos', 1)"
+        ))
+
+    faltando = migrations.check_indexes(engine_vazio)["faltando"]
+    assert "artigos.ix_artigos_edicao_id" in faltando
+    assert "edicoes.ix_edicoes_evento_id_ano" in faltando
+
+    migrations.upgrade(engine_vazio)
+
+    assert migrations.check_indexes(engine_vazio) == {"faltando": [], "sobrando": []}
+    with engine_vazio.connect() as conn:
+        assert conn.execute(text("SELECT count(*) FROM artigo_palavra_chave")).scalar() == 2
+        # Linhas antigas entram no índice de busca
+        assert conn.execute(text(
+            "SELECT rowid FROM artigos_fts WHERE artigos_fts MATCH 'dinamicos'"
+        )).scalars().all() == [1]
+
+
+def test_check_acusa_indice_sobrando(engine_vazio):
+    migrations.upgrade(engine_vazio)
+    with engine_vazio.begin() as conn:
+        conn.execute(text("CREATE INDEX ix_artigos_titulo ON artigos (titulo)"))
+    assert migrations.check_indexes(engine_vazio)["sobrando"] == ["artigos.ix_artigos_titulo"]
+
+
+def test_migracoes_reproduzem_o_esquema_dos_modelos(engine_vazio, tmp_path):
+    # As migrações não usam os modelos atuais; aplicadas do zero precisam
+    # chegar ao mesmo esquema que Base.metadata.create_all
+    migrations.upgrade(engine_vazio)
+    referencia = create_engine(f"sqlite:///{tmp_path / 'modelos.db'}")
+    Base.metadata.create_all(referencia)
+
+    def esquema(engine):
+        inspector = inspect(engine)
+        tabelas = {
+            nome: sorted(c["name"] for c in inspector.get_columns(nome))
+            for nome in inspector.get_table_names()
+            if nome != "schema_migrations" and not nome.endswith(("_fts", "_data", "_idx", "_docsize", "_config"))
+        }
+        with engine.connect() as conn:
+            triggers = set(conn.execute(text("SELECT name FROM sqlite_master WHERE type = 'trigger'")).scalars())
+        return tabelas, triggers
+
+    try:
+        assert esquema(engine_vazio) == esquema(referencia)
+    finally:
+        referencia.dispose()
+
+    with engine_vazio.begin() as conn:
+        conn.execute(text("INSERT INTO eventos (nome, slug) VALUES ('Evento', 'evento')"))
+        assert conn.execute(text(
+            "SELECT versao FROM versoes_tabelas WHERE tabela = 'eventos'"
+        )).scalar() == 1
@@ -0,0 +1,145 @@
+import asyncio
+
+import pytest
+
+from backend.app import mail, notifications
+from backend.app.models import Event, Edition, Author, User, Notification, EmailLog
+
+
+@pytest.fixture(autouse=True)
+def sem_smtp():
+    mail.set_transport(mail.SimulatedTransport())
+    yield
+    mail.set_transport(None)
+
+
+def _seed(test_db):
+    evento = Event(nome="Simpósio Brasileiro de Bancos de Dados", slug="sbbd")
+    test_db.add(evento)
+    test_db.commit()
+    edicao = Edition(ano=2024, evento_id=evento.id)
+    ada = Author(nome="Ada", sobrenome="Lovelace")
+    alan = Author(nome="Alan", sobrenome="Turing")
+    test_db.add_all([edicao, ada, alan])
+    test_db.commit()
+
+    def usuario(nome, receive=1):
+        user = User(nome=nome, email=f"{nome}@example.com", senha_hash="x", receive_notifications=receive)
+        test_db.add(user)
+        test_db.commit()
+        return user
+
+    segue_ada = usuario("maria")
+    segue_os_dois = usuario("joao")
+    nao_quer = usuario("ana", receive=0)
+    inativo = usuario("pedro")
+    test_db.add_all([
+        Notification(user_id=segue_ada.id, author_id=ada.id),
+        Notification(user_id=segue_os_dois.id, author_id=ada.id),
+        Notification(user_id=segue_os_dois.id, author_id=alan.id),
+        Notification(user_id=nao_quer.id, author_id=ada.id),
+        Notification(user_id=inativo.id, author_id=ada.id, is_active=0),
+    ])
+    test_db.commit()
+    return edicao.id, ada.id, alan.id, {segue_ada.id, segue_os_dois.id}
+
+
+@pytest.mark.asyncio
+async def test_publicar_artigo_notifica_seguidores(client, test_db, admin_headers):
+    edicao_id, ada_id, alan_id, esperados = _seed(test_db)
+
+    response = client.post("/artigos/", headers=admin_headers, json={
+        "titulo": "Máquinas analíticas",
+        "edicao_id": edicao_id,
+        "author_ids": [ada_id, alan_id],
+    })
+    assert response.status_code == 200
+    artigo_id = response.json()["id"]
+
+    # O TestClient executa as BackgroundTasks antes de devolver a resposta
+    test_db.expire_all()
+    logs = test_db.query(EmailLog).all()
+    # Um email por usuário, mesmo seguindo dois autores do artigo;
+    # quem não quer notificações ou desativou o seguimento fica de fora
+    assert {log.user_id for log in logs} == esperados
+    assert len(logs) == 2
+    assert all(log.article_id == artigo_id for log in logs)
+    assert all(log.status == notifications.STATUS_SIMULATED for log in logs)
+    assert all("Máquinas analíticas" in log.email_subject for log in logs)
+
+
+@pytest.mark.asyncio
+async def test_lote_de_artigos_notifica_em_lotes(client, test_db, monkeypatch, admin_headers):
+    edicao_id, ada_id, _, esperados = _seed(test_db)
+    tamanhos = []
+    send_batch = notifications.send_batch
+
+    def send_batch_contando(messages):
+        tamanhos.append(len(messages))
+        return send_batch(messages)
+
+    monkeypatch.setattr(notifications, "send_batch", send_batch_contando)
+    monkeypatch.setattr(notifications, "NOTIFICATION_BATCH_SIZE", 3)
+
+    response = client.post("/artigos/lote", headers=admin_headers, json=[
+        {"titulo": f"Artigo {i}", "edicao_id": edicao_id, "author_ids": [ada_id]} for i in range(3)
+    ])
+    assert response.status_code == 200
+
+    # 3 artigos x 2 seguidores = 6 emails em 2 lotes de 3
+    assert tamanhos == [3, 3]
+    test_db.expire_all()
+    assert test_db.query(EmailLog).count() == 6
+
+
+@pytest.mark.asyncio
+async def test_artigo_sem_seguidores_nao_envia(client, test_db, admin_headers):
+    edicao_id, _, _, _ = _seed(test_db)
+    autor = Author(nome="Grace", sobrenome="Hopper")
+    test_db.add(autor)
+    test_db.commit()
+
+    response = client.post("/artigos/", headers=admin_headers, json={"titulo": "Compiladores", "edicao_id": edicao_id, "author_ids": [autor.id]})
+    assert response.status_code == 200
+    test_db.expire_all()
+    assert test_db.query(EmailLog).count() == 0
+
+
+def test_notificacoes_pelo_pool_smtp(client, test_db, admin_headers):
+    edicao_id, ada_id, _, _ = _seed(test_db)
+    artigo_id = client.post(
+        "/artigos/", headers=admin_headers,
+        json={"titulo": "Máquinas analíticas", "edicao_id": edicao_id, "author_ids": [ada_id]},
+    ).json()["id"]
+
+    async def reenviar():
+        async with mail.DebuggingSMTPServer(port=0) as server:
+            mail.set_transport(mail.SMTPPool("127.0.0.1", server.port, start_tls=False, size=2))
+            resumo = await notifications.fan_out_article_notifications([artigo_id])
+            await mail.get_transport().close()
+            return resumo, server.messages
+
+    resumo, messages = asyncio.run(reenviar())
+
+    assert resumo == {"sent": 2}
+    assert sorted(m["To"] for m in messages) == ["joao@example.com", "maria@example.com"]
+    test_db.expire_all()
+    assert test_db.query(EmailLog).filter(EmailLog.status == "sent").count() == 2
+
+
+def test_lifespan_fecha_o_transporte(test_db):
+    from fastapi.testclient import TestClient
+    from backend.app.main import app
+
+    class Registrador(mail.SimulatedTransport):
+        fechado = False
+
+        async def close(self):
+            self.fechado = True
+
+    transporte = Registrador()
+    mail.set_transport(transporte)
+    with TestClient(app):
+        assert not transporte.fechado
+    assert transporte.fechado
+    assert mail._transport is None
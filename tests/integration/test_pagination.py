@@ -0,0 +1,54 @@
+import pytest
+from backend.app.models import Event, Author
+from backend.app.pagination import encode_cursor, decode_cursor
+
+
+def test_cursor_roundtrip():
+    cursor = encode_cursor(42)
+    assert "42" not in cursor  # cursor é opaco
+    assert decode_cursor(cursor) == 42
+
+
+@pytest.mark.asyncio
+async def test_paginacao_percorre_todas_as_paginas(client, test_db):
+    for i in range(5):
+        test_db.add(Event(nome=f"Evento {i}", slug=f"evento-{i}"))
+    test_db.commit()
+
+    response = client.get("/eventos/", params={"limit": 2})
+    assert response.status_code == 200
+    page = response.json()
+    assert [e["slug"] for e in page["items"]] == ["evento-0", "evento-1"]
+    assert page["next"] is not None
+
+    vistos = [e["slug"] for e in page["items"]]
+    while page["next"]:
+        page = client.get("/eventos/", params={"limit": 2, "after": page["next"]}).json()
+        vistos.extend(e["slug"] for e in page["items"])
+
+    assert vistos == [f"evento-{i}" for i in range(5)]
+
+
+@pytest.mark.asyncio
+async def test_paginacao_ultima_pagina_sem_next(client, test_db):
+    test_db.add(Author(nome="Alan", sobrenome="Turing"))
+    test_db.add(Author(nome="Ada", sobrenome="Lovelace"))
+    test_db.commit()
+
+    response = client.get("/autores/", params={"limit": 2})
+    data = response.json()
+    assert len(data["items"]) == 2
+    assert data["next"] is None
+
+
+@pytest.mark.asyncio
+async def test_paginacao_cursor_invalido(client, test_db):
+    response = client.get("/artigos/", params={"after": "nao-e-um-cursor"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Cursor inválido"
+
+
+@pytest.mark.asyncio
+async def test_paginacao_limite_maximo(client, test_db):
+    response = client.get("/usuarios/", params={"limit": 10_000})
+    assert response.status_code == 422
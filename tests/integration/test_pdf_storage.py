@@ -0,0 +1,191 @@
+import hashlib
+import io
+import os
+import tracemalloc
+import zipfile
+
+import pytest
+
+from backend.app import pdf_storage
+from backend.app.database import engine
+from backend.app.main import app
+from backend.app.models import Article, Edition, Event
+
+PDF = b"%PDF-1.4\n" + b"conteudo de teste " * 200 + b"\n%%EOF\n"
+SHA = hashlib.sha256(PDF).hexdigest()
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    armazenamento = pdf_storage.PdfStorage(str(tmp_path / "pdfs"))
+    monkeypatch.setattr(pdf_storage, "storage", armazenamento)
+    monkeypatch.setattr(pdf_storage, "PDF_ACCEL_REDIRECT_PREFIX", None)
+    return armazenamento
+
+
+def _enviar(client, headers, conteudo=PDF, nome="artigo.pdf"):
+    return client.post("/pdfs", files={"pdf_file": (nome, conteudo, "application/pdf")}, headers=headers)
+
+
+@pytest.mark.asyncio
+async def test_upload_grava_por_hash_e_deduplica(client, storage, admin_headers):
+    primeiro = _enviar(client, admin_headers)
+    assert primeiro.status_code == 200
+    assert primeiro.json() == {"sha256": SHA, "url": f"/pdfs/{SHA}", "tamanho": len(PDF), "duplicado": False}
+    assert os.path.isfile(os.path.join(storage.root, SHA[:2], SHA[2:4], f"{SHA}.pdf"))
+
+    segundo = _enviar(client, admin_headers, nome="outro-nome.pdf")
+    assert segundo.json()["sha256"] == SHA
+    assert segundo.json()["duplicado"] is True
+    # nenhum temporário esquecido
+    assert [n for n in os.listdir(storage.root) if n.startswith(".upload-")] == []
+
+
+@pytest.mark.asyncio
+async def test_upload_rejeita_arquivo_que_nao_e_pdf(client, storage, admin_headers):
+    response = _enviar(client, admin_headers, b"<html>nao sou pdf</html>", "falso.pdf")
+    assert response.status_code == 400
+    assert os.listdir(storage.root) == []
+
+
+@pytest.mark.asyncio
+async def test_upload_acima_do_limite(client, storage, admin_headers):
+    storage.max_bytes = 100
+    assert _enviar(client, admin_headers).status_code == 413
+
+
+@pytest.mark.asyncio
+async def test_download_inteiro_com_cache_imutavel(client, storage, admin_headers):
+    _enviar(client, admin_headers)
+    response = client.get(f"/pdfs/{SHA}")
+    assert response.status_code == 200
+    assert response.content == PDF
+    assert response.headers["content-type"] == "application/pdf"
+    assert response.headers["etag"] == f'"{SHA}"'
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+@pytest.mark.asyncio
+async def test_download_parcial_com_range(client, storage, admin_headers):
+    _enviar(client, admin_headers)
+    response = client.get(f"/pdfs/{SHA}", headers={"Range": "bytes=0-9"})
+    assert response.status_code == 206
+    assert response.content == PDF[:10]
+    assert response.headers["content-range"] == f"bytes 0-9/{len(PDF)}"
+
+    # If-Range com o ETag atual mantém a resposta parcial
+    retomada = client.get(f"/pdfs/{SHA}", headers={"Range": "bytes=10-", "If-Range": f'"{SHA}"'})
+    assert retomada.status_code == 206
+    assert retomada.content == PDF[10:]
+
+
+@pytest.mark.asyncio
+async def test_if_none_match_devolve_304(client, storage, admin_headers):
+    _enviar(client, admin_headers)
+    response = client.get(f"/pdfs/{SHA}", headers={"If-None-Match": f'"{SHA}"'})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == f'"{SHA}"'
+
+
+@pytest.mark.asyncio
+async def test_pdf_inexistente_ou_hash_invalido(client, storage):
+    assert client.get(f"/pdfs/{'0' * 64}").status_code == 404
+    assert client.get("/pdfs/../../etc/passwd").status_code == 404
+    assert client.get("/pdfs/nao-e-hash").status_code == 404
+    # Hash bem formado, mas o arquivo não existe: 404 mesmo com If-None-Match
+    response = client.get(f"/pdfs/{'0' * 64}", headers={"If-None-Match": f'"{"0" * 64}"'})
+    assert response.status_code == 404
+
+
+def test_pasta_uploads_nao_e_servida():
+    # Os PDFs só saem por /pdfs/{sha256}; o diretório antigo não fica exposto
+    assert "/uploads" not in [getattr(rota, "path", None) for rota in app.routes]
+
+
+@pytest.mark.asyncio
+async def test_x_accel_redirect(client, storage, monkeypatch, admin_headers):
+    _enviar(client, admin_headers)
+    monkeypatch.setattr(pdf_storage, "PDF_ACCEL_REDIRECT_PREFIX", "/_pdfs/")
+    response = client.get(f"/pdfs/{SHA}")
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["x-accel-redirect"] == f"/_pdfs/{SHA[:2]}/{SHA[2:4]}/{SHA}.pdf"
+    assert response.headers["content-type"] == "application/pdf"
+
+
+def test_importacao_de_pdfs_antigos(test_db, storage, tmp_path):
+    uploads = tmp_path / "uploads"
+    uploads.mkdir()
+    (uploads / "antigo.pdf").write_bytes(PDF)
+    edicao = Edition(ano=2024, event=Event(nome="Evento", slug="evento"))
+    test_db.add_all([
+        Article(titulo="Com PDF antigo", pdf_path="uploads/antigo.pdf", edition=edicao),
+        Article(titulo="Arquivo sumiu", pdf_path="uploads/sumiu.pdf", edition=edicao),
+        Article(titulo="Já migrado", pdf_path=f"/pdfs/{SHA}", edition=edicao),
+    ])
+    test_db.commit()
+
+    with engine.begin() as connection:
+        assert pdf_storage.import_legacy_pdfs(connection, str(uploads), storage) == 1
+
+    test_db.expire_all()
+    caminhos = {a.titulo: a.pdf_path for a in test_db.query(Article)}
+    assert caminhos == {
+        "Com PDF antigo": f"/pdfs/{SHA}",
+        "Arquivo sumiu": "uploads/sumiu.pdf",
+        "Já migrado": f"/pdfs/{SHA}",
+    }
+    assert storage.exists(SHA)
+
+
+def _zip(caminho, membros):
+    with zipfile.ZipFile(caminho, "w", zipfile.ZIP_DEFLATED) as arquivo:
+        for nome, conteudo in membros.items():
+            arquivo.writestr(nome, conteudo)
+    return caminho
+
+
+def test_store_pdf_zip_associa_pela_chave(storage, tmp_path):
+    outro = PDF.replace(b"teste", b"outro")
+    caminho = _zip(tmp_path / "anais.zip", {
+        "anais/sbes-paper1.pdf": PDF,
+        "anais/sbes-paper3.PDF": outro,
+        "anais/leiame.txt": b"ignorado",
+        "__MACOSX/anais/._sbes-paper1.pdf": b"metadados",
+        "anais/quebrado.pdf": b"nao e pdf",
+    })
+    with open(caminho, "rb") as f:
+        pdfs, erros = pdf_storage.store_pdf_zip(f, storage, workers=3)
+
+    assert pdfs == {"sbes-paper1": SHA, "sbes-paper3": hashlib.sha256(outro).hexdigest()}
+    assert erros == [{"id": "quebrado", "erro": "Arquivo não é um PDF"}]
+    assert storage.exists(SHA)
+
+
+def test_store_pdf_zip_memoria_independe_do_tamanho(storage, tmp_path):
+    # 64 MiB descompactados (poucos KiB no ZIP): o pico deve ficar em alguns blocos
+    caminho = tmp_path / "grande.zip"
+    with zipfile.ZipFile(caminho, "w", zipfile.ZIP_DEFLATED) as arquivo:
+        with arquivo.open("grande.pdf", "w") as membro:
+            membro.write(b"%PDF-1.4\n")
+            for _ in range(64):
+                membro.write(bytes(1024 * 1024))
+
+    tracemalloc.start()
+    try:
+        with open(caminho, "rb") as f:
+            pdfs, erros = pdf_storage.store_pdf_zip(f, storage, workers=2)
+        _, pico = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert erros == [] and list(pdfs) == ["grande"]
+    assert os.path.getsize(storage.path_for(pdfs["grande"])) == 64 * 1024 * 1024 + 9
+    assert pico < 16 * 1024 * 1024
+
+
+def test_store_pdf_zip_invalido(storage):
+    with pytest.raises(pdf_storage.InvalidPdf):
+        pdf_storage.store_pdf_zip(io.BytesIO(b"isto nao e um zip"), storage)
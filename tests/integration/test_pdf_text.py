@@ -0,0 +1,159 @@
+import io
+import zlib
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from backend.app import pdf_storage, pdf_text, routes
+from backend.app.models import Article, ArticleText, Edition, Event
+
+
+def _literal(texto):
+    return texto.encode("latin-1").replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)")
+
+
+def _pdf(*linhas, comprimido=True):
+    """PDF mínimo com uma página de texto (stream FlateDecode ou sem filtro)"""
+    operadores = b"".join(
+        b"BT /F1 12 Tf 72 %d Td (%s) Tj ET\n" % (700 - 20 * i, _literal(linha))
+        for i, linha in enumerate(linhas)
+    )
+    filtro = b""
+    if comprimido:
+        operadores, filtro = zlib.compress(operadores), b" /Filter /FlateDecode"
+    return (
+        b"%%PDF-1.4\n"
+        b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n"
+        b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n"
+        b"3 0 obj\n<< /Type /Page /Parent 2 0 R /Contents 4 0 R >>\nendobj\n"
+        b"4 0 obj\n<< /Length %d%s >>\nstream\n%s\nendstream\nendobj\n"
+        b"%%%%EOF\n" % (len(operadores), filtro, operadores)
+    )
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    armazenamento = pdf_storage.PdfStorage(str(tmp_path / "pdfs"))
+    monkeypatch.setattr(pdf_storage, "storage", armazenamento)
+    # O extrator simples é o testado aqui, com ou sem pypdf instalado
+    monkeypatch.setattr(pdf_text, "PdfReader", None)
+    monkeypatch.setattr(pdf_text, "PDF_TEXT_EXECUTOR", "inline")
+    monkeypatch.setattr(pdf_text, "_executor", None)
+    return armazenamento
+
+
+@pytest.fixture
+def edicao(test_db):
+    edicao = Edition(ano=2024, event=Event(nome="Evento", slug="evento"))
+    test_db.add(edicao)
+    test_db.commit()
+    return edicao
+
+
+def _artigo_com_pdf(test_db, storage, edicao, titulo, conteudo, resumo=None):
+    sha256, _, _ = storage.save(io.BytesIO(conteudo))
+    artigo = Article(titulo=titulo, resumo=resumo, edicao_id=edicao.id, pdf_path=pdf_storage.pdf_url(sha256))
+    test_db.add(artigo)
+    test_db.commit()
+    return artigo
+
+
+@pytest.mark.asyncio
+async def test_preenche_resumo_vazio_e_guarda_texto(client, test_db, storage, edicao):
+    sem_resumo = _artigo_com_pdf(test_db, storage, edicao, "Sem resumo", _pdf(
+        "Grafos Dinamicos", "Abstract", "Estudamos (grafos) temporais.", "Keywords: grafos", "1 Introduction", "Corpo.",
+    ))
+    com_resumo = _artigo_com_pdf(test_db, storage, edicao, "Com resumo", _pdf("Outro texto"), resumo="Original")
+
+    relatorio = await pdf_text.extract_pending_texts()
+    assert relatorio == {"processados": 2, "resumos_preenchidos": 1, "erros": 0}
+
+    test_db.expire_all()
+    assert test_db.get(Article, sem_resumo.id).resumo == "Estudamos (grafos) temporais."
+    assert test_db.get(Article, com_resumo.id).resumo == "Original"
+    texto = test_db.get(ArticleText, sem_resumo.id)
+    assert texto.status == "ok"
+    assert "Corpo." in texto.texto
+
+    # O texto completo não aparece nas listagens
+    artigo = client.get("/artigos/").json()["items"][0]
+    assert "texto" not in artigo
+
+
+@pytest.mark.asyncio
+async def test_idempotente_e_retomavel(test_db, storage, edicao):
+    for i in range(3):
+        _artigo_com_pdf(test_db, storage, edicao, f"Artigo {i}", _pdf(f"Texto do artigo {i}", comprimido=i % 2 == 0))
+
+    # Interrompida depois de 2 artigos: a próxima execução só pega o restante
+    assert (await pdf_text.extract_pending_texts(batch_size=1, limit=2))["processados"] == 2
+    assert (await pdf_text.extract_pending_texts())["processados"] == 1
+    assert (await pdf_text.extract_pending_texts())["processados"] == 0
+    assert test_db.query(ArticleText).count() == 3
+
+    # PDF trocado: o texto é extraído de novo
+    artigo = test_db.query(Article).filter(Article.titulo == "Artigo 1").one()
+    sha256, _, _ = storage.save(io.BytesIO(_pdf("Versao revisada")))
+    artigo.pdf_path = pdf_storage.pdf_url(sha256)
+    test_db.commit()
+    assert (await pdf_text.extract_pending_texts())["processados"] == 1
+    test_db.expire_all()
+    assert test_db.get(ArticleText, artigo.id).texto == "Versao revisada"
+
+
+@pytest.mark.asyncio
+async def test_pdf_ausente_fica_com_erro_e_nao_repete(test_db, storage, edicao):
+    test_db.add(Article(titulo="Sumiu", edicao_id=edicao.id, pdf_path=pdf_storage.pdf_url("0" * 64)))
+    test_db.add(Article(titulo="Antigo", edicao_id=edicao.id, pdf_path="uploads/antigo.pdf"))
+    test_db.commit()
+
+    assert await pdf_text.extract_pending_texts() == {"processados": 1, "resumos_preenchidos": 0, "erros": 1}
+    assert test_db.query(ArticleText).one().status == "erro"
+    assert (await pdf_text.extract_pending_texts())["processados"] == 0
+
+
+@pytest.mark.asyncio
+async def test_busca_encontra_pelo_texto_do_pdf(client, test_db, storage, edicao, monkeypatch):
+    monkeypatch.setattr(pdf_text, "PDF_TEXT_EXECUTOR", "process")
+    monkeypatch.setattr(pdf_text, "_executor", None)
+    artigo = _artigo_com_pdf(test_db, storage, edicao, "Titulo qualquer", _pdf("Metodo de hipergrafos espectrais"))
+    test_db.add(Article(titulo="Hipergrafos no titulo", edicao_id=edicao.id))
+    test_db.commit()
+
+    assert [a["titulo"] for a in client.get("/artigos/busca", params={"q": "hipergrafos"}).json()] == [
+        "Hipergrafos no titulo"
+    ]
+    try:
+        await pdf_text.extract_pending_texts()
+        # Workers nascem limpos, sem herdar conexões e threads da API
+        assert pdf_text.get_executor()._mp_context.get_start_method() == "spawn"
+    finally:
+        pdf_text.get_executor().shutdown()
+        pdf_text._executor = None
+
+    # Quem casa pelo título vem antes de quem casa só pelo texto do PDF
+    resultado = client.get("/artigos/busca", params={"q": "hipergrafos"}).json()
+    assert [a["titulo"] for a in resultado] == ["Hipergrafos no titulo", "Titulo qualquer"]
+    assert client.get("/artigos/busca", params={"q": "espectrais"}).json()[0]["id"] == artigo.id
+
+
+def test_lote_reservado_com_skip_locked():
+    # Execuções simultâneas no Postgres pulam os artigos já reservados por outra
+    sql = str(pdf_text.select_pending(20).compile(dialect=postgresql.dialect()))
+    assert sql.endswith("FOR UPDATE OF artigos SKIP LOCKED")
+
+
+@pytest.mark.asyncio
+async def test_tarefa_das_rotas_tem_limite(client, test_db, storage, edicao, monkeypatch, admin_headers):
+    chamadas = []
+
+    async def extract_pending_texts(**kwargs):
+        chamadas.append(kwargs)
+
+    monkeypatch.setattr(routes, "extract_pending_texts", extract_pending_texts)
+    sha256, _, _ = storage.save(io.BytesIO(_pdf("Texto")))
+    response = client.post("/artigos/", headers=admin_headers, json={
+        "titulo": "Com PDF", "edicao_id": edicao.id, "pdf_path": pdf_storage.pdf_url(sha256),
+    })
+    assert response.status_code == 200
+    assert chamadas == [{"limit": pdf_text.PDF_TEXT_BACKGROUND_LIMIT}]
@@ -0,0 +1,125 @@
+import logging
+
+import pytest
+from fastapi import Depends
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from backend.app import query_budget, routes
+from backend.app.main import app, get_db
+from backend.app.models import Author, Edition, Event
+
+
+@pytest.fixture
+def rota_n_mais_um(client):
+    """Rota de teste com o padrão N+1: um SELECT por evento"""
+
+    async def eventos_um_a_um(db: AsyncSession = Depends(get_db)):
+        ids = (await db.scalars(select(Event.id))).all()
+        return [(await db.get(Event, id_, populate_existing=True)).nome for id_ in ids]
+
+    app.get("/teste/n-mais-um", dependencies=[Depends(query_budget.query_budget(2))])(eventos_um_a_um)
+    yield "/teste/n-mais-um"
+    app.router.routes.pop()
+
+
+def _eventos(test_db, quantidade):
+    test_db.add_all(Event(nome=f"Evento {i}", slug=f"evento-{i}") for i in range(quantidade))
+    test_db.commit()
+
+
+@pytest.mark.asyncio
+async def test_rota_dentro_do_orcamento(client, test_db, rota_n_mais_um):
+    _eventos(test_db, 1)
+    assert client.get(rota_n_mais_um).json() == ["Evento 0"]
+
+
+@pytest.mark.asyncio
+async def test_estouro_falha_em_test_mode_com_a_consulta_repetida(client, test_db, rota_n_mais_um):
+    _eventos(test_db, 5)
+    with pytest.raises(query_budget.QueryBudgetExceeded) as erro:
+        client.get(rota_n_mais_um)
+    mensagem = str(erro.value)
+    assert "GET /teste/n-mais-um fez 6 consultas (orçamento 2)" in mensagem
+    assert "mais repetida 5x" in mensagem
+    assert "WHERE eventos.id = ?" in mensagem
+
+
+@pytest.mark.asyncio
+async def test_estouro_em_producao_so_avisa(client, test_db, rota_n_mais_um, monkeypatch, caplog):
+    monkeypatch.setattr(query_budget, "QUERY_BUDGET_MODE", "warn")
+    _eventos(test_db, 4)
+    with caplog.at_level(logging.WARNING, logger=query_budget.__name__):
+        assert client.get(rota_n_mais_um).status_code == 200
+
+    (registro,) = [r for r in caplog.records if hasattr(r, "query_budget")]
+    assert registro.query_budget["route"] == "/teste/n-mais-um"
+    assert registro.query_budget["consultas"] == 5
+    assert registro.query_budget["orcamento"] == 2
+    assert registro.query_budget["repeticoes"] == 4
+
+
+@pytest.mark.asyncio
+async def test_rotas_declaram_orcamento(client):
+    """Toda rota de configure_routes declara o próprio orçamento"""
+    for rota in app.routes:
+        if getattr(rota, "endpoint", None) is None or rota.endpoint.__module__ != routes.__name__:
+            continue
+        declarados = [d.call.__name__ for d in rota.dependant.dependencies]
+        assert "declarar_orcamento" in declarados, rota.path
+
+
+@pytest.mark.asyncio
+async def test_lote_de_artigos_escala_com_o_tamanho(client, test_db, admin_headers):
+    # No SQLite o INSERT ... RETURNING roda uma vez por linha: lotes de 3 ou
+    # mais passavam do orçamento fixo
+    edicao = Edition(ano=2024, event=Event(nome="Evento", slug="evento"))
+    autor = Author(nome="Ada", sobrenome="Lovelace")
+    test_db.add_all([edicao, autor])
+    test_db.commit()
+
+    response = client.post("/artigos/lote", headers=admin_headers, json=[
+        {"titulo": f"Artigo {i}", "edicao_id": edicao.id, "author_ids": [autor.id], "palavras_chave": f"Tema {i}, Grafos"}
+        for i in range(25)
+    ])
+    assert response.status_code == 200
+    assert response.json()["criados"] == 25
+
+
+@pytest.fixture
+def rotas_com_commit(client):
+    """Rotas de teste que passam do orçamento antes ou depois do COMMIT"""
+
+    async def estoura_antes(db: AsyncSession = Depends(get_db)):
+        db.add(Event(nome="Antes", slug="antes"))
+        await db.flush()
+        for _ in range(3):
+            await db.scalar(select(Event.id))
+        await db.commit()
+
+    async def estoura_depois(db: AsyncSession = Depends(get_db)):
+        db.add(Event(nome="Depois", slug="depois"))
+        await db.commit()
+        for _ in range(3):
+            await db.scalar(select(Event.id))
+
+    app.post("/teste/antes-do-commit", dependencies=[Depends(query_budget.query_budget(2))])(estoura_antes)
+    app.post("/teste/depois-do-commit", dependencies=[Depends(query_budget.query_budget(2))])(estoura_depois)
+    yield
+    del app.router.routes[-2:]
+
+
+@pytest.mark.asyncio
+async def test_estouro_antes_do_commit_desfaz_a_escrita(client, test_db, rotas_com_commit):
+    with pytest.raises(query_budget.QueryBudgetExceeded):
+        client.post("/teste/antes-do-commit")
+    assert test_db.query(Event).count() == 0
+
+
+@pytest.mark.asyncio
+async def test_estouro_depois_do_commit_so_avisa(client, test_db, rotas_com_commit, caplog):
+    # A escrita já foi confirmada: responder 500 faria o cliente repeti-la
+    with caplog.at_level(logging.WARNING, logger=query_budget.__name__):
+        assert client.post("/teste/depois-do-commit").status_code == 200
+    assert test_db.query(Event).count() == 1
+    assert [r.query_budget["route"] for r in caplog.records if hasattr(r, "query_budget")] == ["/teste/depois-do-commit"]
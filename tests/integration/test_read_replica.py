@@ -0,0 +1,123 @@
+import time
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import sessionmaker
+
+from backend.app import database, dependencies, replica
+from backend.app.auth import create_access_token
+from backend.app.database import Base
+from backend.app.main import app, get_db
+from backend.app.models import Event
+
+
+@pytest.fixture
+def replica_db(client, tmp_path, monkeypatch):
+    """Segundo arquivo SQLite no papel de réplica (sem replicação: os dados são distintos)"""
+    caminho = tmp_path / "replica.db"
+    engine = create_engine(f"sqlite:///{caminho}")
+    Base.metadata.create_all(engine)
+    replica_engine = database.create_replica_engine(f"sqlite+aiosqlite:///{caminho}")
+    monkeypatch.setattr(dependencies, "ReplicaSessionLocal", async_sessionmaker(
+        bind=replica_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False,
+    ))
+    monkeypatch.setattr(database, "replica_async_engine", replica_engine)
+    monkeypatch.setattr(replica, "DB_REPLICA_LAG_CHECK", 0)  # mede a cada requisição
+    replica.replica_health.reset()
+    # Usa o get_db real (com roteamento) em vez do override do conftest
+    app.dependency_overrides.pop(get_db, None)
+
+    db = sessionmaker(bind=engine)()
+    yield db
+    db.close()
+    engine.dispose()
+    replica.replica_health.reset()
+
+
+def _nomes(client):
+    return [e["nome"] for e in client.get("/eventos/").json()["items"]]
+
+
+@pytest.mark.asyncio
+async def test_leituras_vao_para_a_replica(client, test_db, replica_db):
+    test_db.add(Event(nome="No primário", slug="primario"))
+    test_db.commit()
+    replica_db.add(Event(nome="Na réplica", slug="replica"))
+    replica_db.commit()
+
+    assert _nomes(client) == ["Na réplica"]
+
+
+@pytest.mark.asyncio
+async def test_escrita_no_primario_e_leitura_da_propria_escrita(client, test_db, replica_db):
+    response = client.post("/eventos/", json={"nome": "Recém-criado", "sigla": "novo"})
+    assert response.status_code == 200
+    assert replica.STICKY_COOKIE in response.cookies
+
+    # A réplica ainda não tem o evento, mas o cliente que escreveu lê do primário
+    assert _nomes(client) == ["Recém-criado"]
+
+    client.cookies.clear()
+    assert _nomes(client) == []
+
+    client.cookies.set(replica.STICKY_COOKIE, str(time.time() - 1))
+    assert _nomes(client) == []
+
+
+@pytest.mark.asyncio
+async def test_replica_atrasada_ou_fora_do_ar_usa_o_primario(client, test_db, replica_db, monkeypatch):
+    test_db.add(Event(nome="No primário", slug="primario"))
+    test_db.commit()
+
+    async def atrasada(db):
+        return replica.DB_REPLICA_MAX_LAG + 1
+
+    monkeypatch.setattr(replica, "measure_lag", atrasada)
+    assert _nomes(client) == ["No primário"]
+
+    async def fora_do_ar(db):
+        raise ConnectionError("réplica inacessível")
+
+    monkeypatch.setattr(replica, "measure_lag", fora_do_ar)
+    assert _nomes(client) == ["No primário"]
+
+    async def em_dia(db):
+        return 0.0
+
+    monkeypatch.setattr(replica, "measure_lag", em_dia)
+    assert _nomes(client) == []
+
+
+@pytest.mark.asyncio
+async def test_pool_da_replica_em_internal_pool(client, test_db, replica_db):
+    admin = SimpleNamespace(id=1, nome="Admin", email="admin@example.com", perfil="admin")
+    client.get("/eventos/")
+    stats = client.get("/internal/pool", headers={"Authorization": f"Bearer {create_access_token(admin)}"}).json()
+    assert stats["replica"]["checkouts"] >= 1
+    assert stats["replica"]["atraso_s"] == 0.0
+
+
+@pytest.mark.asyncio
+async def test_frontend_com_credenciais_le_a_propria_escrita(client, test_db, replica_db):
+    # Como o navegador em localhost:3000 chama a API (apiFetch, credentials: 'include'),
+    # passando pelo get_db real: sem Allow-Credentials o navegador descartaria o cookie
+    assert get_db not in app.dependency_overrides
+    origem = {"Origin": "http://localhost:3000"}
+
+    preflight = client.options("/eventos/", headers={
+        **origem, "Access-Control-Request-Method": "POST", "Access-Control-Request-Headers": "content-type",
+    })
+    assert preflight.headers["access-control-allow-credentials"] == "true"
+
+    response = client.post("/eventos/", json={"nome": "Recém-criado", "sigla": "novo"}, headers=origem)
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert replica.STICKY_COOKIE in response.cookies
+
+    response = client.get("/eventos/", headers=origem)
+    assert response.headers["access-control-allow-credentials"] == "true"
+    assert [e["nome"] for e in response.json()["items"]] == ["Recém-criado"]
+    # Leituras não renovam o cookie
+    assert replica.STICKY_COOKIE not in response.cookies
@@ -0,0 +1,55 @@
+import pytest
+from backend.app.models import Event, Edition, Author, Article
+
+
+def _criar_artigos(test_db):
+    event = Event(nome="Conferência de IA", slug="conf-ia")
+    test_db.add(event)
+    test_db.commit()
+    edition = Edition(ano=2024, evento_id=event.id)
+    test_db.add(edition)
+    test_db.commit()
+    artigos = [
+        Article(titulo="Inteligência Artificial na Saúde", resumo="Redes neurais para diagnóstico",
+                palavras_chave="IA, medicina", edicao_id=edition.id),
+        Article(titulo="Computação Quântica", resumo="Algoritmos com aplicações em inteligência artificial",
+                palavras_chave="quântica", edicao_id=edition.id),
+        Article(titulo="Engenharia de Software", resumo="Testes automatizados",
+                palavras_chave="testes, qualidade", edicao_id=edition.id),
+    ]
+    artigos[0].authors.append(Author(nome="Alan", sobrenome="Turing"))
+    test_db.add_all(artigos)
+    test_db.commit()
+    return artigos
+
+
+@pytest.mark.asyncio
+async def test_busca_ranqueia_titulo_acima_do_resumo(client, test_db):
+    _criar_artigos(test_db)
+    response = client.get("/artigos/busca", params={"q": "inteligencia artificial"})
+    assert response.status_code == 200
+    data = response.json()
+    assert [a["titulo"] for a in data] == ["Inteligência Artificial na Saúde", "Computação Quântica"]
+    assert data[0]["authors"][0]["nome"] == "Alan"
+
+
+@pytest.mark.asyncio
+async def test_busca_por_palavra_chave_e_atualizacao(client, test_db):
+    artigos = _criar_artigos(test_db)
+    response = client.get("/artigos/busca", params={"q": "qualidade"})
+    assert [a["titulo"] for a in response.json()] == ["Engenharia de Software"]
+
+    # O índice acompanha atualizações e remoções
+    artigos[2].palavras_chave = "devops"
+    test_db.commit()
+    assert client.get("/artigos/busca", params={"q": "qualidade"}).json() == []
+    assert len(client.get("/artigos/busca", params={"q": "devops"}).json()) == 1
+
+
+@pytest.mark.asyncio
+async def test_busca_sem_termos_validos(client, test_db):
+    _criar_artigos(test_db)
+    response = client.get("/artigos/busca", params={"q": "\"*("})
+    assert response.status_code == 200
+    assert response.json() == []
+    assert client.get("/artigos/busca", params={"q": ""}).status_code == 422
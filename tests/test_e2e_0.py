@@ -14,8 +14,10 @@ os.environ["TEST_MODE"] = "1"
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 from fastapi.testclient import TestClient
-from backend.app.database import Base, engine, SessionLocal
+from backend.app.database import Base, engine, SessionLocal, AsyncSessionLocal
+from backend.app.cache import reset_caches
 from backend.app.main import app
+from backend.app.models import User
 import hashlib
 
 def hash_password(password: str) -> str:
@@ -27,6 +29,7 @@ def test_db():
     db = SessionLocal()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    reset_caches()  # o banco é recriado; entradas de testes anteriores ficariam inválidas
     try:
         yield db
     finally:
@@ -36,14 +39,12 @@ def test_db():
 
 @pytest.fixture(scope="function")
 def client(test_db):
-    """Override get_db para usar test_db"""
+    """Override get_db para usar uma sessão assíncrona no mesmo banco de test_db"""
     from backend.app.routes import get_db
     
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
+    async def override_get_db():
+        async with AsyncSessionLocal() as db:
+            yield db
     
     app.dependency_overrides[get_db] = override_get_db
     test_client = TestClient(app)
@@ -67,6 +68,7 @@ async def test_e2e_usuario_completo(client, test_db):
         }
     )
     assert register_response.status_code == 200
+    # O cadastro público ignora o perfil pedido
     print("✓ Usuário registrado")
     
     # 2. Login
@@ -75,7 +77,7 @@ async def test_e2e_usuario_completo(client, test_db):
         json={"email": "joao@example.com", "password": "senha123"}
     )
     assert login_response.status_code == 200
-    assert login_response.json()["perfil"] == "admin"
+    assert login_response.json()["perfil"] == "usuario"
     print("✓ Login realizado")
     
     # 3. Criar evento
@@ -89,24 +91,22 @@ async def test_e2e_usuario_completo(client, test_db):
     # 4. Listar eventos
     list_response = client.get("/eventos/")
     assert list_response.status_code == 200
-    assert len(list_response.json()) >= 1
+    assert len(list_response.json()["items"]) >= 1
     print("✓ Eventos listados")
 
 @pytest.mark.asyncio
 async def test_e2e_admin_painel_completo(client, test_db):
     """E2E: Admin cria evento, edição, autores e artigos"""
-    # 1. Registro do admin
-    client.post(
-        "/usuarios/",
-        json={
-            "nome": "Admin Silva",
-            "email": "admin@example.com",
-            "senha_hash": "admin123",
-            "perfil": "admin",
-            "receive_notifications": True
-        }
+    # 1. Admin já existente (o cadastro público só cria usuários comuns) faz login
+    test_db.add(User(nome="Admin Silva", email="admin@example.com", senha_hash=hash_password("admin123"), perfil="admin"))
+    test_db.commit()
+    login_response = client.post(
+        "/login/",
+        json={"email": "admin@example.com", "password": "admin123"}
     )
-    print("✓ Admin registrado")
+    assert login_response.json()["perfil"] == "admin"
+    admin_headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+    print("✓ Admin autenticado")
     
     # 2. Criar evento
     event_response = client.post(
@@ -146,6 +146,7 @@ async def test_e2e_admin_painel_completo(client, test_db):
     # 5. Criar artigo
     article_response = client.post(
         "/artigos/",
+        headers=admin_headers,
         json={
             "titulo": "Machine Learning na Prática",
             "area": "Inteligência Artificial",
@@ -13,7 +13,8 @@ os.environ["TEST_MODE"] = "1"
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 from fastapi.testclient import TestClient
-from backend.app.database import Base, engine, SessionLocal
+from backend.app.database import Base, engine, SessionLocal, AsyncSessionLocal
+from backend.app.cache import reset_caches
 from backend.app.main import app
 from backend.app.models import User, Event, Edition, Author, Article
 import hashlib
@@ -27,6 +28,7 @@ def test_db():
     db = SessionLocal()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    reset_caches()  # o banco é recriado; entradas de testes anteriores ficariam inválidas
     try:
         yield db
     finally:
@@ -36,14 +38,12 @@ def test_db():
 
 @pytest.fixture(scope="function")
 def client(test_db):
-    """Override get_db para usar test_db"""
+    """Override get_db para usar uma sessão assíncrona no mesmo banco de test_db"""
     from backend.app.routes import get_db
     
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
+    async def override_get_db():
+        async with AsyncSessionLocal() as db:
+            yield db
     
     app.dependency_overrides[get_db] = override_get_db
     test_client = TestClient(app)
@@ -148,9 +148,15 @@ async def test_e2e_pesquisa_biblioteca_digital(client, test_db):
         }
     ]
     
+    # Publicar artigos é restrito a administradores
+    test_db.add(User(nome="Admin", email="admin@example.com", senha_hash=hash_password("admin123"), perfil="admin"))
+    test_db.commit()
+    token = client.post("/login/", json={"email": "admin@example.com", "password": "admin123"}).json()["access_token"]
+    admin_headers = {"Authorization": f"Bearer {token}"}
+
     artigos_ids = []
     for artigo in artigos_data:
-        response = client.post("/artigos/", json=artigo)
+        response = client.post("/artigos/", json=artigo, headers=admin_headers)
         assert response.status_code == 200
         artigos_ids.append(response.json()["id"])
     
@@ -162,28 +168,28 @@ async def test_e2e_pesquisa_biblioteca_digital(client, test_db):
     # 5.1. Listar todos os artigos
     response = client.get("/artigos/")
     assert response.status_code == 200
-    artigos = response.json()
+    artigos = response.json()["items"]
     assert len(artigos) >= 4
     print(f"✓ Total de artigos encontrados: {len(artigos)}")
     
     # 5.2. Listar todos os autores
     response = client.get("/autores/")
     assert response.status_code == 200
-    autores = response.json()
+    autores = response.json()["items"]
     assert len(autores) >= 6
     print(f"✓ Total de autores encontrados: {len(autores)}")
     
     # 5.3. Listar todos os eventos
     response = client.get("/eventos/")
     assert response.status_code == 200
-    eventos = response.json()
+    eventos = response.json()["items"]
     assert len(eventos) >= 3
     print(f"✓ Total de eventos encontrados: {len(eventos)}")
     
     # 5.4. Listar todas as edições
     response = client.get("/edicoes/")
     assert response.status_code == 200
-    edicoes = response.json()
+    edicoes = response.json()["items"]
     assert len(edicoes) >= 3
     print(f"✓ Total de edições encontradas: {len(edicoes)}")
     
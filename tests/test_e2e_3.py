@@ -13,7 +13,8 @@ os.environ["TEST_MODE"] = "1"
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'backend'))
 
 from fastapi.testclient import TestClient
-from backend.app.database import Base, engine, SessionLocal
+from backend.app.database import Base, engine, SessionLocal, AsyncSessionLocal
+from backend.app.cache import reset_caches
 from backend.app.main import app
 from backend.app.models import User, Event, Edition, Author, Article
 import hashlib
@@ -27,6 +28,7 @@ def test_db():
     db = SessionLocal()
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
+    reset_caches()  # o banco é recriado; entradas de testes anteriores ficariam inválidas
     try:
         yield db
     finally:
@@ -36,14 +38,12 @@ def test_db():
 
 @pytest.fixture(scope="function")
 def client(test_db):
-    """Override get_db para usar test_db"""
+    """Override get_db para usar uma sessão assíncrona no mesmo banco de test_db"""
     from backend.app.routes import get_db
     
-    def override_get_db():
-        try:
-            yield test_db
-        finally:
-            pass
+    async def override_get_db():
+        async with AsyncSessionLocal() as db:
+            yield db
     
     app.dependency_overrides[get_db] = override_get_db
     test_client = TestClient(app)
@@ -0,0 +1,27 @@
+from backend.app.metrics import Counter, Histogram, Registry
+
+
+def test_histograma_no_formato_de_exposicao():
+    registry = Registry()
+    latencia = registry.register(Histogram("latencia_seconds", "Latência", ["route"], buckets=(0.1, 1.0)))
+    latencia.observe(0.05, route="/eventos/{event_id}")
+    latencia.observe(0.1, route="/eventos/{event_id}")  # limite do bucket conta como <=
+    latencia.observe(3.0, route="/eventos/{event_id}")
+
+    linhas = registry.render().splitlines()
+    assert linhas[:2] == ["# HELP latencia_seconds Latência", "# TYPE latencia_seconds histogram"]
+    assert linhas[2:] == [
+        'latencia_seconds_bucket{route="/eventos/{event_id}",le="0.1"} 2',
+        'latencia_seconds_bucket{route="/eventos/{event_id}",le="1.0"} 2',
+        'latencia_seconds_bucket{route="/eventos/{event_id}",le="+Inf"} 3',
+        'latencia_seconds_sum{route="/eventos/{event_id}"} 3.15',
+        'latencia_seconds_count{route="/eventos/{event_id}"} 3',
+    ]
+
+
+def test_contador_escapa_labels():
+    registry = Registry()
+    contador = registry.register(Counter("erros_total", "Erros", ["detalhe"]))
+    contador.inc(detalhe='aspas " e \\ barra')
+    contador.inc(2, detalhe='aspas " e \\ barra')
+    assert registry.render().splitlines()[-1] == 'erros_total{detalhe="aspas \\" e \\\\ barra"} 3'
@@ -1,7 +1,7 @@
 import os
 import importlib
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from datetime import date
@@ -12,7 +12,7 @@ os.environ.setdefault("TEST_MODE", "1")
 
 from backend.app import utils, dependencies
 from backend.app import database as db_module
-from backend.app import routes, schemas
+from backend.app import routes, schemas, passwords
 from backend.app.models import (
     Event,
     Edition,
@@ -139,15 +139,21 @@ def test_dependencies_get_db_yields_session(monkeypatch):
     class DummySession:
         def __init__(self):
             calls.append("init")
-        def close(self):
+        async def __aenter__(self):
+            return self
+        async def __aexit__(self, *exc):
             calls.append("close")
 
-    monkeypatch.setattr(dependencies, "SessionLocal", DummySession)
-    gen = dependencies.get_db()
-    session = next(gen)
-    assert isinstance(session, DummySession)
-    with pytest.raises(StopIteration):
-        next(gen)
+    monkeypatch.setattr(dependencies, "AsyncSessionLocal", DummySession)
+
+    async def consome():
+        gen = dependencies.get_db()
+        session = await gen.__anext__()
+        assert isinstance(session, DummySession)
+        with pytest.raises(StopAsyncIteration):
+            await gen.__anext__()
+
+    asyncio.run(consome())
     assert calls == ["init", "close"]
 
 def test_utils_hash_and_slug_unit():
@@ -174,41 +180,56 @@ def test_schemas_instanciacao():
 
 
 def test_routes_create_user_e_login_mockado():
-    db = MagicMock()
-    db.query.return_value.filter.return_value.first.return_value = None
-    db.refresh = lambda obj: None
+    db = AsyncMock()  # AsyncSession: execute/commit/refresh são awaitables
+    db.add = MagicMock()
+    db.scalar.return_value = None
 
     payload = schemas.UserCreate(nome="Ana", email="ana@example.com", senha_hash="senha", perfil="usuario", receive_notifications=True)
-    user = asyncio.run(routes.create_user(payload, db))
+    user = asyncio.run(routes.create_user(payload, db, None))
     assert user.email == "ana@example.com"
 
-    hashed = routes.hash_password("senha")
+    hashed = passwords.hash_password("senha")
     fake_user = MagicMock()
     fake_user.senha_hash = hashed
     fake_user.id = 1
     fake_user.nome = "Ana"
     fake_user.email = "ana@example.com"
     fake_user.perfil = "usuario"
-    db.query.return_value.filter.return_value.first.return_value = fake_user
+    db.scalar.return_value = fake_user
     login_resp = asyncio.run(routes.login(schemas.LoginRequest(email="ana@example.com", password="senha"), db))
     assert login_resp["email"] == "ana@example.com"
 
 
 def test_routes_erros():
-    db = MagicMock()
+    db = AsyncMock()  # AsyncSession: execute/commit/refresh são awaitables
+    db.add = MagicMock()
     # email duplicado
-    db.query.return_value.filter.return_value.first.return_value = object()
+    db.scalar.return_value = object()
     with pytest.raises(HTTPException) as exc:
-        asyncio.run(routes.create_user(schemas.UserCreate(nome="Ana", email="ana@example.com", senha_hash="s"), db))
+        asyncio.run(routes.create_user(schemas.UserCreate(nome="Ana", email="ana@example.com", senha_hash="s"), db, None))
     assert exc.value.status_code == 400
 
     # login inválido
-    db.query.return_value.filter.return_value.first.return_value = None
+    db.scalar.return_value = None
     with pytest.raises(HTTPException) as exc:
         asyncio.run(routes.login(schemas.LoginRequest(email="none@example.com", password="x"), db))
     assert exc.value.status_code == 401
 
     with pytest.raises(HTTPException):
-        asyncio.run(routes.get_event_by_id_or_slug("999", db))
+        asyncio.run(routes.get_event_by_id_or_slug("999", db, 0))
     with pytest.raises(HTTPException):
-        asyncio.run(routes.get_author_by_id_or_slug("slug", db))
+        asyncio.run(routes.get_author_by_id_or_slug("slug", db, 0))
+
+
+def test_banco_de_teste_padrao_e_por_processo():
+    import subprocess
+    import sys
+
+    codigo = "from backend.app import database; print(database.TEST_DB_PATH)"
+    env = {k: v for k, v in os.environ.items() if k != "TEST_DB_PATH"}
+    env["TEST_MODE"] = "1"
+    caminhos = {
+        subprocess.run([sys.executable, "-c", codigo], env=env, capture_output=True, text=True, check=True).stdout.strip()
+        for _ in range(2)
+    }
+    assert len(caminhos) == 2
@@ -0,0 +1,44 @@
+import asyncio
+import hashlib
+
+from backend.app import passwords
+
+
+def test_hash_usa_salt_e_confere():
+    primeiro = passwords.hash_password("senha", n=2 ** 10)
+    segundo = passwords.hash_password("senha", n=2 ** 10)
+    assert primeiro.startswith("scrypt$1024$")
+    assert primeiro != segundo  # salt aleatório
+    assert passwords.verify_password("senha", primeiro)
+    assert not passwords.verify_password("outra", primeiro)
+
+
+def test_hash_legado_sha256():
+    legado = hashlib.sha256(b"senha").hexdigest()
+    assert passwords.is_legacy_hash(legado)
+    assert passwords.verify_password("senha", legado)
+    assert not passwords.verify_password("outra", legado)
+    assert passwords.needs_rehash(legado)
+
+
+def test_needs_rehash_quando_o_custo_muda():
+    atual = passwords.hash_password("senha")
+    assert not passwords.needs_rehash(atual)
+    assert passwords.needs_rehash(passwords.hash_password("senha", n=2 ** 10))
+
+
+def test_hash_invalido_nao_confere():
+    assert not passwords.verify_password("senha", "")
+    assert not passwords.verify_password("senha", "bcrypt$abc")
+    assert not passwords.verify_password("senha", "scrypt$x$8$1$c2FsdA==$aGFzaA==")
+    # Hash esperado com base64 corrompido
+    assert not passwords.verify_password("senha", "scrypt$1024$8$1$c2FsdA==$aGF*zaA")
+
+
+def test_versao_assincrona_roda_no_pool():
+    async def main():
+        stored = await passwords.hash_password_async("senha")
+        return await passwords.verify_password_async("senha", stored)
+
+    assert asyncio.run(main())
+    assert passwords.get_executor() is not None
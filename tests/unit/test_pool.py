@@ -0,0 +1,48 @@
+import pytest
+from sqlalchemy import create_engine, exc, text
+
+from backend.app.pool import InstrumentedQueuePool, pool_stats
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1, max_overflow=1, pool_timeout=0.05, pool_pre_ping=True,
+    )
+    yield engine
+    engine.dispose()
+
+
+def test_contadores_de_uso_e_overflow(engine):
+    primeira = engine.connect()
+    segunda = engine.connect()  # além de pool_size: overflow
+    stats = pool_stats(engine)
+    assert (stats["em_uso"], stats["overflow"], stats["max_conexoes"]) == (2, 1, 2)
+    assert stats["pre_ping"] is True
+
+    segunda.close()
+    primeira.close()
+    stats = pool_stats(engine)
+    assert (stats["em_uso"], stats["ociosas"], stats["overflow"]) == (0, 1, 0)
+    assert stats["checkouts"] == 2
+    assert stats["pico_em_uso"] == 2
+
+
+def test_timeout_e_tempo_de_espera(engine):
+    conexoes = [engine.connect(), engine.connect()]
+    with pytest.raises(exc.TimeoutError):
+        engine.connect()
+    stats = pool_stats(engine)
+    assert stats["timeouts"] == 1
+    assert stats["espera_max_ms"] >= 50
+    for conexao in conexoes:
+        conexao.close()
+
+
+def test_contadores_sobrevivem_ao_dispose(engine):
+    with engine.connect() as conexao:
+        conexao.execute(text("SELECT 1"))
+    engine.dispose()  # recria o pool
+    assert pool_stats(engine)["checkouts"] == 1
@@ -0,0 +1,29 @@
+from collections import Counter
+
+from backend.app.query_budget import repeated_statement, statement_shape
+
+
+def test_statement_shape_ignora_valores():
+    assert statement_shape("SELECT * FROM autores\n   WHERE id = 42 AND nome = 'Ana ''B'''") == (
+        "SELECT * FROM autores WHERE id = ? AND nome = ?"
+    )
+    assert statement_shape("SELECT anon_1.id FROM t WHERE x = $1 AND y = %(y)s") == (
+        "SELECT anon_1.id FROM t WHERE x = ? AND y = ?"
+    )
+
+
+def test_statement_shape_colapsa_listas_in():
+    assert statement_shape("SELECT 1 FROM t WHERE id IN (?, ?, ?)") == statement_shape(
+        "SELECT 1 FROM t WHERE id IN (7, 8)"
+    )
+
+
+def test_repeated_statement_soma_formas_iguais():
+    statements = Counter({
+        "SELECT * FROM artigos WHERE id = 1": 1,
+        "SELECT * FROM artigos WHERE id = 2": 1,
+        "SELECT * FROM artigos WHERE id = ?": 3,
+        "SELECT count(*) FROM artigos": 1,
+    })
+    assert repeated_statement(statements) == ("SELECT * FROM artigos WHERE id = ?", 5)
+    assert repeated_statement(Counter()) == (None, 0)
@@ -1,7 +1,7 @@
 import os
 import importlib
 import asyncio
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException
@@ -11,7 +11,7 @@ os.environ.setdefault("TEST_MODE", "1")
 
 from backend.app import utils
 from backend.app import database as db_module
-from backend.app import routes, schemas, models
+from backend.app import routes, schemas, models, passwords
 from backend.app.main import read_root
 
 
@@ -31,8 +31,14 @@ def test_generate_slug_normaliza_e_limita():
 
 @pytest.mark.asyncio
 async def test_send_notification_email_retorna_false_em_erro(monkeypatch):
-    # Garante que falhas (como NameError de dependências não importadas) retornam False
+    # Falhas do transporte (conexão recusada, login inválido...) retornam False
     monkeypatch.setenv("EMAIL_FROM", "tester@example.com")
+
+    class FailingTransport:
+        async def send(self, msg):
+            raise ConnectionRefusedError("recusado")
+
+    monkeypatch.setattr(utils, "get_transport", lambda: FailingTransport())
     result = await utils.send_notification_email(
         "dest@example.com",
         author_name="Autor",
@@ -44,50 +50,39 @@ async def test_send_notification_email_retorna_false_em_erro(monkeypatch):
 
 @pytest.mark.asyncio
 async def test_send_notification_email_sucesso(monkeypatch):
-    # Prepara dependências fake para cobrir caminho de sucesso sem rede
+    # Transporte fake: cobre o caminho de sucesso sem rede
     monkeypatch.setenv("EMAIL_FROM", "from@example.com")
-    monkeypatch.setenv("EMAIL_PASSWORD", "pwd")
-    monkeypatch.setenv("SMTP_SERVER", "smtp.test")
-    monkeypatch.setenv("SMTP_PORT", "587")
-
-    class DummySMTP:
-        def __init__(self, host, port):
-            self.host = host
-            self.port = port
-            self.sent = False
-        def starttls(self): pass
-        def login(self, user, pwd):
-            assert user == "from@example.com"
-            assert pwd == "pwd"
-        def sendmail(self, from_addr, to_addr, text):
-            self.sent = True
-            assert from_addr == "from@example.com"
-            assert to_addr == "dest@example.com"
-            assert "Artigo" in text
-        def quit(self): pass
-
-    class DummyMsg:
-        def __init__(self):
-            self.headers = {}
-        def __setitem__(self, key, value):
-            self.headers[key] = value
-        def attach(self, body):
-            # aceita qualquer conteúdo
-            self.body = body
-        def as_string(self):
-            return f"{self.headers}::{getattr(self, 'body', '')}"
-
-    # injeta módulo smtplib e função MIMEText ausentes
-    fake_smtp_module = type("fake", (), {"SMTP": DummySMTP})
-    # utils não importa smtplib/MIMEText, então inserimos atributos novos
-    monkeypatch.setattr(utils, "smtplib", fake_smtp_module, raising=False)
-    monkeypatch.setattr(utils, "MIMEText", lambda body, fmt: body, raising=False)
-    monkeypatch.setattr(utils, "MIMEMultipart", DummyMsg, raising=False)
+    enviados = []
+
+    class DummyTransport:
+        async def send(self, msg):
+            enviados.append(msg)
+
+    monkeypatch.setattr(utils, "get_transport", lambda: DummyTransport())
 
     result = await utils.send_notification_email(
         "dest@example.com", "Autor", "Artigo", "Evento"
     )
     assert result is True
+    assert len(enviados) == 1
+    assert enviados[0]["From"] == "from@example.com"
+    assert enviados[0]["To"] == "dest@example.com"
+    assert "Artigo" in enviados[0]["Subject"]
+    assert "Evento" in enviados[0].get_content()
+
+
+@pytest.mark.asyncio
+async def test_send_notification_email_simulado_nao_conta_como_enviado(monkeypatch):
+    from backend.app.mail import SimulatedTransport
+    from backend.app.metrics import EMAILS
+
+    monkeypatch.setattr(utils, "get_transport", lambda: SimulatedTransport())
+    enviados = EMAILS.value(status="sent")
+    simulados = EMAILS.value(status="simulated")
+
+    assert await utils.send_notification_email("dest@example.com", "Autor", "Artigo", "Evento")
+    assert EMAILS.value(status="sent") == enviados
+    assert EMAILS.value(status="simulated") == simulados + 1
 
 
 # --------------------------------------------------------------------
@@ -127,49 +122,52 @@ def test_schemas_instanciacao():
 
 
 def test_routes_create_user_e_login_mockado():
-    db = MagicMock()
-    db.query.return_value.filter.return_value.first.return_value = None
-    db.refresh = lambda obj: None
+    db = AsyncMock()  # AsyncSession: execute/commit/refresh são awaitables
+    db.add = MagicMock()
+    db.scalar.return_value = None
 
     payload = schemas.UserCreate(nome="Ana", email="ana@example.com", senha_hash="senha", perfil="usuario", receive_notifications=True)
-    user = asyncio.run(routes.create_user(payload, db))
+    user = asyncio.run(routes.create_user(payload, db, None))
     assert user.email == "ana@example.com"
 
     # login bem-sucedido com senha hash compatível
-    hashed = routes.hash_password("senha")
+    hashed = passwords.hash_password("senha")
     fake_user = MagicMock()
     fake_user.senha_hash = hashed
     fake_user.id = 1
     fake_user.nome = "Ana"
     fake_user.email = "ana@example.com"
     fake_user.perfil = "usuario"
-    db.query.return_value.filter.return_value.first.return_value = fake_user
+    db.scalar.return_value = fake_user
     login_resp = asyncio.run(routes.login(schemas.LoginRequest(email="ana@example.com", password="senha"), db))
     assert login_resp["email"] == "ana@example.com"
 
 
 def test_routes_create_user_email_duplicado():
-    db = MagicMock()
-    db.query.return_value.filter.return_value.first.return_value = object()
+    db = AsyncMock()  # AsyncSession: execute/commit/refresh são awaitables
+    db.add = MagicMock()
+    db.scalar.return_value = object()
     with pytest.raises(HTTPException) as exc:
-        asyncio.run(routes.create_user(schemas.UserCreate(nome="Ana", email="ana@example.com", senha_hash="s"), db))
+        asyncio.run(routes.create_user(schemas.UserCreate(nome="Ana", email="ana@example.com", senha_hash="s"), db, None))
     assert exc.value.status_code == 400
 
 
 def test_routes_login_invalido():
-    db = MagicMock()
-    db.query.return_value.filter.return_value.first.return_value = None
+    db = AsyncMock()  # AsyncSession: execute/commit/refresh são awaitables
+    db.add = MagicMock()
+    db.scalar.return_value = None
     with pytest.raises(HTTPException) as exc:
         asyncio.run(routes.login(schemas.LoginRequest(email="none@example.com", password="x"), db))
     assert exc.value.status_code == 401
 
 
 def test_routes_get_por_id_ou_slug_retorna_404():
-    db = MagicMock()
-    db.query.return_value.filter.return_value.first.return_value = None
+    db = AsyncMock()  # AsyncSession: execute/commit/refresh são awaitables
+    db.add = MagicMock()
+    db.scalar.return_value = None
     with pytest.raises(HTTPException):
-        asyncio.run(routes.get_event_by_id_or_slug("999", db))
+        asyncio.run(routes.get_event_by_id_or_slug("999", db, 0))
     with pytest.raises(HTTPException):
-        asyncio.run(routes.get_author_by_id_or_slug("slug", db))
+        asyncio.run(routes.get_author_by_id_or_slug("slug", db, 0))
 
 